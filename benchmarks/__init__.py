@@ -0,0 +1,10 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Offline benchmarks for TuxPort's hot paths.
+
+A local HTTP server stands in for download sites, a shell stub for Wine,
+and generated trees for home directories. ``python -m benchmarks`` writes
+the timings as JSON so runs on different commits can be compared.
+"""
@@ -0,0 +1,129 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Run the benchmarks: ``python -m benchmarks [-o results.json] [--compare old.json]``."""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REGRESSION = 1.10  # Flag medians more than 10% slower than the baseline
+
+
+class Run:
+    def __init__(self, workdir, repeat, quick, tree_sizes):
+        self.workdir = workdir
+        self.repeat = repeat
+        self.quick = quick
+        self.tree_sizes = tree_sizes
+        self.repo = REPO
+        self._trees = {}
+
+    def scratch(self, name):
+        path = os.path.join(self.workdir, name)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def tree(self, kind, files, build):
+        # Trees are shared between cases and built once per run
+        key = (kind, files)
+        if key not in self._trees:
+            print(f"  building {kind} tree of {files} files...", file=sys.stderr)
+            self._trees[key] = build(os.path.join(self.scratch("trees"), f"{kind}-{files}"), files)
+        return self._trees[key]
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO, stdout=subprocess.PIPE,
+                             stderr=subprocess.DEVNULL, text=True, check=True)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout.strip()
+        return out.stdout.strip() + ("-dirty" if dirty else "")
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def isolate(workdir):
+    # Offline and hermetic: no proxies, and every TuxPort cache lives in the scratch dir
+    for name in list(os.environ):
+        if name.lower().endswith("_proxy"):
+            del os.environ[name]
+    os.environ["XDG_CACHE_HOME"] = os.path.join(workdir, "xdg-cache")
+
+
+def compare(results, baseline):
+    print(f"\n{'metric':48} {'baseline':>10} {'now':>10} {'ratio':>7}")
+    for name, result in sorted(results["results"].items()):
+        old = baseline.get("results", {}).get(name)
+        if not old or not old.get("median"):
+            continue
+        ratio = result["median"] / old["median"]
+        flag = "  slower" if ratio > REGRESSION else ""
+        print(f"{name:48} {old['median'] * 1000:9.2f}ms {result['median'] * 1000:9.2f}ms {ratio:6.2f}x{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Offline benchmarks for TuxPort.")
+    parser.add_argument("cases", nargs="*", help="cases to run (default: all)")
+    parser.add_argument("-o", "--output", help="write results as JSON here (default: stdout)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="timed runs per metric (default: 5)")
+    parser.add_argument("--quick", action="store_true", help="smaller downloads and trees (no 200k-file tree)")
+    parser.add_argument("--compare", metavar="JSON", help="print each median against an earlier results file")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch directory")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="tuxport-bench-")
+    isolate(workdir)
+    sys.path.insert(0, REPO)
+    from benchmarks import cases
+    from tuxport import __version__
+
+    unknown = [name for name in args.cases if name not in cases.CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}; choose from {', '.join(cases.CASES)}")
+    run = Run(workdir, max(1, args.repeat), args.quick, cases.TREE_SIZES_QUICK if args.quick else cases.TREE_SIZES)
+    results = {
+        "tuxport": __version__,
+        "commit": git_commit(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeat": run.repeat,
+        "quick": run.quick,
+        "results": {},
+    }
+    try:
+        for name in args.cases or cases.CASES:
+            print(f"{name}...", file=sys.stderr)
+            for metric, result in cases.CASES[name](run).items():
+                results["results"][f"{name}.{metric}"] = result
+    finally:
+        if args.keep:
+            print(f"scratch kept in {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            compare(results, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""The benchmark cases.
+
+Each case takes the Run and returns ``{metric: result}``, where a result
+is what ``measure()`` returns plus any derived rates. TuxPort modules are
+imported inside the cases, after the runner has pointed the cache at the
+scratch directory.
+"""
+
+import os
+import queue
+import shutil
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks import fixtures
+
+CASES = {}
+
+DOWNLOAD_SIZE = 64 * 1024 * 1024
+DOWNLOAD_SIZE_QUICK = 16 * 1024 * 1024
+PAGE_LINKS = 2000
+TREE_SIZES = (1000, 10000, 200000)
+TREE_SIZES_QUICK = (1000, 10000)
+SEARCH_TERM = "setup"
+
+
+def case(func):
+    CASES[func.__name__] = func
+    return func
+
+
+def measure(func, repeat, setup=None):
+    """Time ``func()`` ``repeat`` times (after ``setup()`` each time, untimed)."""
+    runs = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - t0)
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+        "runs": len(runs),
+    }
+
+
+def per_second(result, amount, unit):
+    result[f"{unit}_per_s"] = amount / result["median"] if result["median"] else None
+    return result
+
+
+def _remove(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+# --- start-up ---
+
+@case
+def startup(run):
+    """Wall time of fresh interpreters importing the CLI and the window module."""
+    env = dict(os.environ, HOME=run.scratch("home"))
+    commands = {
+        "import_cli": [sys.executable, "-c", "import tuxport.cli"],
+        "cli_version": [sys.executable, "-m", "tuxport", "--version"],
+        "import_app": [sys.executable, "-c", "import tuxport.app"],
+        "python_baseline": [sys.executable, "-c", "pass"],
+    }
+    results = {}
+    for name, argv in commands.items():
+        results[name] = measure(lambda: subprocess.run(argv, env=env, cwd=run.repo, check=True,
+                                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL),
+                                run.repeat)
+    return results
+
+
+# --- downloads ---
+
+@case
+def download(run):
+    """ranged.download over Range/ETag and plain servers, and an ETag-revalidated cache hit."""
+    from tuxport import downloads, integrity, ranged
+    from tuxport.cache import InstallerCache
+
+    size = DOWNLOAD_SIZE_QUICK if run.quick else DOWNLOAD_SIZE
+    dest_dir = run.scratch("downloads")
+    dest = os.path.join(dest_dir, "setup.exe")
+    results = {}
+    with fixtures.HTTPFixture(size) as server:
+        variants = {
+            "segmented_4": ("/full/setup.exe", 4),
+            "ranged_1": ("/full/setup.exe", 1),
+            "plain_stream": ("/plain/setup.exe", 4),
+        }
+        for name, (path, connections) in variants.items():
+            url = server.url(path)
+
+            def fetch_once():
+                job = downloads.DownloadJob(url, dest_dir, connections=connections)
+                ranged.download(url, dest, job, connections=connections, digests=integrity.Digests())
+
+            results[name] = per_second(measure(fetch_once, run.repeat, lambda: _remove(dest)), size / 1e6, "mb")
+
+        cache = InstallerCache(root=run.scratch("installer-cache"))
+        url = server.url("/full/setup.exe")
+        downloads.fetch(downloads.DownloadJob(url, dest_dir, cache=cache, sidecar=False))
+        results["cache_hit"] = measure(
+            lambda: downloads.fetch(downloads.DownloadJob(url, dest_dir, cache=cache, sidecar=False)), run.repeat)
+    return results
+
+
+# --- link discovery ---
+
+@case
+def links(run):
+    """Streaming link discovery on a large page, and full resolution including HEAD probes."""
+    from tuxport import downloads
+    from tuxport import links as tuxlinks
+
+    pages = {
+        "/early.html": fixtures.download_page(PAGE_LINKS, 20),
+        "/late.html": fixtures.download_page(PAGE_LINKS, PAGE_LINKS - 20),
+        "/none.html": fixtures.download_page(PAGE_LINKS, -1),
+    }
+    results = {}
+    with fixtures.HTTPFixture(64 * 1024, pages) as server:
+        for path in pages:
+            name = "discover_" + path.strip("/").split(".")[0]
+            url = server.url(path)
+            results[name] = measure(lambda: tuxlinks.discover(url), run.repeat)
+            results[name]["page_bytes"] = len(pages[path])
+        url = server.url("/early.html")
+        results["resolve_installer"] = measure(lambda: downloads.resolve_installer(url), run.repeat)
+    return results
+
+
+# --- launching ---
+
+@case
+def launch(run):
+    """Spawn and supervision overhead, with a stub ``wine`` that exits at once."""
+    from tuxport.supervisor import ProcessSupervisor
+    from tuxport.wine import WineRuntime
+
+    wine = fixtures.fake_wine(run.scratch("wine-bin"))
+    prefix = run.scratch("prefix")
+    exe = os.path.join(prefix, "app.exe")
+    with open(exe, 'wb') as f:
+        f.write(fixtures.pe_header())
+    runtime = WineRuntime(wine, prefix, cache_path=os.path.join(run.scratch("wine-cache"), "wine.json"))
+    results = {
+        "resolve_cold": measure(runtime.resolve, 1, lambda: runtime._resolved.clear()),
+        "resolve_warm": measure(runtime.resolve, run.repeat * 10),
+    }
+
+    def spawn_and_wait():
+        runtime.launch(exe, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).wait()
+
+    results["spawn_wait"] = measure(spawn_and_wait, run.repeat)
+
+    supervisor = ProcessSupervisor(runtime)
+    first_output, spawn = [], []
+
+    def supervised():
+        app = supervisor.launch(exe)
+        app.exited.wait()
+        supervisor.forget(app.id)
+        spawn.append(app.timing.spawn_ms)
+        if app.first_output is not None:
+            first_output.append((app.first_output - app.started) * 1000)
+
+    results["supervised_until_exit"] = measure(supervised, run.repeat)
+    results["supervised_until_exit"]["spawn_ms_median"] = statistics.median(spawn)
+    if first_output:
+        results["supervised_until_exit"]["first_output_ms_median"] = statistics.median(first_output)
+    return results
+
+
+# --- file system ---
+
+@case
+def explorer(run):
+    """scan_directory plus sorting for one directory of 1k to 200k entries."""
+    from tuxport.explorer import scan_directory, sort_entries
+
+    results = {}
+    for files in run.tree_sizes:
+        root = run.tree("flat", files, fixtures.flat_tree)
+
+        def listing():
+            out, entries = queue.Queue(), []
+            scan_directory(root, out, threading.Event())
+            for batch in iter(out.get, None):
+                if isinstance(batch, Exception):
+                    raise batch
+                entries.extend(batch)
+            sort_entries(entries, "name")
+
+        results[f"list_{files}"] = per_second(measure(listing, run.repeat), files, "entries")
+    return results
+
+
+@case
+def indexer(run):
+    """ExeIndex crawls of nested trees: cold, unchanged (warm) and a name search."""
+    from tuxport.indexer import ExeIndex
+
+    results = {}
+    for files in run.tree_sizes:
+        root = run.tree("nested", files, fixtures.nested_tree)
+        db = os.path.join(run.scratch("index"), f"index-{files}.db")
+
+        def reset():
+            for suffix in ("", "-wal", "-shm"):
+                _remove(db + suffix)
+
+        repeat = 1 if files >= 100000 else run.repeat
+        results[f"cold_{files}"] = per_second(measure(lambda: ExeIndex(db).update([root]), repeat, reset),
+                                              files, "files")
+        results[f"warm_{files}"] = measure(lambda: ExeIndex(db).update([root]), run.repeat)
+        index = ExeIndex(db)
+        results[f"search_{files}"] = measure(lambda: index.search(SEARCH_TERM), run.repeat * 10)
+    return results
@@ -0,0 +1,208 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Offline fixtures: a local HTTP server, a fake Wine and synthetic trees.
+
+Everything is deterministic (fixed seeds, fixed payloads) so two runs on
+the same machine measure the same work.
+"""
+
+import http.server
+import os
+import random
+import re
+import stat
+import struct
+import threading
+
+SEND_CHUNK = 1024 * 1024
+PAYLOAD_SEED = 0x7a9
+ETAG = '"tuxport-bench-1"'
+FILES_PER_DIR = 100
+EXE_EVERY = 10  # One file in ten is an .exe, roughly a Downloads folder
+
+
+def pe_header():
+    """Headers of a minimal 64-bit GUI program, enough for pe.inspect to accept it."""
+    header = bytearray(0x200)
+    header[:2] = b"MZ"
+    struct.pack_into("<I", header, 0x3c, 0x80)
+    header[0x80:0x84] = b"PE\0\0"
+    struct.pack_into("<HHIIIHH", header, 0x84, 0x8664, 0, 0, 0, 0, 240, 0x22)
+    struct.pack_into("<H", header, 0x98, 0x20b)
+    struct.pack_into("<H", header, 0x98 + 68, 2)  # Subsystem: GUI
+    struct.pack_into("<I", header, 0x98 + 108, 16)
+    return bytes(header)
+
+
+def payload(size):
+    """Return a ``size``-byte "installer": PE headers, then deterministic random bytes."""
+    header = pe_header()
+    return header + random.Random(PAYLOAD_SEED).randbytes(max(0, size - len(header)))
+
+
+def download_page(links, installer_at):
+    """An HTML page with ``links`` anchors, the installer link being number ``installer_at``."""
+    rows = []
+    for i in range(links):
+        if i == installer_at:
+            rows.append('<li><a href="/full/setup-x64.exe">Download for Windows (64-bit)</a></li>')
+            rows.append('<li><a href="/full/setup-arm64.exe">Download for Windows on ARM</a></li>')
+        rows.append(f'<li><a href="/docs/page-{i}.html" class="nav">Documentation page {i}</a></li>')
+    return ("<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Download</title>"
+            "<style>" + "li{margin:0}" * 200 + "</style></head><body><ul>"
+            + "\n".join(rows) + "</ul></body></html>").encode()
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """``/full/*`` honours Range and ETag, ``/plain/*`` only ever sends the whole body.
+
+    ``/norange/*`` advertises ranges but answers every GET with the whole
+    body, like a proxy that strips Range. ``server.etag`` is the current
+    validator; a Range request whose If-Range no longer matches it gets the
+    whole body too. With ``server.cut_after`` set, each response stops
+    after that many body bytes and the connection is closed.
+    """
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, so net.ConnectionPool reuses connections
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self._respond(head=True)
+
+    def do_GET(self):
+        self._respond(head=False)
+
+    def _respond(self, head):
+        pages = self.server.pages
+        path = self.path.split("?", 1)[0]
+        if path in pages:
+            return self._send(200, pages[path], "text/html; charset=utf-8", head)
+        if path.startswith("/docs/"):
+            return self._send(200, b"<html><body>docs</body></html>", "text/html", head)
+        full = path.startswith("/full/")
+        norange = path.startswith("/norange/")
+        if not (full or norange or path.startswith("/plain/")) or not path.endswith(".exe"):
+            return self._send(404, b"not found", "text/plain", head)
+        body = self.server.payload
+        extra = {}
+        if full or norange:
+            etag = self.server.etag
+            extra["Accept-Ranges"] = "bytes"
+            extra["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, b"", None, True, extra)
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            if_range = self.headers.get("If-Range")
+            if match and full and (if_range is None or if_range == etag):
+                start = int(match.group(1))
+                end = min(int(match.group(2) or len(body) - 1), len(body) - 1)
+                extra["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+                return self._send(206, memoryview(body)[start:end + 1], "application/octet-stream", head, extra)
+        self._send(200, body, "application/octet-stream", head, extra)
+
+    def _send(self, status, body, content_type, head, extra=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        for name, value in (extra or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if head:
+            return
+        view = memoryview(body)
+        if self.server.cut_after is not None and status != 304:
+            view = view[:self.server.cut_after]
+            self.close_connection = True
+        try:
+            for offset in range(0, len(view), SEND_CHUNK):
+                self.wfile.write(view[offset:offset + SEND_CHUNK])
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+
+class HTTPFixture:
+    """A threaded HTTP server on 127.0.0.1, for use as a context manager."""
+
+    def __init__(self, size, pages=None):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.payload = payload(size)
+        self.server.pages = pages or {}
+        self.server.etag = ETAG
+        self.server.cut_after = None
+        self.thread = threading.Thread(target=self.server.serve_forever, name="bench-http", daemon=True)
+
+    def url(self, path):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+WINE_STUB = """#!/bin/sh
+# Stand-in for wine: answers --version, prints one line and exits
+if [ "$1" = "--version" ]; then
+    echo "wine-9.0 (tuxport bench stub)"
+    exit 0
+fi
+echo "stub: $1"
+exit 0
+"""
+
+WINESERVER_STUB = """#!/bin/sh
+exit 0
+"""
+
+
+def fake_wine(directory):
+    """Write ``wine`` and ``wineserver`` stubs into ``directory``; returns the wine path."""
+    os.makedirs(directory, exist_ok=True)
+    for name, script in (("wine", WINE_STUB), ("wineserver", WINESERVER_STUB)):
+        path = os.path.join(directory, name)
+        with open(path, 'w') as f:
+            f.write(script)
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return os.path.join(directory, "wine")
+
+
+def flat_tree(root, files):
+    """Create ``files`` entries directly in ``root`` (what the explorer lists)."""
+    os.makedirs(root, exist_ok=True)
+    for i in range(files):
+        name = f"setup-{i:06d}.exe" if i % EXE_EVERY == 0 else f"file-{i:06d}.dat"
+        with open(os.path.join(root, name), 'wb') as f:
+            f.write(b"MZ")
+    return root
+
+
+def nested_tree(root, files, fanout=FILES_PER_DIR):
+    """Create ``files`` files spread over directories of ``fanout`` files, two levels deep."""
+    rng = random.Random(files)
+    dirs = max(1, -(-files // fanout))
+    per_group = max(1, int(dirs ** 0.5))
+    made = 0
+    for d in range(dirs):
+        path = os.path.join(root, f"group-{d // per_group:04d}", f"dir-{d:05d}")
+        os.makedirs(path, exist_ok=True)
+        for i in range(min(fanout, files - made)):
+            n = made + i
+            if n % EXE_EVERY == 0:
+                name = f"{rng.choice(('setup', 'install', 'game', 'tool'))}-{n:06d}.exe"
+            else:
+                name = f"file-{n:06d}.dat"
+            with open(os.path.join(path, name), 'wb') as f:
+                f.write(b"MZ")
+        made += fanout
+    return root
@@ -0,0 +1,12 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import os
+import tempfile
+
+# Before any tuxport import: CACHE_DIR is read once, and tests must not touch ~/.cache
+os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp(prefix="tuxport-tests-")
+for name in list(os.environ):
+    if name.lower().endswith("_proxy"):
+        del os.environ[name]  # The HTTP fixture is on 127.0.0.1
@@ -0,0 +1,89 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import io
+import os
+import tarfile
+
+import pytest
+
+from tuxport import archives
+
+BUNDLE = (  # In archive order: app/a.dat comes before the .exe that makes app/ wanted
+    ("docs/manual.bin", 256 * 1024),
+    ("app/a.dat", 10),
+    ("app/setup.exe", 100),
+    ("app/sub/z.dat", 10),
+    ("tools/other.exe", 100),
+    ("readme.txt", 10),
+)
+
+
+def make_tar(path, entries=BUNDLE):
+    with tarfile.open(path, "w:gz") as t:
+        for name, size in entries:
+            info = tarfile.TarInfo(name)
+            info.size = size
+            t.addfile(info, io.BytesIO(b"x" * size))
+    return path
+
+
+def stream(path, exe=None, stage=None):
+    tail = archives.Tail()
+    extractor = archives.StreamExtractor(tail, stage or path + ".unpack", exe)
+    tail.start(path)
+    tail.advance(os.path.getsize(path))
+    tail.finish()
+    return extractor
+
+
+def listing(root):
+    return sorted(os.path.relpath(os.path.join(d, f), root) for d, _, files in os.walk(root) for f in files)
+
+
+def test_stream_keeps_only_program_folders(tmp_path):
+    path = make_tar(str(tmp_path / "bundle.tar.gz"))
+    extractor = stream(path)
+    extractor._thread.join()
+    assert extractor.staged == {"app/setup.exe", "app/sub/z.dat", "tools/other.exe"}
+    exe = extractor.finish(path, "key", str(tmp_path / "extracted"))
+    assert os.path.basename(exe) == "setup.exe"
+    assert listing(os.path.dirname(exe)) == ["a.dat", "setup.exe", os.path.join("sub", "z.dat")]
+    assert not os.path.exists(path + ".unpack")
+
+
+def test_stream_with_chosen_member(tmp_path):
+    path = make_tar(str(tmp_path / "bundle.tar.gz"))
+    extractor = stream(path, exe="tools/other.exe")
+    extractor._thread.join()
+    assert extractor.staged == {"tools/other.exe"}
+    exe = extractor.finish(path, "key", str(tmp_path / "extracted"))
+    assert listing(os.path.dirname(exe)) == ["other.exe"]
+
+
+def test_root_program_takes_only_its_siblings(tmp_path):
+    entries = [("setup.exe", 100), ("setup.dll", 10)] + [(f"extras/media/clip-{i}.bin", 256 * 1024) for i in range(8)]
+    path = make_tar(str(tmp_path / "bundle.tar.gz"), entries)
+    extractor = stream(path)
+    extractor._thread.join()
+    assert extractor.staged == {"setup.exe", "setup.dll"}
+    exe = extractor.finish(path, "key", str(tmp_path / "extracted"))
+    assert listing(os.path.dirname(exe)) == ["setup.dll", "setup.exe"]
+    exe = archives.extract(path, root=str(tmp_path / "again"))
+    assert listing(os.path.dirname(exe)) == ["setup.dll", "setup.exe"]
+
+
+def test_extract_refuses_unsafe_members(tmp_path):
+    path = make_tar(str(tmp_path / "evil.tar.gz"), (("../evil.exe", 10), ("/abs/setup.exe", 10)))
+    with pytest.raises(archives.NoProgramFound):
+        archives.extract(path, root=str(tmp_path / "extracted"))
+    assert not os.path.exists(tmp_path / "evil.exe")
+
+
+def test_extract_is_reused(tmp_path):
+    path = make_tar(str(tmp_path / "bundle.tar.gz"))
+    root = str(tmp_path / "extracted")
+    exe = archives.extract(path, root=root)
+    assert listing(os.path.dirname(exe)) == ["a.dat", "setup.exe", os.path.join("sub", "z.dat")]
+    assert archives.extract(path, root=root) == exe
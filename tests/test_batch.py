@@ -0,0 +1,64 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import threading
+import time
+
+from tuxport import batch
+from tuxport.batch import BatchQueue
+
+
+class FakeApp:
+    def __init__(self):
+        self.exited = threading.Event()
+        self.returncode = None
+
+    def finish(self):
+        self.returncode = 0
+        self.exited.set()
+
+
+class FakeSupervisor:
+    """Launches nothing; each installer runs until the test finishes it."""
+
+    def __init__(self):
+        self.apps = {}
+
+    def launch(self, exe, prefix=None, name=None):
+        app = self.apps[name] = FakeApp()
+        return app
+
+
+def wait_until(done, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not done():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_busy_prefix_does_not_hold_a_worker(tmp_path):
+    paths = []
+    for name in ("a1.exe", "a2.exe", "b.exe"):
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        paths.append(str(path))
+    supervisor = FakeSupervisor()
+    queue = BatchQueue(supervisor, concurrency=2,
+                       prefix_for=lambda path: str(tmp_path / ("prefix-a" if "/a" in path else "prefix-b")))
+    try:
+        a1, a2, b = queue.submit(paths)
+        # a2 waits for a1's prefix without a worker, so b gets the second one
+        wait_until(lambda: "b.exe" in supervisor.apps and a2.state == batch.WAITING)
+        assert "a1.exe" in supervisor.apps and "a2.exe" not in supervisor.apps
+        supervisor.apps["a1.exe"].finish()
+        wait_until(lambda: a2.state == batch.RUNNING)
+        assert a1.state == batch.DONE
+        supervisor.apps["a2.exe"].finish()
+        supervisor.apps["b.exe"].finish()
+        wait_until(lambda: queue.idle)
+        assert [job.state for job in (a1, a2, b)] == [batch.DONE] * 3
+        assert not queue._busy and not queue._pending
+    finally:
+        for app in list(supervisor.apps.values()):
+            app.finish()  # Never leave the pool's threads waiting
@@ -0,0 +1,104 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import json
+import os
+import threading
+
+from benchmarks import fixtures
+from tuxport import downloads
+from tuxport.cache import InstallerCache
+
+SIZE = 256 * 1024
+
+
+def fetch(cache, url, dest_dir):
+    job = downloads.DownloadJob(url, dest_dir, cache=cache, sidecar=False)
+    downloads.fetch(job)
+    return job
+
+
+def test_etag_revalidation(tmp_path):
+    cache = InstallerCache(root=str(tmp_path / "cache"))
+    with fixtures.HTTPFixture(SIZE) as server:
+        url = server.url("/full/setup.exe")
+        first = fetch(cache, url, str(tmp_path))
+        assert not first.cache_hit
+        again = fetch(cache, url, str(tmp_path))  # If-None-Match matches: 304
+        assert again.cache_hit and again.path == first.path
+        server.server.payload = newer = fixtures.pe_header() + b"v2" * SIZE
+        server.server.etag = '"tuxport-bench-2"'
+        changed = fetch(cache, url, str(tmp_path))
+    assert not changed.cache_hit
+    with open(changed.path, 'rb') as f:
+        assert f.read() == newer
+
+
+def test_same_url_twice_downloads_once(tmp_path):
+    # The second job waits on the first one's partial, then takes its cache hit
+    cache = InstallerCache(root=str(tmp_path / "cache"))
+    with fixtures.HTTPFixture(4 * 1024 * 1024) as server:
+        jobs = [downloads.DownloadJob(server.url("/full/setup.exe"), str(tmp_path), cache=cache, sidecar=False)
+                for _ in range(2)]
+        threads = [threading.Thread(target=downloads.fetch, args=(job,)) for job in jobs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+        payload = server.server.payload
+    assert sorted(job.cache_hit for job in jobs) == [False, True]
+    for job in jobs:
+        with open(job.path, 'rb') as f:
+            assert f.read() == payload
+
+
+def store(cache, tmp_path, url, content):
+    tmp = tmp_path / "download.tmp"
+    tmp.write_bytes(content)
+    return cache.store(url, str(tmp), os.path.basename(url), etag='"v1"')
+
+
+def last_used(cache):
+    return dict(cache._db().execute("SELECT sha256, last_used FROM blobs"))
+
+
+def test_eviction_follows_batched_hits(tmp_path):
+    cache = InstallerCache(root=str(tmp_path / "cache"), max_bytes=2500)
+    a = store(cache, tmp_path, "http://x/a.exe", b"a" * 1000)
+    b = store(cache, tmp_path, "http://x/b.exe", b"b" * 1000)
+    cache.hit("http://x/a.exe")  # The first hit is written at once
+    before = last_used(cache)
+    cache.hit("http://x/b.exe")
+    cache.hit("http://x/a.exe")
+    assert last_used(cache) == before  # Later ones wait for a flush
+    c = store(cache, tmp_path, "http://x/c.exe", b"c" * 1000)  # Flushes, then evicts b
+    assert os.path.exists(a) and os.path.exists(c) and not os.path.exists(b)
+    assert cache.lookup("http://x/b.exe") is None
+    assert cache.total_size() == 2000
+
+
+def test_processes_share_the_index(tmp_path):
+    # Two processes' caches: neither one's store may drop the other's entry
+    root = str(tmp_path / "cache")
+    one, two = InstallerCache(root=root), InstallerCache(root=root)
+    one.lookup("http://x/a.exe")
+    two.lookup("http://x/b.exe")
+    store(one, tmp_path, "http://x/a.exe", b"a" * 100)
+    store(two, tmp_path, "http://x/b.exe", b"b" * 100)
+    assert one.lookup("http://x/b.exe") and two.lookup("http://x/a.exe")
+
+
+def test_json_index_is_imported(tmp_path):
+    root = tmp_path / "cache"
+    sha = "ab" * 32
+    (root / "blobs" / sha).mkdir(parents=True)
+    (root / "blobs" / sha / "setup.exe").write_bytes(b"x" * 10)
+    (root / "index.json").write_text(json.dumps({
+        "urls": {"http://x/setup.exe": {"sha256": sha, "name": "setup.exe", "size": 10, "etag": '"v1"',
+                                        "last_modified": None}},
+        "blobs": {sha: {"size": 10, "last_used": 1.0}},
+    }))
+    cache = InstallerCache(root=str(root))
+    assert cache.conditional_headers("http://x/setup.exe") == {"If-None-Match": '"v1"'}
+    assert not (root / "index.json").exists()
@@ -0,0 +1,120 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+
+import pytest
+
+from benchmarks import fixtures
+from tuxport import daemon
+
+
+@pytest.fixture
+def served(tmp_path):
+    """A daemon in its own process, running the wine stub; yields its socket path."""
+    home = tmp_path / "home"
+    home.mkdir()
+    with open(home / ".tuxport_settings.json", 'w') as f:
+        json.dump({"wine_path": fixtures.fake_wine(str(tmp_path / "bin")), "prefix_isolation": False,
+                   "sampler_interval": 0}, f)
+    path = str(tmp_path / "run" / "tuxport.sock")
+    env = dict(os.environ, HOME=str(home))
+    proc = subprocess.Popen([sys.executable, "-m", "tuxport", "daemon", "--socket", path], env=env,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 10
+        while daemon.connect(path=path) is None:
+            assert proc.poll() is None and time.monotonic() < deadline, "the daemon did not come up"
+            time.sleep(0.05)
+        yield path
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+
+def make_exe(directory, name="setup.exe"):
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(fixtures.payload(4096))
+    return path
+
+
+def poll_until(feed, done, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not done():
+        assert time.monotonic() < deadline
+        feed.poll()
+        time.sleep(0.02)
+
+
+def test_socket_is_owner_only(served):
+    assert stat.S_IMODE(os.stat(served).st_mode) == 0o600
+
+
+def test_launch_and_install_go_through_the_daemon(served, tmp_path):
+    client = daemon.connect(path=served)
+    feed = daemon.StatusFeed(served, interval=0.02)
+    feed.start()
+    supervisor = daemon.RemoteSupervisor(client, feed)
+    updates = []
+    supervisor.listeners.append(updates.append)
+    app = supervisor.launch(make_exe(str(tmp_path)), name="Setup", args=["/S"])
+    assert app.pid and app.name == "Setup"
+    poll_until(feed, lambda: updates and not app.running)  # The stub exits right away
+    assert app.returncode == 0 and updates[-1] is app
+    poll_until(feed, lambda: "stub:" in app.output()[0])  # Fetched in the background
+
+    batch = daemon.RemoteBatch(client, feed)
+    finished = []
+    batch.on_finished = finished.append
+    batch.submit([make_exe(str(tmp_path), "second.exe"), str(tmp_path / "missing.exe")])
+    poll_until(feed, lambda: finished)
+    assert sorted(job.state for job in finished[0]) == ["done", "failed"]
+    feed.stop()
+
+
+def test_bad_fields_are_refused_not_fatal(served):
+    client = daemon.connect(path=served)
+    for op, fields in (("install", {"sources": "setup.exe"}), ("install", {"sources": [1]}),
+                       ("pause", {"download": [1]}), ("output", {"app": {}})):
+        with pytest.raises(daemon.DaemonError):
+            client.request(op, **fields)
+    assert client.request("ping")["ok"]  # Still the same connection
+
+
+def test_feed_never_waits_on_the_socket(tmp_path):
+    # A daemon that accepts and then never answers
+    path = str(tmp_path / "stuck.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    feed = daemon.StatusFeed(path, interval=0.01)
+    watcher = type("Watcher", (), {"watching": True, "apply": lambda self, *result: None})()
+    feed.watchers.append(watcher)
+    feed.start()
+    try:
+        time.sleep(0.1)
+        started = time.monotonic()
+        feed.poll()
+        assert time.monotonic() - started < 0.05
+    finally:
+        feed.stop()
+        server.close()
+
+
+def test_downloads_submitted_after_a_status_are_not_lost():
+    downloads = daemon.RemoteDownloads(client=None)
+    asked = time.monotonic()
+    job = downloads.jobs[1] = daemon.RemoteJob(None, {"id": 1, "state": "running"})
+    downloads.apply({"downloads": []}, None, asked)
+    assert job.state == "running"
+    downloads.apply({"downloads": []}, None, time.monotonic())
+    assert job.state == "failed" and 1 not in downloads.jobs
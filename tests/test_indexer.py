@@ -0,0 +1,73 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import os
+import shutil
+
+from benchmarks import fixtures
+from tuxport.indexer import ExeIndex
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"MZ")
+
+
+def names(index, text=""):
+    return sorted(os.path.basename(row[0]) for row in index.search(text))
+
+
+def test_update_is_incremental(tmp_path):
+    root = fixtures.nested_tree(str(tmp_path / "tree"), 1000)
+    index = ExeIndex(str(tmp_path / "index.db"))
+    first = index.update([root])
+    assert first["files"] == 100
+    second = index.update([root])
+    assert second["rescanned"] == 0 and second["files"] == 0
+    assert second["dirs"] == first["dirs"]
+    assert len(index.search("")) == 100
+
+
+def test_new_and_removed_files(tmp_path):
+    root = str(tmp_path / "tree")
+    touch(os.path.join(root, "a", "one.exe"))
+    touch(os.path.join(root, "a", "b", "two.exe"))
+    index = ExeIndex(str(tmp_path / "index.db"))
+    index.update([root])
+    assert names(index) == ["one.exe", "two.exe"]
+    touch(os.path.join(root, "a", "b", "three.exe"))
+    os.remove(os.path.join(root, "a", "one.exe"))
+    stats = index.update([root])
+    assert stats["rescanned"] == 2  # Only a/ and a/b/ changed
+    assert names(index) == ["three.exe", "two.exe"]
+
+
+def test_forget_removed_subtree(tmp_path):
+    root = str(tmp_path / "tree")
+    touch(os.path.join(root, "gone", "deep", "x.exe"))
+    touch(os.path.join(root, "kept", "y.exe"))
+    index = ExeIndex(str(tmp_path / "index.db"))
+    index.update([root])
+    shutil.rmtree(os.path.join(root, "gone"))
+    index.update([root])
+    assert names(index) == ["y.exe"]
+    db = index.connect()
+    assert not db.execute("SELECT path FROM dirs WHERE path LIKE ?", ("%gone%",)).fetchall()
+    db.close()
+
+
+def test_forget_keeps_siblings_differing_in_case(tmp_path):
+    root = str(tmp_path / "root")
+    touch(os.path.join(root, "Foo", "b.exe"))
+    touch(os.path.join(root, "foo", "sub", "a.exe"))
+    touch(os.path.join(root, "foo_bar", "c.exe"))  # "_" is a LIKE wildcard too
+    index = ExeIndex(str(tmp_path / "index.db"))
+    index.update([root])
+    assert names(index) == ["a.exe", "b.exe", "c.exe"]
+    shutil.rmtree(os.path.join(root, "Foo"))
+    index.update([root])
+    assert names(index) == ["a.exe", "c.exe"]
+    index.update([root])  # Still there once root's mtime is unchanged
+    assert names(index) == ["a.exe", "c.exe"]
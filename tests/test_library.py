@@ -0,0 +1,107 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import os
+import shutil
+import struct
+
+from tuxport import library
+from tuxport.library import Library
+
+START_MENU = ("drive_c", "users", "me", "AppData", "Roaming", "Microsoft", "Windows", "Start Menu", "Programs")
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"MZ")
+
+
+def write_lnk(path, target, workdir=None, args=None):
+    """A shell link with an ANSI LinkInfo target and Unicode string data, as Wine writes them."""
+    flags = 0x2 | 0x80 | (0x10 if workdir else 0) | (0x20 if args else 0)
+    header = bytearray(0x4C)
+    header[0:4] = b"L\0\0\0"
+    header[4:20] = library.LNK_CLSID
+    struct.pack_into("<I", header, 0x14, flags)
+    base = target.encode("cp1252") + b"\0"
+    info = struct.pack("<7I", 0x1C + len(base) + 1, 0x1C, 1, 0, 0x1C, 0, 0x1C + len(base)) + base + b"\0"
+    strings = b"".join(struct.pack("<H", len(s)) + s.encode("utf-16-le") for s in (workdir, args) if s)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(bytes(header) + info + strings)
+
+
+def make_prefix(path):
+    drive_c = os.path.join(path, "drive_c")
+    touch(os.path.join(drive_c, "Program Files", "Vendor", "App", "app.exe"))
+    touch(os.path.join(drive_c, "Program Files", "Vendor", "App", "unins000.exe"))
+    touch(os.path.join(drive_c, "Program Files", "Vendor", "App", "tool.exe"))
+    touch(os.path.join(drive_c, "Program Files (x86)", "Loose", "loose.exe"))
+    touch(os.path.join(drive_c, "Program Files", "Common Files", "wine.exe"))
+    menu = os.path.join(path, *START_MENU, "Vendor")
+    write_lnk(os.path.join(menu, "My App.lnk"), "C:\\PROGRAM FILES\\vendor\\App\\app.exe",
+              "C:\\Program Files\\Vendor", '-x "a b"')
+    write_lnk(os.path.join(menu, "Uninstall.lnk"), "C:\\Program Files\\Vendor\\App\\unins000.exe")
+    return path
+
+
+def test_apps_from_shortcuts_and_program_files(tmp_path):
+    prefix = make_prefix(str(tmp_path / "pfx"))
+    lib = Library(str(tmp_path / "library.db"), str(tmp_path / "desktop"))
+    lib.update([prefix])
+    apps = {a.name: a for a in lib.apps()}
+    assert sorted(apps) == ["My App", "loose"]  # tool.exe is hidden behind the shortcut into its folder
+    app = apps["My App"]
+    assert app.exe == os.path.join(prefix, "drive_c", "Program Files", "Vendor", "App", "app.exe")
+    assert app.workdir == os.path.join(prefix, "drive_c", "Program Files", "Vendor")
+    assert library.split_args(app.args) == ["-x", "a b"]
+
+
+def test_update_is_incremental(tmp_path):
+    prefix = make_prefix(str(tmp_path / "pfx"))
+    lib = Library(str(tmp_path / "library.db"), str(tmp_path / "desktop"))
+    lib.update([prefix])
+    stats = lib.update([prefix])
+    assert stats["rescanned"] == 0 and stats["entries"] == 0
+    write_lnk(os.path.join(prefix, *START_MENU, "Loose.lnk"), "C:\\Program Files (x86)\\Loose\\loose.exe")
+    stats = lib.update([prefix])
+    assert stats["rescanned"] == 1 and stats["entries"] == 1
+    assert [a.name for a in lib.apps()] == ["Loose", "My App"]
+
+
+def test_removed_prefix_is_forgotten(tmp_path):
+    one, two = make_prefix(str(tmp_path / "one")), make_prefix(str(tmp_path / "two"))
+    lib = Library(str(tmp_path / "library.db"), str(tmp_path / "desktop"))
+    lib.update([one, two])
+    assert len(lib.apps()) == 4
+    lib.update([two])
+    assert {a.prefix for a in lib.apps()} == {two}
+
+
+def test_forget_keeps_siblings_differing_in_case(tmp_path):
+    prefix = str(tmp_path / "pfx")
+    programs = os.path.join(prefix, "drive_c", "Program Files")
+    touch(os.path.join(programs, "Foo", "first.exe"))
+    touch(os.path.join(programs, "foo", "bin", "second.exe"))
+    lib = Library(str(tmp_path / "library.db"), str(tmp_path / "desktop"))
+    lib.update([prefix])
+    assert [a.name for a in lib.apps()] == ["first", "second"]
+    shutil.rmtree(os.path.join(programs, "Foo"))
+    lib.update([prefix])
+    lib.update([prefix])
+    assert [a.name for a in lib.apps()] == ["second"]
+
+
+def test_desktop_entry(tmp_path):
+    prefix = make_prefix(str(tmp_path / "pfx"))
+    lnk = os.path.join(prefix, *START_MENU, "Vendor", "My App.lnk").replace(" ", "\\\\ ")
+    desktop = tmp_path / "desktop" / "Programs" / "Vendor"
+    desktop.mkdir(parents=True)
+    (desktop / "My App.desktop").write_text(
+        "[Desktop Entry]\nName=My Application\nType=Application\n"
+        f'Exec=env WINEPREFIX="{prefix}" wine C:\\\\\\\\windows\\\\\\\\command\\\\\\\\start.exe /Unix {lnk}\n')
+    found = library._desktop(str(desktop / "My App.desktop"))
+    assert found[:3] == (prefix, "My Application",
+                         os.path.join(prefix, "drive_c", "Program Files", "Vendor", "App", "app.exe"))
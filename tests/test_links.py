@@ -0,0 +1,49 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import pytest
+
+from benchmarks import fixtures
+from tuxport import links
+
+PAGE_LINKS = 2000  # About 150 KB, several chunks
+
+PAGES = {
+    "/early.html": fixtures.download_page(PAGE_LINKS, 20),
+    "/late.html": fixtures.download_page(PAGE_LINKS, PAGE_LINKS - 20),
+    "/none.html": fixtures.download_page(PAGE_LINKS, -1),
+    "/data.html": b'<html><body><button data-mirror-href="/full/setup-x64.exe">Mirror</button>'
+                  b'<div data-download-url="/full/tool.zip" data-title="/docs/readme.exe"></div></body></html>',
+}
+
+
+@pytest.fixture(scope="module")
+def server():
+    with fixtures.HTTPFixture(4096, PAGES) as server:
+        yield server
+
+
+def installers(server):
+    return {server.url("/full/setup-x64.exe"), server.url("/full/setup-arm64.exe")}
+
+
+@pytest.mark.parametrize("page", ["/early.html", "/late.html"])
+def test_links_anywhere_on_the_page(server, page):
+    found = links.discover(server.url(page))
+    assert set(found) == installers(server)
+
+
+def test_page_without_links(server):
+    assert links.discover(server.url("/none.html")) == []
+
+
+def test_reading_stops_early(server):
+    # Both installers sit in the first chunk of the early page and near the end of the late one
+    assert set(links.discover(server.url("/early.html"), limit=2, max_bytes=links.CHUNK_SIZE)) == installers(server)
+    assert links.discover(server.url("/late.html"), limit=2, max_bytes=links.CHUNK_SIZE) == []
+
+
+def test_data_url_attributes(server):
+    found = links.discover(server.url("/data.html"))
+    assert set(found) == {server.url("/full/setup-x64.exe"), server.url("/full/tool.zip")}
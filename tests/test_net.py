@@ -0,0 +1,37 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import socket
+import time
+import urllib.error
+
+import pytest
+
+from benchmarks import fixtures
+from tuxport import net
+
+
+def test_pooled_requests_honour_the_timeout():
+    # A server that accepts and never answers
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    url = f"http://127.0.0.1:{server.getsockname()[1]}/setup.exe"
+    try:
+        started = time.monotonic()
+        with pytest.raises(urllib.error.URLError):
+            net.open_url(url, timeout=0.2)
+        assert time.monotonic() - started < 5
+    finally:
+        server.close()
+
+
+def test_reused_connection_takes_the_new_timeout():
+    with fixtures.HTTPFixture(1024) as server:
+        with net.open_url(server.url("/full/setup.exe"), timeout=7) as response:
+            response.read()
+            sock = response._conn.sock
+        with net.open_url(server.url("/full/setup.exe"), timeout=3) as response:
+            assert response._conn.sock is sock and sock.gettimeout() == 3
+            response.read()
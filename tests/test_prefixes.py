@@ -0,0 +1,114 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import os
+import shutil
+import socket
+import stat
+import time
+
+from benchmarks import fixtures
+from tuxport import prefixes, wine
+from tuxport.prefixes import PrefixPool
+from tuxport.wine import WineRuntime
+
+
+def make_template(pool):
+    system32 = os.path.join(pool.template, "drive_c", "windows", "system32")
+    fonts = os.path.join(pool.template, "drive_c", "windows", "Fonts")
+    for path in (os.path.join(system32, "msvcp140.dll"), os.path.join(fonts, "tahoma.ttf"),
+                 os.path.join(pool.template, "system.reg")):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(b"template")
+    pool._protect(pool.template)
+
+
+def test_clone_keeps_images_writable(tmp_path):
+    pool = PrefixPool(WineRuntime(prefix=str(tmp_path / "wine")), str(tmp_path / "pool"), clone_method="hardlink")
+    make_template(pool)
+    prefix = pool.prefix_for("Game Setup 1.2.exe")
+    dll = os.path.join(prefix, "drive_c", "windows", "system32", "msvcp140.dll")
+    font = os.path.join(prefix, "drive_c", "windows", "Fonts", "tahoma.ttf")
+    assert os.stat(font).st_nlink == 2 and not os.stat(font).st_mode & stat.S_IWUSR
+    assert os.stat(dll).st_nlink == 1
+    with open(dll, 'r+b') as f:  # What an installer's CREATE_ALWAYS does
+        f.write(b"upgraded")
+    with open(os.path.join(pool.template, "drive_c", "windows", "system32", "msvcp140.dll"), 'rb') as f:
+        assert f.read() == b"template"
+
+
+def test_unshare_images_of_older_clones(tmp_path):
+    pool = PrefixPool(WineRuntime(prefix=str(tmp_path / "wine")), str(tmp_path / "pool"))
+    make_template(pool)
+    old = os.path.join(pool.template, "drive_c", "windows", "system32", "old.dll")
+    with open(old, 'wb') as f:
+        f.write(b"template")
+    os.chmod(old, 0o444)
+    prefix = pool.path_for("game")
+    os.makedirs(os.path.join(prefix, "drive_c", "windows", "system32"))
+    linked = os.path.join(prefix, "drive_c", "windows", "system32", "old.dll")
+    os.link(old, linked)  # As a version that hard-linked DLLs left it
+    assert pool.prefix_for("game.exe") == prefix
+    assert os.stat(linked).st_nlink == 1 and os.stat(linked).st_mode & stat.S_IWUSR
+    assert prefixes.unshare_images(prefix) == 0
+
+
+def make_prefix(pool, name, age_days):
+    path = pool.path_for(name)
+    os.makedirs(path)
+    then = time.time() - age_days * 86400
+    with open(os.path.join(path, "user.reg"), 'w') as f:
+        f.write("WINE REGISTRY Version 2\n")
+    for p in (os.path.join(path, "user.reg"), path):
+        os.utime(p, (then, then))
+    pool._update(name, last_used=time.time() - 400 * 86400)  # Last resolved by TuxPort long ago
+    return path
+
+
+def test_gc_is_opt_in_and_honours_registry_writes(tmp_path):
+    pool = PrefixPool(WineRuntime(prefix=str(tmp_path / "wine")), str(tmp_path / "pool"))
+    stale = make_prefix(pool, "stale", 200)
+    recent = make_prefix(pool, "recent", 2)  # Started from Wine's menu: only user.reg says so
+    assert pool.gc() == [] and os.path.isdir(stale)
+    assert pool.gc(90) == ["stale"]
+    assert not os.path.exists(stale) and os.path.isdir(recent)
+
+
+def test_pools_share_metadata(tmp_path):
+    # The window and the daemon each hold a pool; neither may drop the other's fields
+    runtime = WineRuntime(prefix=str(tmp_path / "wine"))
+    one, two = PrefixPool(runtime, str(tmp_path / "pool")), PrefixPool(runtime, str(tmp_path / "pool"))
+    one.info("game")
+    two.info("game")
+    one._update("game", clone="reflink")
+    two._update("game", last_used=123.0)
+    assert one.info("game") == {"clone": "reflink", "last_used": 123.0}
+
+
+def test_prefix_for_warms_the_apps_own_server(tmp_path):
+    wine_path = fixtures.fake_wine(str(tmp_path / "bin"))
+    log = tmp_path / "wineserver.log"
+    with open(tmp_path / "bin" / "wineserver", 'w') as f:
+        f.write(f'#!/bin/sh\necho "$WINEPREFIX $1" >> {log}\n')
+    pool = PrefixPool(WineRuntime(wine_path, prefix=str(tmp_path / "wine")), str(tmp_path / "pool"))
+    make_template(pool)
+    prefix = pool.prefix_for("game.exe")
+    assert log.read_text().split() == [prefix, f"-p{wine.SERVER_LINGER}"]
+
+
+def test_is_warm_asks_the_server(tmp_path):
+    runtime = WineRuntime(prefix=str(tmp_path))
+    assert not runtime.is_warm()
+    path = wine.server_socket(str(tmp_path))
+    os.makedirs(os.path.dirname(path), mode=0o700)
+    try:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen()
+        assert runtime.is_warm()
+        server.close()  # The socket file stays behind, as after a crash
+        assert os.path.exists(path) and not runtime.is_warm()
+    finally:
+        shutil.rmtree(os.path.dirname(path))
@@ -0,0 +1,81 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+import hashlib
+import os
+
+import pytest
+
+from benchmarks import fixtures
+from tuxport import integrity, ranged
+from tuxport.downloads import DownloadJob
+
+SIZE = 1024 * 1024
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(ranged, "SEGMENT_MIN", 64 * 1024)  # Four ranges out of SIZE
+    monkeypatch.setattr(ranged, "RETRIES", 0)  # An interrupted range fails the attempt at once
+    with fixtures.HTTPFixture(SIZE) as server:
+        yield server
+
+
+def fetch(server, path, dest, info=None):
+    job = DownloadJob(server.url(path), os.path.dirname(dest))
+    digests = integrity.Digests()
+    ranged.download(server.url(path), dest, job, connections=4, info=info, digests=digests)
+    return job, digests
+
+
+def test_segmented_download(server, tmp_path):
+    dest = str(tmp_path / "setup.exe")
+    job, digests = fetch(server, "/full/setup.exe", dest)
+    with open(dest, 'rb') as f:
+        assert f.read() == server.server.payload
+    assert digests.hexdigest() == hashlib.sha256(server.server.payload).hexdigest()
+    assert job.downloaded == job.transferred == SIZE
+    assert not os.path.exists(dest + ranged.PART_SUFFIX) and not os.path.exists(dest + ranged.STATE_SUFFIX)
+
+
+def test_resume_after_interruption(server, tmp_path):
+    dest = str(tmp_path / "setup.exe")
+    server.server.cut_after = 100 * 1024
+    with pytest.raises(OSError):
+        fetch(server, "/full/setup.exe", dest)
+    assert os.path.exists(dest + ranged.PART_SUFFIX) and os.path.exists(dest + ranged.STATE_SUFFIX)
+    server.server.cut_after = None
+    job, digests = fetch(server, "/full/setup.exe", dest)
+    assert job.transferred < SIZE  # The ranges already on disk were not fetched again
+    assert job.downloaded == SIZE
+    with open(dest, 'rb') as f:
+        assert f.read() == server.server.payload
+    assert digests.hexdigest() == hashlib.sha256(server.server.payload).hexdigest()
+
+
+def test_range_ignored_falls_back_to_one_stream(server, tmp_path):
+    dest = str(tmp_path / "setup.exe")
+    job, digests = fetch(server, "/norange/setup.exe", dest)
+    with open(dest, 'rb') as f:
+        assert f.read() == server.server.payload
+    assert digests.hexdigest() == hashlib.sha256(server.server.payload).hexdigest()
+    assert job.downloaded == SIZE
+
+
+def test_changed_file_restarts_from_scratch(server, tmp_path):
+    dest = str(tmp_path / "setup.exe")
+    url = server.url("/full/setup.exe")
+    server.server.cut_after = 100 * 1024
+    with pytest.raises(OSError):
+        fetch(server, "/full/setup.exe", dest)
+    server.server.cut_after = None
+    info = ranged.probe(url)
+    # Replaced between the probe and the ranges: If-Range no longer matches
+    server.server.etag = '"tuxport-test-2"'
+    server.server.payload = bytes(reversed(server.server.payload))
+    job, digests = fetch(server, "/full/setup.exe", dest, info=info)
+    with open(dest, 'rb') as f:
+        assert f.read() == server.server.payload
+    assert digests.hexdigest() == hashlib.sha256(server.server.payload).hexdigest()
+    assert not os.path.exists(dest + ranged.STATE_SUFFIX)
@@ -0,0 +1,11 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""TuxPort: the Tk UI (tuxport.app), the headless CLI (tuxport.cli) and
+the background subsystems both are built on.
+
+Submodules are imported on demand; importing the package itself is free.
+"""
+
+__version__ = "1.0.0"
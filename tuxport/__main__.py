@@ -0,0 +1,10 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+
+import sys
+
+from tuxport.cli import main
+
+sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,787 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""The TuxPort window.
+
+Only tkinter and the settings are imported up front. Downloads, the
+installer cache, the .exe index, Wine and the process supervisor are
+created on first use, secondary dialogs live in tuxport.dialogs, and
+wineserver prewarm and indexing start once the first frame is on screen.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from tuxport import theme, trace
+from tuxport.settings import load_settings, save_settings
+from tuxport.theme import FONT_BUTTON, FONT_DESC, FONT_LABEL, FONT_SUBTITLE, FONT_TITLE
+
+# Kiosk budget from exec to the first mapped frame, in ms
+FIRST_FRAME_TARGET_MS = 500
+
+_t_imported = time.perf_counter()
+
+settings = load_settings()
+trace.configure(settings)
+root = None
+
+
+def process_age_ms():
+    # Time since exec, so interpreter start-up and imports count too; the
+    # fallback only covers the time since this module was imported.
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return (uptime - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000
+    except (OSError, ValueError, IndexError):
+        return (time.perf_counter() - _t_imported) * 1000
+
+
+def apply_theme(name):
+    global BG, FG, ACCENT, LABEL, ENTRY_BG, ENTRY_FG
+    t = theme.set_theme(name)
+    BG, FG, ACCENT, LABEL, ENTRY_BG, ENTRY_FG = t["BG"], t["FG"], t["ACCENT"], t["LABEL"], t["ENTRY_BG"], t["ENTRY_FG"]
+    # Update all widgets if root exists
+    if root is not None:
+        update_all_widget_themes(root)
+
+
+def update_all_widget_themes(widget):
+    # Recursively update widget colors based on type
+    for child in widget.winfo_children():
+        cls = child.__class__.__name__
+        if cls in ("Frame", "Toplevel"):
+            child.configure(bg=BG)
+        elif cls == "Label":
+            child.configure(bg=BG, fg=FG)
+        elif cls == "Entry":
+            child.configure(bg=ENTRY_BG, fg=ENTRY_FG)
+        elif cls == "Button":
+            child.configure(bg=ACCENT, fg=FG)
+        elif cls == "Radiobutton":
+            child.configure(bg=BG, fg=FG, selectcolor=ACCENT)
+        elif cls == "Canvas":
+            child.configure(bg=BG)
+        # ttk widgets use style, so skip or update style globally
+        update_all_widget_themes(child)
+
+
+apply_theme(settings.get("theme", "dark"))
+
+# --- Services, created on first use; each stays None until then ---
+
+_exe_index = _pe_cache = _icon_cache = _wine_runtime = _prefix_pool = _app_library = None
+_daemon = _daemon_feed = _supervisor = _sampler = _downloads = _batch = None
+_daemon_waiters = None  # What waits for find_daemon(); None until it starts
+
+
+def exe_index():
+    global _exe_index
+    if _exe_index is None:
+        from tuxport.indexer import ExeIndex
+        _exe_index = ExeIndex()
+    return _exe_index
+
+
+def start_indexing():
+    from tuxport.indexer import default_roots
+    exe_index().start_background(default_roots(settings))  # Cheap when nothing changed
+
+
+def pe_cache():
+    global _pe_cache
+    if _pe_cache is None:
+        from tuxport.pe import PECache
+        _pe_cache = PECache()
+    return _pe_cache
+
+
+def icon_cache():
+    global _icon_cache
+    if _icon_cache is None:
+        from tuxport.icons import IconCache
+        _icon_cache = IconCache()
+    return _icon_cache
+
+
+def custom_file_explorer(initialdir=None):
+    from tuxport import explorer
+    start_indexing()
+    return explorer.custom_file_explorer(root, initialdir or settings.get("default_folder"), exe_index(), pe_cache(),
+                                         icon_cache())
+
+
+def wine_runtime():
+    global _wine_runtime
+    if _wine_runtime is None:
+        from tuxport.wine import WineRuntime
+        _wine_runtime = WineRuntime.from_settings(settings)
+    return _wine_runtime
+
+
+def is_wine_installed():
+    # Cached per Wine binary (path + mtime); only a new Wine runs --version again
+    return wine_runtime().is_installed()
+
+
+def prefix_pool():
+    global _prefix_pool
+    if _prefix_pool is None:
+        from tuxport.prefixes import PrefixPool
+        _prefix_pool = PrefixPool.from_settings(wine_runtime(), settings)
+    return _prefix_pool
+
+
+def prefix_for(exe):
+    # Each app gets its own prefix cloned from the template; None means the shared one
+    if not settings.get("prefix_isolation", True):
+        return None
+    return prefix_pool().prefix_for(exe)
+
+
+def app_library():
+    global _app_library
+    if _app_library is None:
+        from tuxport.library import Library
+        _app_library = Library()
+    return _app_library
+
+
+def library_prefixes():
+    from tuxport.library import known_prefixes
+    return known_prefixes(wine_runtime(), prefix_pool())
+
+
+def show_library():
+    from tuxport import dialogs
+    dialogs.show_library(root, app_library(), library_prefixes(), launch_installed)
+
+
+def launch_installed(app):
+    # In the app's own prefix, with the arguments and folder its shortcut gives
+    from tuxport.library import split_args
+    launch_app(app.exe, name=app.name, prefix=app.prefix, args=split_args(app.args),
+               cwd=app.workdir or os.path.dirname(app.exe))
+
+
+def find_daemon(then=None):
+    # Looks for a running daemon once, on a worker: a wedged one must not freeze the
+    # window. Returns True once the answer is in; until then, then() waits for it.
+    global _daemon_waiters
+    if _daemon is not None:
+        return True
+    if _daemon_waiters is None:
+        _daemon_waiters = []
+        if settings.get("use_daemon", True):
+            from tuxport import daemon
+            in_background(lambda: daemon.connect(settings), daemon_found)
+        else:
+            root.after_idle(daemon_found, None)
+    if then is not None:
+        _daemon_waiters.append(then)
+    return False
+
+
+def daemon_found(client):
+    global _daemon
+    _daemon = client if client and not isinstance(client, Exception) else False
+    waiters = _daemon_waiters[:]
+    _daemon_waiters.clear()
+    for waiter in waiters:
+        waiter()
+
+
+def daemon_client():
+    # With a daemon running, it does the downloads, installs and launches for every
+    # window and script; None means this window does them, or find_daemon() has not
+    # answered yet (_daemon is False once it found none)
+    return _daemon or None
+
+
+def daemon_feed():
+    global _daemon_feed
+    if _daemon_feed is None:
+        from tuxport.daemon import StatusFeed
+        _daemon_feed = StatusFeed(daemon_client().path)
+        _daemon_feed.attach(root)
+    return _daemon_feed
+
+
+def process_supervisor():
+    global _supervisor
+    if _supervisor is None:
+        if daemon_client() is not None:
+            from tuxport.daemon import RemoteSupervisor
+            _supervisor = RemoteSupervisor(daemon_client(), daemon_feed())
+        else:
+            from tuxport.supervisor import ProcessSupervisor
+            _supervisor = ProcessSupervisor(wine_runtime())
+            _supervisor.attach(root)
+        _supervisor.listeners.append(on_app_update)
+        root.after(1000, refresh_app_rows)
+    return _supervisor
+
+
+def resource_sampler():
+    # Stays None while sampling is switched off (sampler_interval 0)
+    global _sampler
+    interval = settings.get("sampler_interval", 1.0)
+    if _sampler is None and interval:
+        from tuxport.sampler import ResourceSampler
+        _sampler = ResourceSampler(process_supervisor(), interval)
+        _sampler.start()
+    return _sampler
+
+
+def download_manager():
+    global _downloads
+    if _downloads is None:
+        if daemon_client() is not None:
+            from tuxport.daemon import RemoteDownloads
+            _downloads = RemoteDownloads(daemon_client(), daemon_feed())
+        else:
+            from tuxport.cache import InstallerCache
+            from tuxport.downloads import DownloadManager
+            _downloads = DownloadManager(
+                connections=settings.get("download_connections", 4),
+                cache=InstallerCache.from_settings(settings),
+                sidecar=settings.get("checksum_sidecar", True),
+            )
+            _downloads.attach(root)
+    return _downloads
+
+
+def batch_queue():
+    global _batch
+    if _batch is None:
+        if daemon_client() is not None:
+            from tuxport.daemon import RemoteBatch
+            _batch = RemoteBatch(daemon_client(), daemon_feed())
+        else:
+            from tuxport.batch import BatchQueue
+            _batch = BatchQueue(process_supervisor(), concurrency=settings.get("install_concurrency", 2),
+                                prefix_for=lambda path: prefix_for(path) or wine_runtime().prefix)
+            _batch.attach(root)
+        _batch.on_progress = on_batch_progress
+        _batch.on_finished = on_batch_finished
+    return _batch
+
+# --- Running apps ---
+
+app_rows = {}
+GRAPH_WIDTH, GRAPH_HEIGHT = 120, 22
+LAUNCH_POLL_MS = 50
+
+
+def launch_app(exe, name=None, prefix=None, args=(), cwd=None):
+    # Never waits for the program: it shows up in the running-apps panel instead
+    from tuxport import pe
+    if not find_daemon(lambda: launch_app(exe, name, prefix, args, cwd)):
+        return
+    # Headers only: rejects broken or non-Windows files before paying for a Wine start-up
+    problem = pe.problem(pe.inspect(exe, scan=False))
+    if problem:
+        messagebox.showerror("Cannot Run", f"{os.path.basename(exe)} cannot be run with Wine:\n{problem}.")
+        return
+    supervisor = process_supervisor()
+    if daemon_client() is not None:
+        # The daemon picks the prefix, cloning it on a first launch, so the request goes from a worker
+        def launched(app):
+            if isinstance(app, Exception):
+                messagebox.showerror("Error", f"The TuxPort daemon could not run {os.path.basename(exe)}.\n{app}")
+            elif app.timing:
+                print(f"[INFO] Launched {app.timing} (daemon)", file=sys.stderr)
+        in_background(lambda: supervisor.launch(exe, prefix, name=name, args=args, cwd=cwd), launched)
+        return
+    if prefix is not None or not settings.get("prefix_isolation", True):
+        start_app(exe, name, prefix, args, cwd)
+        return
+    # A first launch clones the app's prefix from the template, which can take seconds:
+    # that runs on a worker, and the app is started from the Tk thread once it is ready
+    def resolved(found):
+        if isinstance(found, Exception):
+            messagebox.showerror("Error", f"Could not prepare a Wine prefix for {os.path.basename(exe)}.\n{found}")
+        else:
+            start_app(exe, name, found, args, cwd)
+    in_background(lambda: prefix_for(exe), resolved)
+
+
+def in_background(work, done):
+    # work() runs on a worker; done() gets its result, or what it raised, on the Tk thread
+    result = queue.Queue()
+
+    def run():
+        try:
+            result.put(work())
+        except Exception as e:
+            result.put(e)
+
+    def wait():
+        try:
+            value = result.get_nowait()
+        except queue.Empty:
+            root.after(LAUNCH_POLL_MS, wait)
+            return
+        done(value)
+    threading.Thread(target=run, name="tuxport-launch", daemon=True).start()
+    root.after(LAUNCH_POLL_MS, wait)
+
+
+def start_app(exe, name, prefix, args, cwd):
+    from tuxport.wine import WineNotFound
+    if prefix is not None and settings.get("prefix_isolation", True):
+        prefix_pool().touch(prefix)  # A library launch names its prefix; prefix_for records the rest
+    try:
+        app = process_supervisor().launch(exe, prefix, name=name, args=args, cwd=cwd)
+    except (FileNotFoundError, WineNotFound):
+        messagebox.showerror("Wine Not Found", "Wine is not installed or not in PATH.")
+        return None
+    except OSError as e:
+        messagebox.showerror("Error", f"Failed to run {exe}.\n{e}")
+        return None
+    print(f"[INFO] Launched {app.timing}", file=sys.stderr)
+    return app
+
+
+def format_uptime(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def app_row_text(app):
+    if app.running:
+        text = f"▶ {app.name} – PID {app.pid} – {format_uptime(app.uptime)}"
+        sampler = resource_sampler()
+        if sampler is not None:
+            from tuxport.sampler import format_usage
+            usage = format_usage(sampler.get(app.id))
+            if usage:
+                text += f" – {usage}"
+        return text
+    how = "killed" if app.killed else f"exited with code {app.returncode}"
+    return f"■ {app.name} – {how} after {format_uptime(app.uptime)}"
+
+
+def on_app_update(app):
+    # Runs on the Tk thread via process_supervisor().poll()
+    row = app_rows.get(app.id)
+    if row is None:
+        if not app.running:
+            return
+        row = {"frame": ttk.Frame(apps_frame, style='TFrame')}
+        row["frame"].pack(fill='x', pady=2)
+        row["label"] = ttk.Label(row["frame"], style='TLabel', anchor='w')
+        row["label"].pack(side='left', fill='x', expand=True)
+        if resource_sampler() is not None:
+            row["graph"] = tk.Canvas(row["frame"], width=GRAPH_WIDTH, height=GRAPH_HEIGHT, bg=BG, highlightthickness=0)
+            row["graph"].pack(side='left', padx=(6, 0))
+        row["action"] = ttk.Button(row["frame"], text="Kill", width=8, command=lambda: process_supervisor().kill(app.id))
+        row["action"].pack(side='right', padx=(6, 0))
+        ttk.Button(row["frame"], text="Output", width=8, command=lambda: show_app_output(app)).pack(side='right', padx=(6, 0))
+        app_rows[app.id] = row
+        apps_frame.pack(fill='x', pady=(0, 10), after=download_btn)
+    row["label"].config(text=app_row_text(app))
+    if not app.running:
+        row["action"].config(text="Dismiss", command=lambda: dismiss_app(app))
+
+
+def dismiss_app(app):
+    row = app_rows.pop(app.id, None)
+    if row:
+        row["frame"].destroy()
+    process_supervisor().forget(app.id)
+    if not app_rows:
+        apps_frame.pack_forget()
+
+
+def draw_usage_graph(canvas, usage):
+    # CPU in the accent colour (scaled to at least one core), RSS behind it scaled to its own peak
+    canvas.delete("all")
+    if usage is None or usage.history.count < 2:
+        return
+    for metric, color, floor in (("rss", LABEL, 1), ("cpu", ACCENT, 100)):
+        values = usage.history.series(metric)
+        top = max(max(values), floor)
+        step = GRAPH_WIDTH / (usage.history.size - 1)
+        x0 = GRAPH_WIDTH - step * (len(values) - 1)
+        points = []
+        for i, value in enumerate(values):
+            points += [x0 + i * step, GRAPH_HEIGHT - 1 - value / top * (GRAPH_HEIGHT - 2)]
+        canvas.create_line(*points, fill=color)
+
+
+def refresh_app_rows():
+    sampler = _sampler
+    for app_id, row in app_rows.items():
+        app = process_supervisor().apps.get(app_id)
+        if app is not None and app.running:
+            row["label"].config(text=app_row_text(app))
+            if sampler and "graph" in row:
+                draw_usage_graph(row["graph"], sampler.get(app_id))
+    root.after(1000, refresh_app_rows)
+
+# --- Dialogs (tuxport.dialogs is imported on first use) ---
+
+def show_app_output(app):
+    from tuxport import dialogs
+    dialogs.show_app_output(root, app)
+
+
+def prompt_install_wine():
+    from tuxport import dialogs
+    dialogs.prompt_install_wine(root)
+
+
+def show_about():
+    from tuxport import dialogs
+    dialogs.show_about(root)
+
+
+def apply_settings(s):
+    save_settings(s)
+    settings.update(s)
+    trace.configure(settings)
+    if _wine_runtime is not None:
+        _wine_runtime.wine_path = s["wine_path"]
+    if _sampler is not None and s.get("sampler_interval"):
+        _sampler.interval = s["sampler_interval"]
+    apply_theme(s["theme"])
+
+
+def show_settings():
+    from tuxport import dialogs
+    dialogs.show_settings(root, settings, apply_settings)
+
+# --- Downloads ---
+
+download_rows = {}
+
+
+def on_download_update(job):
+    # Runs on the Tk thread via download_manager().poll()
+    from tuxport import downloads
+    from tuxport.integrity import ChecksumMismatch
+    from tuxport.progress import format_eta, format_rate, format_size
+    row = download_rows.get(job.id)
+    if row is None:
+        return
+    if job.state in (downloads.QUEUED, downloads.RUNNING, downloads.PAUSED):
+        bar = row["progress"]
+        if job.total:
+            if str(bar['mode']) != 'determinate':
+                bar.stop()
+                bar.config(mode='determinate')
+            bar['value'] = job.downloaded * 100 / job.total
+            detail = f"{format_size(job.downloaded)} / {format_size(job.total)}"
+        else:
+            # Size unknown (no Content-Length, or still resolving): just show activity
+            if job.state == downloads.RUNNING and str(bar['mode']) != 'indeterminate':
+                bar.config(mode='indeterminate')
+                bar.start(50)
+            detail = format_size(job.downloaded)
+        if job.state == downloads.RUNNING and job.downloaded:
+            detail += f" – {format_rate(job.rate)}"
+            if job.total:
+                detail += f", {format_eta(job.eta)} left"
+        row["label"].config(text=f"{job.name} – {job.state} – {detail}")
+        row["pause"].config(text="Resume" if job.state == downloads.PAUSED else "Pause")
+        return
+    row["frame"].destroy()
+    del download_rows[job.id]
+    if not download_rows:
+        downloads_frame.pack_forget()
+        file_label.config(text="Select and run a Windows installer (.exe) using Wine.")
+    if job.state == downloads.DONE:
+        state = "Running cached copy of" if job.cache_hit else "Download complete. Running"
+        verified = f" (checksum verified from {job.verified})" if job.verified else ""
+        what = f"{os.path.basename(job.path)} from {job.name}" if job.archive else job.name
+        file_label.config(text=f"{state} {what}{verified}...")
+        launch_app(job.path, name=job.name)
+    elif job.state == downloads.FAILED and root.winfo_exists():
+        if isinstance(job.error, downloads.NoInstallerFound):
+            messagebox.showerror("No .exe Found", str(job.error))
+        elif isinstance(job.error, ChecksumMismatch):
+            messagebox.showerror("Checksum Mismatch", f"{job.name} was deleted because it does not match its checksum.\n{job.error}")
+        else:
+            messagebox.showerror("Error", f"Failed to download or run installer.\n{job.error}")
+
+
+def add_download_row(job):
+    from tuxport import downloads
+    row = {"frame": ttk.Frame(downloads_frame, style='TFrame')}
+    row["frame"].pack(fill='x', pady=2)
+    row["label"] = ttk.Label(row["frame"], text=f"{job.name} – queued", style='TLabel', anchor='w')
+    row["label"].pack(fill='x')
+    row["progress"] = ttk.Progressbar(row["frame"], orient='horizontal', mode='determinate', length=300, maximum=100)
+    row["progress"].pack(side='left', fill='x', expand=True, pady=(2, 0))
+    def toggle_pause():
+        if job.state == downloads.PAUSED:
+            job.resume()
+        else:
+            job.pause()
+    row["pause"] = ttk.Button(row["frame"], text="Pause", command=toggle_pause, width=8)
+    row["pause"].pack(side='left', padx=(6, 0))
+    ttk.Button(row["frame"], text="Cancel", command=job.cancel, width=8).pack(side='left', padx=(6, 0))
+    download_rows[job.id] = row
+
+
+def download_and_run():
+    url = url_entry.get()
+    if not url:
+        if root.winfo_exists():
+            messagebox.showerror("Invalid URL", "Please enter a URL.")
+        return
+    if not find_daemon(download_and_run):
+        return
+    # The page fetch, download and hand-off all happen on download_manager's
+    # worker threads; on_download_update reports back through root.after.
+    url_entry.delete(0, tk.END)
+
+    def submitted(job):
+        if isinstance(job, Exception):
+            messagebox.showerror("Error", f"Could not start the download.\n{job}")
+            return
+        downloads_frame.pack(fill='x', pady=(0, 10), after=file_label)
+        add_download_row(job)
+        file_label.config(text="Downloading... You can keep using TuxPort.")
+        on_download_update(job)  # Updates that came before the row did
+    manager = download_manager()
+    submit_to_service(lambda: manager.submit(url, on_update=on_download_update), submitted)
+
+
+def submit_to_service(submit, done):
+    # The daemon's services answer over its socket, so they are asked from a worker;
+    # the in-process ones take a job at once
+    if daemon_client() is None:
+        done(submit())
+    else:
+        in_background(submit, done)
+
+# --- Drag-and-drop batch installs ---
+
+batch_rejected = []
+
+
+def on_drop(event):
+    # One drop, one queue: installers run in the background, one per prefix
+    # at a time, and a single summary appears when the whole batch is done.
+    from tuxport import archives, pe
+    if not find_daemon(lambda: on_drop(event)):
+        return
+    from tuxport.batch import parse_drop_list
+    valid = []
+    for f in parse_drop_list(event.data):
+        # The header decides, not the file name; a header read is a few pages at most
+        if os.path.isfile(f) and (archives.is_archive(f) or pe.problem(pe.inspect(f, scan=False)) is None):
+            valid.append(f)
+        else:
+            batch_rejected.append(f)
+    if valid:
+        installs = batch_queue()
+        submit_to_service(lambda: installs.submit(valid), lambda jobs: None)  # Progress comes through on_batch_progress
+    elif batch_rejected and batch_queue().idle:
+        messagebox.showerror("Invalid File", "Please drop Windows programs (.exe) or archives holding one. Got:\n"
+                             + "\n".join(batch_rejected))
+        batch_rejected.clear()
+
+
+def on_batch_progress(queue):
+    from tuxport import batch
+    counts = queue.counts()
+    total = len(queue.jobs)
+    finished = sum(counts[s] for s in batch.FINISHED_STATES)
+    batch_progress['maximum'] = total
+    batch_progress['value'] = finished
+    batch_label.config(text=f"Installing {finished}/{total} – {counts[batch.RUNNING]} running, "
+                            f"{counts[batch.WAITING] + counts[batch.EXTRACTING] + counts[batch.HASHING] + counts[batch.PENDING]} queued")
+    batch_frame.pack(fill='x', pady=(0, 10), after=download_btn)
+
+
+def on_batch_finished(jobs):
+    from tuxport import batch
+    batch_frame.pack_forget()
+    summary = batch.summarize(jobs)
+    if batch_rejected:
+        summary += "\n\nNot installers:\n" + "\n".join(batch_rejected)
+        batch_rejected.clear()
+    messagebox.showinfo("Batch Install Finished", summary)
+
+# --- Window ---
+
+def select_exe():
+    # The explorer hands back a program, including one it extracted from an archive
+    exe = custom_file_explorer()
+    if not exe:
+        return
+    if not is_wine_installed():
+        prompt_install_wine()
+        return
+    launch_app(exe)
+
+
+def build():
+    global root, style, file_label, downloads_frame, url_entry, download_btn
+    global apps_frame, batch_frame, batch_label, batch_progress
+    try:
+        from tkinterdnd2 import DND_FILES, TkinterDnD
+        root = TkinterDnD.Tk()
+        dnd_available = True
+    except (ImportError, RuntimeError, tk.TclError):
+        # tkdnd missing or broken: the window still comes up, just without drops
+        root = tk.Tk()
+        dnd_available = False
+
+    # Set window icon using the provided logo
+    try:
+        logo_img = tk.PhotoImage(file="Tux and Windows in Harmony.png")
+        root.iconphoto(True, logo_img)
+        print("[INFO] App icon loaded: Tux and Windows in Harmony.png", file=sys.stderr)
+    except Exception as e:
+        print(f"[ERROR] Could not load logo: {e}", file=sys.stderr)
+
+    root.title("TuxPort – Windows App Installer for Linux")
+    root.configure(bg=BG)
+    # Let window size itself to content, but set a minimum size to avoid being too small
+    root.update_idletasks()
+    root.minsize(root.winfo_reqwidth(), root.winfo_reqheight())
+
+    style = ttk.Style()
+    style.theme_use("clam")
+    style.configure("TButton", font=FONT_BUTTON, padding=10, foreground=FG, background=ACCENT)
+    style.map("TButton", background=[("active", ACCENT)])
+    style.configure("TLabel", background=BG, foreground=FG, font=FONT_LABEL)
+    style.configure("TFrame", background=BG)
+
+    # Main container for padding
+    container = ttk.Frame(root, padding=(32, 24, 32, 24), style='TFrame')
+    container.pack(fill='both', expand=True)
+
+    # Title and subtitle
+    header = ttk.Frame(container, style='TFrame')
+    header.pack(fill='x', pady=(0, 8))
+
+    title = tk.Label(header, text="TuxPort", font=FONT_TITLE, bg=BG, fg=ACCENT, anchor='center', justify='center')
+    title.pack(pady=(0, 2), fill='x')
+
+    subtitle = tk.Label(header, text="Open Source Windows App Installer for Linux", font=FONT_SUBTITLE, bg=BG, fg=LABEL, anchor='center', justify='center')
+    subtitle.pack(pady=(0, 10), fill='x')
+
+    # Description
+    desc = tk.Label(
+        container,
+        text="TuxPort is open source software.\nIt uses Wine (also open source) to run Windows applications on Linux.",
+        font=FONT_DESC,
+        bg=BG,
+        fg=FG,
+        wraplength=440,
+        anchor='center',
+        justify='center'
+    )
+    desc.pack(pady=(0, 18), fill='x')
+
+    # File install section
+    file_frame = ttk.Frame(container, style='TFrame')
+    file_frame.pack(fill='x', pady=(0, 10))
+
+    file_label = ttk.Label(file_frame, text="Select and run a Windows installer (.exe) using Wine.", style='TLabel', wraplength=440, anchor='center', justify='center')
+    file_label.pack(pady=(0, 8), fill='x')
+
+    downloads_frame = ttk.Frame(file_frame, style='TFrame')  # One row per active download, hidden when idle
+
+    browse_btn = ttk.Button(file_frame, text="📁  Browse and Run .exe", command=select_exe, style='TButton')
+    browse_btn.pack(fill="x")
+
+    library_btn = ttk.Button(file_frame, text="📚  Installed Apps", command=show_library, style='TButton')
+    library_btn.pack(fill="x", pady=(6, 0))
+
+    # URL input
+    url_frame = ttk.Frame(container, style='TFrame')
+    url_frame.pack(fill='x', pady=(18, 0))
+
+    url_label = ttk.Label(url_frame, text="Or enter a direct .exe download link (add #sha256=<hash> to verify it):", style='TLabel', anchor='center', justify='center')
+    url_label.pack(pady=(0, 4), fill='x')
+
+    url_entry = ttk.Entry(url_frame, width=54, font=FONT_LABEL)
+    url_entry.pack(fill='x', ipady=6)
+
+    # --- Download and Run .exe button ---
+    download_btn = ttk.Button(container, text="⬇️  Download and Run .exe", command=download_and_run, style='TButton')
+    download_btn.pack(pady=18, fill="x")
+
+    apps_frame = ttk.Frame(container, style='TFrame')  # Running apps panel, hidden when nothing runs
+
+    batch_frame = ttk.Frame(container, style='TFrame')  # Aggregated progress for dropped installers
+    batch_label = ttk.Label(batch_frame, style='TLabel', anchor='w')
+    batch_label.pack(fill='x')
+    batch_progress = ttk.Progressbar(batch_frame, orient='horizontal', mode='determinate', length=400)
+    batch_progress.pack(fill='x', pady=(2, 0))
+
+    # --- Drag-and-drop support ---
+    if dnd_available:
+        root.drop_target_register(DND_FILES)
+        root.dnd_bind('<<Drop>>', on_drop)
+    else:
+        # A hint instead of a modal: the window stays usable right away
+        print("[INFO] Drag-and-drop unavailable; install the 'tkinterdnd2' package to enable it.", file=sys.stderr)
+        tk.Label(container, text="Tip: install 'tkinterdnd2' to drop installers onto this window.",
+                 font=FONT_DESC, bg=BG, fg=LABEL).pack(side='bottom', fill='x')
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    root.bind("<Map>", on_first_frame, add="+")
+    return root
+
+
+def on_first_frame(event):
+    if event.widget is not root:
+        return
+    root.unbind("<Map>")
+    elapsed = process_age_ms()
+    verdict = "within" if elapsed <= FIRST_FRAME_TARGET_MS else "over"
+    trace.record("first_frame", elapsed, target_ms=FIRST_FRAME_TARGET_MS)
+    print(f"[INFO] First frame after {elapsed:.0f} ms ({verdict} the {FIRST_FRAME_TARGET_MS} ms target)", file=sys.stderr)
+    # Background start-up work, now that the window is on screen
+    find_daemon(prewarm)
+    root.after(1000, start_indexing)
+    root.after(3000, lambda: app_library().start_background(library_prefixes()))
+    if settings.get("prefix_isolation", True):
+        root.after(2000, start_prefix_upkeep)
+    if os.environ.get("TUXPORT_EXIT_AFTER_FIRST_FRAME"):
+        root.after_idle(on_close)  # Start-up benchmarks
+
+
+def prewarm():
+    # wineserver -p in the background, for the prefix launches will use; a daemon keeps its own
+    if daemon_client() is not None:
+        return
+    if settings.get("prefix_isolation", True):
+        prefix_pool().prewarm()  # Each app's own prefix is warmed by prefix_for
+    else:
+        wine_runtime().prewarm()
+
+
+def start_prefix_upkeep():
+    # Build the template once, and drop prefixes nobody has used in a while
+    pool = prefix_pool()
+    pool.ensure_template()
+    running = _supervisor.running() if _supervisor is not None else []
+    pool.start_gc(settings.get("prefix_gc_after_days", 0), keep=[app.prefix for app in running])
+
+
+def on_close():
+    if _downloads is not None:
+        _downloads.shutdown()
+    root.destroy()
+
+
+def main(argv=None):
+    build()
+    root.mainloop()
+    return 0
@@ -0,0 +1,440 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Installers shipped inside .zip, .7z and .tar.* bundles.
+
+``members()`` lists an archive without extracting anything: a zip is read
+from its central directory, a tar is decompressed but nothing is written,
+and a 7z is listed by the ``7z`` tool. ``extract()`` then streams only the
+chosen program's folder into the cache: the .exe, the files beside it and
+the subfolders installers load their data from. A program at the root of
+the archive gets only the files beside it, since the subfolders of a root
+are often whole unrelated trees. The rest of the bundle is never written
+out. Folders are extracted once per archive.
+
+Tars are read front to back, so they can be unpacked while they download:
+``Tail`` follows the written prefix of the ``.part`` file (see
+ranged.download) and ``StreamExtractor`` unpacks the folders that hold a
+program from it into a staging folder. A zip or 7z keeps its index at the
+end, so those wait for the download to finish.
+"""
+
+import collections
+import hashlib
+import os
+import shutil
+import subprocess
+import threading
+
+from tuxport.cache import CACHE_DIR
+
+EXTRACT_DIR = os.path.join(CACHE_DIR, "extracted")
+ARCHIVE_SUFFIXES = (".zip", ".7z", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+STREAMABLE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+SEVEN_ZIP_TOOLS = ("7zz", "7z", "7za")
+COPY_CHUNK = 1024 * 1024
+PICKED_FILE = "picked"
+MAGIC = (
+    (b"PK\x03\x04", "zip"), (b"PK\x05\x06", "zip"), (b"7z\xbc\xaf\x27\x1c", "7z"),
+    (b"\x1f\x8b", "tar"), (b"BZh", "tar"), (b"\xfd7zXZ\x00", "tar"),
+)
+
+Member = collections.namedtuple("Member", "name size")
+
+
+class ArchiveError(Exception):
+    pass
+
+
+class NoProgramFound(ArchiveError):
+    pass
+
+
+def is_archive_name(name):
+    return name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def kind(path):
+    """``"zip"``, ``"7z"`` or ``"tar"`` from the file's first bytes, or None."""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(512)
+    except OSError:
+        return None
+    for magic, name in MAGIC:
+        if head.startswith(magic):
+            return name
+    return "tar" if head[257:262] == b"ustar" else None
+
+
+def is_archive(path):
+    return kind(path) is not None
+
+
+def _parts(name):
+    # Member names are untrusted: no absolute paths, drive letters or ".." may leave the folder
+    parts = [p for p in name.replace("\\", "/").split("/") if p not in ("", ".")]
+    if not parts or ".." in parts or name.startswith(("/", "\\")) or ":" in parts[0]:
+        return None
+    return parts
+
+
+def _error(path, e):
+    return ArchiveError(f"{os.path.basename(path)}: {e}")
+
+
+def members(path):
+    """The files in the archive at ``path``, as Members, without extracting them."""
+    archive_kind = kind(path)
+    if archive_kind == "zip":
+        import zipfile
+        try:
+            with zipfile.ZipFile(path) as z:
+                return [Member(i.filename, i.file_size) for i in z.infolist() if not i.is_dir()]
+        except (zipfile.BadZipFile, OSError) as e:
+            raise _error(path, e) from e
+    if archive_kind == "tar":
+        import tarfile
+        try:
+            with tarfile.open(path) as t:
+                return [Member(m.name, m.size) for m in t if m.isfile()]
+        except (tarfile.TarError, EOFError, OSError) as e:
+            raise _error(path, e) from e
+    if archive_kind == "7z":
+        return _seven_zip_members(path)
+    raise ArchiveError(f"{os.path.basename(path)} is not a .zip, .7z or .tar archive")
+
+
+def programs(items):
+    """The .exe members of ``items``, the most likely installer first."""
+    from tuxport.links import INSTALLER_WORDS
+
+    def rank(member):
+        parts = _parts(member.name)
+        base = parts[-1].lower()
+        uninstall = "uninstall" in base
+        installer = not uninstall and any(w in base for w in INSTALLER_WORDS)
+        return (not installer, uninstall, len(parts), base)
+
+    return sorted((m for m in items if m.name.lower().endswith(".exe") and _parts(m.name)), key=rank)
+
+
+def _in_folder(parts, base):
+    # Below a program's folder, or only beside it when the folder is the archive's root
+    if not base:
+        return len(parts) == 1
+    return len(parts) > len(base) and tuple(parts[:len(base)]) == tuple(base)
+
+
+def folder(items, exe):
+    """``exe`` and every file beside or below it in its folder (only beside it at the root)."""
+    base = _parts(exe)[:-1]
+    wanted = []
+    for m in items:
+        parts = _parts(m.name)
+        if parts and _in_folder(parts, base):
+            wanted.append(m)
+    return wanted
+
+
+def _pick(items, path, exe=None):
+    if exe is None:
+        found = programs(items)
+        if not found:
+            raise NoProgramFound(f"No .exe found in {os.path.basename(path)}.")
+        return found[0].name
+    if _parts(exe) is None or exe not in {m.name for m in items}:
+        raise ArchiveError(f"{exe} is not in {os.path.basename(path)}")
+    return exe
+
+
+def local_key(path):
+    # Local archives are keyed by identity rather than content: hashing a large bundle costs more than extracting
+    st = os.stat(path)
+    identity = f"{os.path.realpath(path)}\0{st.st_size}\0{st.st_mtime_ns}"
+    return "local-" + hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+
+
+def extraction_dir(root, key, exe):
+    base = "/".join(_parts(exe)[:-1])
+    return os.path.join(root, key, hashlib.sha256(base.encode("utf-8")).hexdigest()[:12] if base else "top")
+
+
+def _picked(root, key):
+    try:
+        with open(os.path.join(root, key, PICKED_FILE), 'r', encoding="utf-8") as f:
+            target = os.path.join(root, key, f.read().strip())
+    except OSError:
+        return None
+    return target if os.path.isfile(target) else None
+
+
+def _remember_pick(root, key, target):
+    try:
+        with open(os.path.join(root, key, PICKED_FILE), 'w', encoding="utf-8") as f:
+            f.write(os.path.relpath(target, os.path.join(root, key)))
+    except OSError:
+        pass
+    return target
+
+
+def _target(stage, parts):
+    out = os.path.join(stage, *parts)
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    return out
+
+
+def _copy(src, out):
+    with open(out, 'wb') as dst:
+        shutil.copyfileobj(src, dst, COPY_CHUNK)
+
+
+def _check_space(root, needed):
+    os.makedirs(root, exist_ok=True)
+    free = shutil.disk_usage(root).free
+    if needed > free:
+        from tuxport.progress import format_size
+        raise ArchiveError(f"extracting needs {format_size(needed)} but only {format_size(free)} is free")
+
+
+def _publish(stage, exe, dest):
+    # The staged folder becomes the cached one in a single rename, so a half-extracted folder is never used
+    src = os.path.join(stage, *_parts(exe)[:-1])
+    target = os.path.join(dest, _parts(exe)[-1])
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    try:
+        os.rename(src, dest)
+    except OSError:
+        if not os.path.isfile(target):  # Otherwise another extraction got there first
+            raise
+    return target
+
+
+def extract(path, exe=None, key=None, root=EXTRACT_DIR):
+    """Extract ``exe`` (default: the best program) and its folder; returns the extracted .exe's path.
+
+    ``key`` names the archive in ``root``, e.g. its SHA-256; by default it is
+    derived from the path, size and mtime. A folder already extracted under
+    the same key is reused.
+    """
+    key = key or local_key(path)
+    if exe is None:
+        # The program picked last time, so a repeat needs no listing (a tar would be decompressed for it)
+        picked = _picked(root, key)
+        if picked is not None:
+            return picked
+    items = members(path)
+    exe = _pick(items, path, exe)
+    dest = extraction_dir(root, key, exe)
+    target = os.path.join(dest, _parts(exe)[-1])
+    if os.path.isfile(target):
+        return _remember_pick(root, key, target)
+    wanted = folder(items, exe)
+    _check_space(root, sum(m.size for m in wanted))
+    stage = f"{dest}.part-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(stage, ignore_errors=True)
+    try:
+        extractor = {"zip": _extract_zip, "tar": _extract_tar, "7z": _extract_seven_zip}[kind(path)]
+        extractor(path, wanted, stage)
+        return _remember_pick(root, key, _publish(stage, exe, dest))
+    finally:
+        shutil.rmtree(stage, ignore_errors=True)
+
+
+def _extract_zip(path, wanted, stage):
+    import zipfile
+    try:
+        with zipfile.ZipFile(path) as z:
+            for m in wanted:
+                with z.open(m.name) as src:
+                    _copy(src, _target(stage, _parts(m.name)))
+    except (zipfile.BadZipFile, RuntimeError, EOFError) as e:  # RuntimeError: encrypted member
+        raise _error(path, e) from e
+
+
+def _extract_tar(path, wanted, stage):
+    import tarfile
+    left = {m.name for m in wanted}
+    try:
+        with tarfile.open(path) as t:
+            for info in t:
+                if info.name in left and info.isfile():
+                    _copy(t.extractfile(info), _target(stage, _parts(info.name)))
+                    left.discard(info.name)
+                    if not left:
+                        break  # No need to decompress the rest
+    except (tarfile.TarError, EOFError) as e:
+        raise _error(path, e) from e
+
+
+def _seven_zip():
+    for tool in SEVEN_ZIP_TOOLS:
+        found = shutil.which(tool)
+        if found:
+            return found
+    raise ArchiveError("opening .7z archives needs 7-Zip (7zz, 7z or 7za) in PATH")
+
+
+def _run_seven_zip(path, args):
+    result = subprocess.run([_seven_zip()] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            stdin=subprocess.DEVNULL, text=True, errors="replace")
+    if result.returncode != 0:
+        message = (result.stderr.strip() or result.stdout.strip()).splitlines()
+        raise _error(path, message[-1] if message else f"7-Zip exited with code {result.returncode}")
+    return result.stdout
+
+
+def _seven_zip_members(path):
+    # "-slt" prints one "Key = value" block per entry after the "----------" line
+    out = _run_seven_zip(path, ["l", "-slt", "-sccUTF-8", "--", path])
+    items, entry = [], {}
+    for line in out.partition("\n----------\n")[2].splitlines() + [""]:
+        if line.strip():
+            key, _, value = line.partition(" = ")
+            entry[key.strip()] = value
+        elif entry:
+            if entry.get("Folder") != "+" and "Path" in entry:
+                items.append(Member(entry["Path"], int(entry.get("Size") or 0)))
+            entry = {}
+    return items
+
+
+def _extract_seven_zip(path, wanted, stage):
+    # 7-Zip streams just the listed members; -spd so names are not taken as wildcards
+    os.makedirs(stage, exist_ok=True)
+    listing = os.path.join(stage, ".members")
+    with open(listing, 'w', encoding="utf-8") as f:
+        f.write("".join(m.name + "\n" for m in wanted))
+    try:
+        _run_seven_zip(path, ["x", "-y", "-bd", "-spd", "-scsUTF-8", f"-o{stage}", "--", path, f"@{listing}"])
+    finally:
+        os.remove(listing)
+
+
+class Tail:
+    """The written prefix of a file that is still downloading, read from another thread.
+
+    ranged.download() calls ``start()``, ``advance()`` and ``finish()``;
+    ``read()`` blocks until the bytes it wants are on disk, returns b""
+    at the end of a finished download and raises if the download failed.
+    """
+
+    def __init__(self):
+        self.available = 0
+        self.position = 0
+        self.finished = False
+        self.error = None
+        self._fd = None
+        self._cond = threading.Condition()
+
+    def start(self, path):
+        # Opened by the downloader, so the .part file is held even once it is renamed
+        with self._cond:
+            if self._fd is None:
+                self._fd = os.open(path, os.O_RDONLY)
+            self._cond.notify_all()
+
+    def advance(self, end):
+        with self._cond:
+            if end > self.available:
+                self.available = end
+                self._cond.notify_all()
+
+    def finish(self, error=None):
+        with self._cond:
+            self.finished = True
+            self.error = error
+            self._cond.notify_all()
+
+    def read(self, n=-1):
+        with self._cond:
+            while not self.finished and (self._fd is None or self.position >= self.available):
+                self._cond.wait()
+            if self.error is not None:
+                raise ArchiveError(f"download stopped: {self.error}")
+            if self._fd is None or self.position >= self.available:
+                return b""
+            want = self.available - self.position
+            data = os.pread(self._fd, want if n is None or n < 0 else min(n, want), self.position)
+            self.position += len(data)
+            return data
+
+    def close(self):
+        with self._cond:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+class StreamExtractor:
+    """Unpacks the tar arriving through ``tail`` into ``stage`` on its own thread.
+
+    The program is only chosen once the whole listing is known, so only
+    folders that hold one are written: a file is kept once an .exe has been
+    seen in its folder or a folder above it, other than the root (with
+    ``exe`` given, only that program's folder). Files that came before their folder's .exe are just
+    listed. ``finish()`` reads the ones the chosen program needs from the
+    downloaded archive, then keeps its folder and drops the rest.
+    """
+
+    def __init__(self, tail, stage, exe=None):
+        self.tail = tail
+        self.stage = stage
+        self.exe = exe
+        self.members = []
+        self.staged = set()
+        self.error = None
+        # Folders, as tuples of parts, whose files are kept
+        self._homes = {tuple(_parts(exe)[:-1])} if exe and _parts(exe) else set()
+        shutil.rmtree(stage, ignore_errors=True)
+        self._thread = threading.Thread(target=self._run, name="tuxport-unpack", daemon=True)
+        self._thread.start()
+
+    def _keep(self, parts):
+        if self.exe is None and parts[-1].lower().endswith(".exe"):
+            self._homes.add(tuple(parts[:-1]))
+        return any(_in_folder(parts, home) for home in self._homes)
+
+    def _run(self):
+        import tarfile
+        try:
+            with tarfile.open(fileobj=self.tail, mode="r|*") as t:
+                for info in t:
+                    parts = _parts(info.name)
+                    if not (info.isfile() and parts):
+                        continue
+                    self.members.append(Member(info.name, info.size))
+                    if self._keep(parts):
+                        _check_space(os.path.dirname(self.stage), info.size)
+                        _copy(t.extractfile(info), _target(self.stage, parts))
+                        self.staged.add(info.name)
+        except Exception as e:  # Reported by finish(); the download itself carries on
+            self.error = e
+        finally:
+            self.tail.close()
+
+    def finish(self, path, key, root=EXTRACT_DIR):
+        """Wait for the unpacking to catch up, then publish the program's folder like extract()."""
+        self._thread.join()
+        try:
+            if self.error is not None:
+                raise self.error if isinstance(self.error, ArchiveError) else _error(path, self.error)
+            exe = _pick(self.members, path, self.exe)
+            dest = extraction_dir(root, key, exe)
+            target = os.path.join(dest, _parts(exe)[-1])
+            if not os.path.isfile(target):
+                # Siblings that were streamed past before the .exe showed its folder was wanted
+                missing = [m for m in folder(self.members, exe) if m.name not in self.staged]
+                if missing:
+                    _check_space(root, sum(m.size for m in missing))
+                    _extract_tar(path, missing, self.stage)
+                target = _publish(self.stage, exe, dest)
+            return _remember_pick(root, key, target)
+        finally:
+            shutil.rmtree(self.stage, ignore_errors=True)
+
+    def discard(self):
+        self.tail.finish(self.tail.error or ArchiveError("discarded"))
+        self._thread.join()
+        shutil.rmtree(self.stage, ignore_errors=True)
@@ -0,0 +1,222 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Batch install queue for multi-file drops.
+
+Dropped installers are de-duplicated by content hash and run on a small
+worker pool. Installers that share a WINEPREFIX run one after the other,
+because two installers writing to one prefix corrupt it; installers for
+different prefixes run in parallel. One whose prefix is busy waits in
+that prefix's pending queue, not on a worker, and is handed to the pool
+when the installer before it exits. A dropped archive
+is de-duplicated as a whole, then its installer is extracted
+(tuxport.archives) and run like any other.
+"""
+
+import collections
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlparse
+
+from tuxport import archives
+from tuxport.cache import sha256_file
+
+PENDING = "pending"
+HASHING = "hashing"
+EXTRACTING = "extracting"
+WAITING = "waiting"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+DUPLICATE = "duplicate"
+
+FINISHED_STATES = (DONE, FAILED, DUPLICATE)
+
+
+def parse_drop_list(data):
+    """Split a Tk drop list (a Tcl list) into paths.
+
+    Paths containing spaces arrive wrapped in braces, e.g.
+    ``{/home/me/My Setup.exe} /tmp/b.exe``; some sources send file:// URIs.
+    """
+    items, current, depth, escaped, in_item = [], [], 0, False, False
+    for ch in data:
+        if escaped:
+            current.append(ch)
+            escaped = False
+        elif ch == "\\":
+            escaped, in_item = True, True
+        elif ch == "{":
+            if depth > 0:
+                current.append(ch)
+            depth += 1
+            in_item = True
+        elif ch == "}" and depth > 0:
+            depth -= 1
+            if depth > 0:
+                current.append(ch)
+        elif ch.isspace() and depth == 0:
+            if in_item:
+                items.append("".join(current))
+                current, in_item = [], False
+        else:
+            current.append(ch)
+            in_item = True
+    if in_item:
+        items.append("".join(current))
+    paths = []
+    for item in items:
+        if item.startswith("file://"):
+            item = unquote(urlparse(item).path)
+        paths.append(item)
+    return paths
+
+
+class InstallJob:
+    def __init__(self, path, prefix=None):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.archive = None
+        self.prefix = prefix
+        self.sha256 = None
+        self.state = PENDING
+        self.app = None
+        self.returncode = None
+        self.error = None
+        self.duplicate_of = None
+
+    @property
+    def finished(self):
+        return self.state in FINISHED_STATES
+
+
+class BatchQueue:
+    """Runs dropped installers with ``concurrency`` workers, one per prefix at a time."""
+
+    def __init__(self, supervisor, concurrency=2, prefix_for=None):
+        self.supervisor = supervisor
+        self.concurrency = concurrency
+        self.prefix_for = prefix_for or (lambda path: supervisor.runtime.prefix)
+        self.jobs = []
+        self.on_progress = None
+        self.on_finished = None
+        self._pool = None
+        self._events = queue.Queue()
+        self._hashes = {}
+        self._hash_lock = threading.Lock()
+        self._prefix_lock = threading.Lock()  # Guards the two below
+        self._busy = set()  # Prefixes an installer is running in
+        self._pending = collections.defaultdict(collections.deque)  # Prefix -> jobs waiting for it
+
+    def submit(self, paths):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="tuxport-batch")
+        jobs = [InstallJob(p) for p in paths]
+        self.jobs.extend(jobs)
+        for job in jobs:
+            self._pool.submit(self._run, job)
+        self._events.put(None)
+        return jobs
+
+    def _set(self, job, state):
+        job.state = state
+        self._events.put(job)
+
+    def _run(self, job):
+        try:
+            self._set(job, HASHING)
+            job.sha256 = sha256_file(job.path)
+            with self._hash_lock:
+                first = self._hashes.setdefault(job.sha256, job)
+            if first is not job:
+                job.duplicate_of = first
+                self._set(job, DUPLICATE)
+                return
+            if archives.is_archive(job.path):
+                self._set(job, EXTRACTING)
+                job.archive = job.path
+                job.path = archives.extract(job.archive, key=job.sha256)
+            # Resolved on the worker: it may clone a fresh prefix for the app
+            job.prefix = self.prefix_for(job.path)
+        except Exception as e:
+            job.error = e
+            self._set(job, FAILED)
+            return
+        prefix = os.path.realpath(job.prefix)
+        with self._prefix_lock:
+            if prefix in self._busy:
+                # Give the worker back; the installer running there hands this job on
+                self._pending[prefix].append(job)
+                self._set(job, WAITING)
+                return
+            self._busy.add(prefix)
+        self._install(job, prefix)
+
+    def _install(self, job, prefix):
+        # The worker holds ``prefix`` for this job until the installer exits
+        try:
+            job.app = self.supervisor.launch(job.path, job.prefix, name=job.name)
+            self._set(job, RUNNING)
+            job.app.exited.wait()
+            job.returncode = job.app.returncode
+            self._set(job, DONE if job.returncode == 0 else FAILED)
+        except Exception as e:
+            job.error = e
+            self._set(job, FAILED)
+        finally:
+            with self._prefix_lock:
+                waiting = self._pending[prefix]
+                if waiting:
+                    self._pool.submit(self._install, waiting.popleft(), prefix)  # Still busy: it is the next one's
+                else:
+                    del self._pending[prefix]
+                    self._busy.discard(prefix)
+
+    def counts(self):
+        return collections.Counter(job.state for job in self.jobs)
+
+    @property
+    def idle(self):
+        return all(job.finished for job in self.jobs)
+
+    def poll(self):
+        # Runs on the Tk thread: one progress callback per tick, then the
+        # summary once every job of the batch has finished.
+        changed = False
+        while True:
+            try:
+                self._events.get_nowait()
+                changed = True
+            except queue.Empty:
+                break
+        if not changed or not self.jobs:
+            return
+        if self.on_progress:
+            self.on_progress(self)
+        if self.idle:
+            jobs, self.jobs = self.jobs, []
+            self._hashes.clear()
+            if self.on_finished:
+                self.on_finished(jobs)
+
+    def attach(self, root, interval=200):
+        def tick():
+            self.poll()
+            root.after(interval, tick)
+        root.after(interval, tick)
+
+
+def summarize(jobs):
+    counts = collections.Counter(job.state for job in jobs)
+    lines = [f"{len(jobs)} installer(s): {counts[DONE]} succeeded, {counts[FAILED]} failed, "
+             f"{counts[DUPLICATE]} duplicate(s) skipped."]
+    for job in jobs:
+        if job.state == FAILED:
+            reason = job.error or f"exit code {job.returncode}"
+            lines.append(f"✗ {job.name}: {reason}")
+        elif job.state == DUPLICATE:
+            lines.append(f"= {job.name}: same file as {job.duplicate_of.name}")
+    return "\n".join(lines)
@@ -0,0 +1,223 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Persistent installer cache under ~/.cache/tuxport.
+
+Installers are stored once per SHA-256 of their content
+(``blobs/<sha256>/<name>``) and looked up by URL. Each URL remembers the
+ETag/Last-Modified it was served with so a repeat download can be
+revalidated with a single conditional request. Least-recently-used blobs
+are evicted once the cache grows past ``cache_max_mb``.
+
+The index is an SQLite database shared by every TuxPort process, like
+the .exe index and the icon cache, so one process's downloads never
+overwrite another's. Cache hits only note the time in memory; the LRU
+times are written at most every ``LRU_FLUSH_INTERVAL`` seconds, before
+an eviction, and by ``flush()``.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "tuxport")
+DEFAULT_MAX_MB = 4096
+LRU_FLUSH_INTERVAL = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY, sha256 TEXT, name TEXT, size INTEGER, etag TEXT,
+                                 last_modified TEXT);
+CREATE INDEX IF NOT EXISTS urls_sha256 ON urls(sha256);
+CREATE TABLE IF NOT EXISTS blobs (sha256 TEXT PRIMARY KEY, size INTEGER, last_used REAL);
+"""
+URL_FIELDS = ("sha256", "name", "size", "etag", "last_modified")
+
+
+def sha256_file(path, chunk_size=1024 * 1024):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class InstallerCache:
+    def __init__(self, root=CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(root, "index.db")
+        self.blob_dir = os.path.join(root, "blobs")
+        self.partial_dir = os.path.join(root, "partial")
+        self.extract_dir = os.path.join(root, "extracted")  # Programs unpacked from archive blobs, by sha256
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._used = {}  # sha256 -> last hit, not written yet
+        self._flushed = 0.0
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(max_bytes=int(settings.get("cache_max_mb", DEFAULT_MAX_MB)) * 1024 * 1024)
+
+    # --- index persistence ---
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            os.makedirs(self.root, exist_ok=True)
+            db = sqlite3.connect(self.index_path, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(SCHEMA)
+            self._import_json(db)
+            self._local.db = db
+        return db
+
+    def _import_json(self, db):
+        # The index used to be one JSON file, rewritten whole by whichever process wrote last
+        old = os.path.join(self.root, "index.json")
+        try:
+            with open(old, 'r') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        with db:
+            db.executemany("INSERT OR IGNORE INTO blobs VALUES (?, ?, ?)",
+                           [(sha, b["size"], b["last_used"]) for sha, b in index.get("blobs", {}).items()])
+            db.executemany("INSERT OR IGNORE INTO urls VALUES (?, ?, ?, ?, ?, ?)",
+                           [(url, *(e.get(f) for f in URL_FIELDS)) for url, e in index.get("urls", {}).items()])
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+
+    def _blob_path(self, sha, name):
+        return os.path.join(self.blob_dir, sha, name)
+
+    # --- lookups ---
+    def lookup(self, url):
+        """Return the cached entry for ``url`` if its blob is still on disk."""
+        row = self._db().execute(f"SELECT {', '.join(URL_FIELDS)} FROM urls WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        entry = dict(zip(URL_FIELDS, row))
+        return entry if os.path.exists(self._blob_path(entry["sha256"], entry["name"])) else None
+
+    def conditional_headers(self, url):
+        entry = self.lookup(url)
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def is_fresh(self, url, info):
+        # 304, or a server that ignores conditionals but still sends the same validator
+        entry = self.lookup(url)
+        if not entry:
+            return False
+        if info.status == 304:
+            return True
+        if entry.get("etag") and info.etag == entry["etag"]:
+            return True
+        return bool(entry.get("last_modified") and info.last_modified == entry["last_modified"]
+                    and info.size == entry.get("size"))
+
+    def hit(self, url):
+        """Mark ``url`` as used and return the path of its cached installer."""
+        row = self._db().execute("SELECT sha256, name FROM urls WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            raise KeyError(url)  # Evicted since lookup(), by another process
+        sha, name = row
+        now = time.time()
+        with self._lock:
+            self._used[sha] = now
+            due = now - self._flushed >= LRU_FLUSH_INTERVAL
+        if due:
+            self.flush()
+        return self._blob_path(sha, name)
+
+    def flush(self):
+        """Write the LRU times of the hits since the last flush."""
+        with self._lock:
+            used, self._used = self._used, {}
+            self._flushed = time.time()
+        if used:
+            db = self._db()
+            with db:
+                db.executemany("UPDATE blobs SET last_used = max(last_used, ?) WHERE sha256 = ?",
+                               [(t, sha) for sha, t in used.items()])
+
+    def partial_path(self, url, name):
+        # Stable per URL so an interrupted download resumes on the next attempt
+        os.makedirs(self.partial_dir, exist_ok=True)
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.partial_dir, f"{key}-{name}")
+
+    # --- updates ---
+    def store(self, url, tmp_path, name, etag=None, last_modified=None, sha=None):
+        """Move a finished download into the cache and return its final path."""
+        sha = sha or sha256_file(tmp_path)
+        size = os.path.getsize(tmp_path)
+        path = self._blob_path(sha, name)
+        self.flush()  # Evict by the latest hits
+        db = self._db()
+        # BEGIN IMMEDIATE: one process at a time stores and evicts
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if os.path.exists(path):
+                os.remove(tmp_path)
+            else:
+                # Same content under another name: hardlink instead of storing twice
+                existing = [n for n in os.listdir(os.path.dirname(path)) if n != name]
+                if existing:
+                    os.link(self._blob_path(sha, existing[0]), path)
+                    os.remove(tmp_path)
+                else:
+                    os.replace(tmp_path, path)
+            db.execute("INSERT OR REPLACE INTO blobs VALUES (?, ?, ?)", (sha, size, time.time()))
+            db.execute("INSERT OR REPLACE INTO urls VALUES (?, ?, ?, ?, ?, ?)",
+                       (url, sha, name, size, etag, last_modified))
+            self._evict(db, keep=sha)
+        except BaseException:
+            db.rollback()
+            raise
+        db.commit()
+        return path
+
+    def total_size(self):
+        return self._db().execute("SELECT coalesce(sum(size), 0) FROM blobs").fetchone()[0]
+
+    def _evict(self, db, keep=None):
+        # Inside store()'s transaction
+        total = self.total_size()
+        for sha, size in db.execute("SELECT sha256, size FROM blobs ORDER BY last_used").fetchall():
+            if total <= self.max_bytes:
+                break
+            if sha == keep:
+                continue
+            shutil.rmtree(os.path.join(self.blob_dir, sha), ignore_errors=True)
+            shutil.rmtree(os.path.join(self.extract_dir, sha), ignore_errors=True)
+            db.execute("DELETE FROM blobs WHERE sha256 = ?", (sha,))
+            db.execute("DELETE FROM urls WHERE sha256 = ?", (sha,))
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            self._used.clear()
+        db = self._db()
+        with db:
+            shutil.rmtree(self.blob_dir, ignore_errors=True)
+            shutil.rmtree(self.partial_dir, ignore_errors=True)
+            shutil.rmtree(self.extract_dir, ignore_errors=True)
+            db.execute("DELETE FROM urls")
+            db.execute("DELETE FROM blobs")
@@ -0,0 +1,512 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Command-line entry point.
+
+``tuxport run|download|install|inspect|prefixes`` work without Tk or a display, for scripts
+and kiosk images; anything else opens the window (tuxport.app). When a
+``tuxport daemon`` is running, downloads go through it (see tuxport.daemon)
+and ``tuxport submit`` hands it job files.
+``--profile`` in front of either runs start-up and the command under
+cProfile and prints the hottest functions when it finishes.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from tuxport import __version__
+
+COMMANDS = ("run", "download", "install", "inspect", "prefixes", "library", "daemon", "submit")
+POLL_INTERVAL = 0.2
+PROFILE_PATH = os.path.expanduser("~/.cache/tuxport/profile.pstats")
+PROFILE_LINES = 30
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="tuxport", description="Install and run Windows programs with Wine.")
+    parser.add_argument("--version", action="version", version=f"TuxPort {__version__}")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"run under cProfile (main thread only); stats saved to {PROFILE_PATH}")
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    run = sub.add_parser("run", help="run a Windows program and wait for it to exit")
+    run.add_argument("exe", help="the program, or a .zip/.7z/.tar.* archive holding it")
+    run.add_argument("args", nargs=argparse.REMAINDER, help="arguments passed to the program")
+    run.add_argument("--prefix", help="WINEPREFIX to use (default: settings, $WINEPREFIX or ~/.wine)")
+    run.add_argument("--member", help="program to run from an archive (default: the likeliest installer)")
+
+    download = sub.add_parser("download", help="download an installer, or find one on a download page")
+    download.add_argument("urls", nargs="+", metavar="url")
+    download.add_argument("-o", "--output-dir", default=".", help="where to put the installers (default: .)")
+    download.add_argument("--no-cache", action="store_true", help="bypass the installer cache")
+    download.add_argument("--sha256", metavar="HEX", help="expected checksum (single url); also url#sha256=HEX")
+    download.add_argument("--no-daemon", action="store_true", help="download in this process even if a daemon is running")
+
+    install = sub.add_parser("install", help="download if needed, then run installers one prefix at a time")
+    install.add_argument("sources", nargs="+", metavar="url-or-file", help="installers, archives holding one, or urls")
+    install.add_argument("--prefix", help="WINEPREFIX to install into")
+    install.add_argument("-j", "--jobs", type=int, help="installers to run at once (default: settings)")
+    install.add_argument("--sha256", metavar="HEX", help="expected checksum (single url); also url#sha256=HEX")
+    install.add_argument("--no-daemon", action="store_true", help="download in this process even if a daemon is running")
+
+    inspect = sub.add_parser("inspect", help="show architecture, subsystem and installer type of Windows programs, "
+                                             "or the programs in an archive")
+    inspect.add_argument("files", nargs="+", metavar="file")
+
+    prefixes = sub.add_parser("prefixes", help="list per-app prefixes and their disk usage")
+    prefixes.add_argument("--template", action="store_true", help="build the prefix template now")
+    prefixes.add_argument("--gc", type=float, metavar="DAYS", help="remove prefixes unused for DAYS days")
+    prefixes.add_argument("--remove", metavar="NAME", action="append", default=[], help="remove a prefix")
+
+    library = sub.add_parser("library", help="list the apps installed in the Wine prefixes, or run one")
+    library.add_argument("--run", metavar="NAME", help="run the app called NAME (or the only one whose name contains it)")
+    library.add_argument("args", nargs=argparse.REMAINDER, help="extra arguments passed to the app with --run")
+
+    daemon = sub.add_parser("daemon", help="serve downloads, installs and launches to every TuxPort client")
+    daemon.add_argument("--socket", help="Unix socket to listen on (default: settings, $XDG_RUNTIME_DIR/tuxport.sock)")
+    daemon.add_argument("--status", action="store_true", help="show what a running daemon is doing")
+    daemon.add_argument("--stop", action="store_true", help="stop a running daemon")
+
+    submit = sub.add_parser("submit", help="send job files (JSON lists of download/install/launch jobs) to the daemon")
+    submit.add_argument("files", nargs="+", metavar="jobs.json", help="job file, or - for stdin")
+    submit.add_argument("--wait", action="store_true", help="wait until the downloads and installs have finished")
+    return parser
+
+
+def wants_cli(argv):
+    return bool(argv) and argv[0] in COMMANDS + ("-h", "--help", "--version")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "--profile":
+        return profile(_main, argv[1:])
+    return _main(argv)
+
+
+def _main(argv):
+    if not wants_cli(argv):
+        from tuxport import app
+        return app.main(argv)
+    args = build_parser().parse_args(argv)
+    from tuxport import trace
+    from tuxport.settings import load_settings
+    settings = load_settings()
+    trace.configure(settings)
+    try:
+        with trace.span("command", command=args.command):
+            return COMMAND_HANDLERS[args.command](args, settings)
+    except KeyboardInterrupt:
+        return 130
+
+
+def profile(func, *args):
+    """Run ``func(*args)`` under cProfile, save the stats and print the top entries."""
+    import cProfile
+    import pstats
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        try:
+            os.makedirs(os.path.dirname(PROFILE_PATH), exist_ok=True)
+            profiler.dump_stats(PROFILE_PATH)
+            log(f"profile saved to {PROFILE_PATH}")
+        except OSError as e:
+            log(f"could not save profile: {e}")
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(PROFILE_LINES)
+
+
+def log(message):
+    print(f"tuxport: {message}", file=sys.stderr)
+
+
+def wine_runtime(settings, prefix=None):
+    from tuxport.wine import WineRuntime
+    runtime = WineRuntime.from_settings(settings)
+    if prefix:
+        runtime.prefix = os.path.abspath(os.path.expanduser(prefix))
+    return runtime
+
+
+def prefix_pool(runtime, settings):
+    from tuxport.prefixes import PrefixPool
+    return PrefixPool.from_settings(runtime, settings)
+
+
+def cmd_run(args, settings):
+    from tuxport import archives, pe
+    from tuxport.wine import WineNotFound
+    exe = args.exe
+    if archives.is_archive(exe):
+        try:
+            exe = archives.extract(exe, args.member)
+        except (archives.ArchiveError, OSError) as e:
+            log(e)
+            return 126
+        log(f"extracted {exe}")
+    elif args.member:
+        log("--member only applies to archives")
+        return 2
+    problem = pe.problem(pe.inspect(exe, scan=False))
+    if problem:
+        log(f"{exe}: {problem}")
+        return 126
+    runtime = wine_runtime(settings, args.prefix)
+    try:
+        proc = runtime.launch(exe, args=args.args)
+    except (WineNotFound, OSError) as e:
+        log(e)
+        return 127
+    return wait_for(proc, exe)
+
+
+def wait_for(proc, exe):
+    log(f"launched {proc.timing}")
+    try:
+        returncode = proc.wait()
+    except KeyboardInterrupt:
+        proc.terminate()
+        returncode = proc.wait()
+    from tuxport import trace
+    trace.record("process_exit", (time.time() - proc.timing.started) * 1000, start=proc.timing.started,
+                 exe=exe, returncode=returncode)
+    return returncode
+
+
+def daemon_client(settings):
+    if not settings.get("use_daemon", True):
+        return None
+    from tuxport import daemon
+    return daemon.connect(settings)
+
+
+def fetch_all(urls, settings, dest_dir=None, use_cache=True, checksum=None, use_daemon=True):
+    """Download ``urls`` in parallel; returns {url: job} once all have finished.
+
+    With the cache on, a running daemon does the downloading, so this
+    joins any download of the same URL another client already started.
+    """
+    from tuxport import downloads
+    from tuxport.cache import InstallerCache
+    from tuxport.progress import format_eta, format_rate, format_size
+    client = daemon_client(settings) if use_cache and use_daemon else None
+    if client is not None:
+        from tuxport.daemon import RemoteDownloads
+        manager = RemoteDownloads(client)
+    else:
+        manager = downloads.DownloadManager(
+            dest_dir=dest_dir,
+            connections=settings.get("download_connections", 4),
+            cache=InstallerCache.from_settings(settings) if use_cache else None,
+            sidecar=settings.get("checksum_sidecar", True),
+        )
+    shown = {}
+
+    def report(job):
+        if job.state == downloads.RUNNING and job.total:
+            percent = job.downloaded * 100 // job.total
+            if shown.get(job.id) == percent:
+                return
+            shown[job.id] = percent
+            log(f"{job.name}: {percent}% of {format_size(job.total)}, {format_rate(job.rate)}, {format_eta(job.eta)} left")
+        elif job.state == downloads.DONE:
+            verified = f", {job.verified} checksum ok" if job.verified else ""
+            log(f"{job.name}: {'cached' if job.cache_hit else 'done'} (sha256 {job.sha256}{verified})")
+        elif job.state == downloads.FAILED:
+            log(f"{job.url}: {job.error}")
+
+    jobs = {url: manager.submit(url, on_update=report, checksum=checksum) for url in urls}
+    try:
+        while manager.active_jobs():
+            manager.poll()
+            time.sleep(POLL_INTERVAL)
+        manager.poll()
+    except KeyboardInterrupt:
+        manager.shutdown()
+        raise
+    return jobs
+
+
+def place(path, out_dir, name):
+    # Hard link out of the cache when possible; copy across file systems
+    import shutil
+    os.makedirs(out_dir, exist_ok=True)
+    target = os.path.join(out_dir, name)
+    if os.path.abspath(path) == os.path.abspath(target):
+        return target
+    if os.path.exists(target):
+        os.remove(target)
+    try:
+        os.link(path, target)
+    except OSError:
+        shutil.copy2(path, target)
+    return target
+
+
+def parse_checksum_arg(args, urls):
+    # None, or (algorithm, hex); raises ValueError with a message for the user
+    if not args.sha256:
+        return None
+    if len(urls) != 1:
+        raise ValueError("--sha256 needs exactly one url; use url#sha256=HEX for several")
+    from tuxport.integrity import parse_checksum
+    return parse_checksum(args.sha256 if ":" in args.sha256 else f"sha256:{args.sha256}")
+
+
+def cmd_download(args, settings):
+    from tuxport import downloads
+    out_dir = os.path.abspath(args.output_dir)
+    try:
+        checksum = parse_checksum_arg(args, args.urls)
+    except ValueError as e:
+        log(e)
+        return 2
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = fetch_all(args.urls, settings, dest_dir=out_dir if args.no_cache else None, use_cache=not args.no_cache,
+                     checksum=checksum, use_daemon=not args.no_daemon)
+    failed = 0
+    for job in jobs.values():
+        if job.state == downloads.DONE:
+            print(place(job.path, out_dir, job.name))
+        else:
+            failed += 1
+    return 1 if failed else 0
+
+
+def is_url(source):
+    return source.startswith(("http://", "https://"))
+
+
+def cmd_install(args, settings):
+    from tuxport import batch, downloads
+    from tuxport.supervisor import ProcessSupervisor
+    paths = []
+    missing = [s for s in args.sources if not is_url(s) and not os.path.isfile(s)]
+    for source in missing:
+        log(f"{source}: no such file")
+    urls = [s for s in args.sources if is_url(s)]
+    try:
+        checksum = parse_checksum_arg(args, urls)
+    except ValueError as e:
+        log(e)
+        return 2
+    jobs = fetch_all(urls, settings, checksum=checksum, use_daemon=not args.no_daemon) if urls else {}
+    for source in args.sources:
+        if source in jobs:
+            if jobs[source].state == downloads.DONE:
+                paths.append(jobs[source].path)
+        elif source not in missing:
+            paths.append(os.path.abspath(source))
+    if not paths:
+        return 1
+
+    runtime = wine_runtime(settings, args.prefix)
+    prefix_for = None
+    if not args.prefix and settings.get("prefix_isolation", True):
+        prefix_for = prefix_pool(runtime, settings).prefix_for  # One prefix per app, like the window
+    supervisor = ProcessSupervisor(runtime)
+    queue = batch.BatchQueue(supervisor, concurrency=args.jobs or settings.get("install_concurrency", 2), prefix_for=prefix_for)
+    result = []
+    queue.on_progress = lambda q: log("installing: " + ", ".join(f"{n} {s}" for s, n in sorted(q.counts().items())))
+    queue.on_finished = result.extend
+    queue.submit(paths)
+    try:
+        while not result:
+            queue.poll()
+            time.sleep(POLL_INTERVAL)
+    except KeyboardInterrupt:
+        for app in supervisor.running():
+            supervisor.kill(app.id)
+        raise
+    print(batch.summarize(result))
+    failed = len(missing) + len(jobs) - sum(1 for j in jobs.values() if j.state == downloads.DONE)
+    failed += sum(1 for job in result if job.state == batch.FAILED)
+    return 1 if failed else 0
+
+
+def cmd_inspect(args, settings):
+    from tuxport import archives, pe
+    from tuxport.progress import format_size
+    cache = pe.PECache()
+    bad = 0
+    for path in args.files:
+        if archives.is_archive(path):
+            # Listed, not extracted: the programs inside are inspected once one is run
+            try:
+                items = archives.members(path)
+            except archives.ArchiveError as e:
+                print(f"{path}: {e}")
+                bad += 1
+                continue
+            found = archives.programs(items)
+            bad += not found
+            print(f"{path}: archive of {len(items)} files, {len(found)} program(s)")
+            for member in found:
+                print(f"  {member.name} ({format_size(member.size)})")
+            continue
+        try:
+            info = cache.inspect(os.path.abspath(path))
+        except OSError as e:
+            info = pe.PEInfo(False, None, None, None, False, False, False, None, str(e))
+        bad += pe.problem(info) is not None
+        print(f"{path}: {pe.describe(info)}")
+    return 1 if bad else 0
+
+
+def cmd_prefixes(args, settings):
+    from tuxport.prefixes import TEMPLATE_NAME
+    pool = prefix_pool(wine_runtime(settings), settings)
+    if args.template and not pool.template_ready():
+        log("building prefix template (wineboot)...")
+        if not pool.build_template():
+            log(f"template build failed: {pool.template_error}")
+            return 1
+    for name in args.remove:
+        pool.remove(name)
+    if args.gc is not None:
+        for name in pool.gc(args.gc):
+            log(f"removed {name}")
+    for name, info in sorted(pool.refresh_usage().items()):
+        used = pool.last_used(name)
+        last = time.strftime("%Y-%m-%d", time.localtime(used)) if used else "-"
+        label = "(template)" if name == TEMPLATE_NAME else name
+        print(f"{label:<32} {info['size'] // 2**20:>7} MB  {info['shared'] // 2**20:>7} MB shared  "
+              f"{info.get('clone', '-'):<8} last used {last}")
+    return 0
+
+
+def cmd_library(args, settings):
+    from tuxport.library import Library, known_prefixes, split_args
+    from tuxport.wine import WineNotFound
+    runtime = wine_runtime(settings)
+    library = Library()
+    library.update(known_prefixes(runtime, prefix_pool(runtime, settings)))  # Only changed folders are read
+    apps = library.apps()
+    default = os.path.realpath(runtime.prefix)
+    if args.run is None:
+        for app in apps:
+            label = "default" if app.prefix == default else os.path.basename(app.prefix)
+            print(f"{app.name:<40} {label:<24} {app.exe}")
+        return 0
+    wanted = args.run.lower()
+    matches = [a for a in apps if a.name.lower() == wanted] or [a for a in apps if wanted in a.name.lower()]
+    if len(matches) != 1:
+        log(f"{len(matches) or 'no'} installed apps match {args.run!r}" + "".join(f"\n  {a.name}" for a in matches))
+        return 1
+    app = matches[0]
+    prefix_pool(runtime, settings).touch(app.prefix)  # Keeps it from looking unused to gc
+    try:
+        proc = runtime.launch(app.exe, app.prefix, split_args(app.args) + args.args,
+                              cwd=app.workdir or os.path.dirname(app.exe))
+    except (WineNotFound, OSError) as e:
+        log(e)
+        return 127
+    return wait_for(proc, app.exe)
+
+
+def cmd_daemon(args, settings):
+    from tuxport import daemon
+    if args.status or args.stop:
+        client = daemon.connect(settings, args.socket)
+        if client is None:
+            log("no daemon is running")
+            return 1
+        if args.stop:
+            client.request("shutdown")
+            return 0
+        print_status(client.request("status"))
+        return 0
+    try:
+        daemon.Daemon(settings, args.socket).serve()
+    except daemon.DaemonError as e:
+        log(e)
+        return 1
+    return 0
+
+
+def print_status(status):
+    from tuxport.progress import format_size
+    for d in status["downloads"]:
+        size = f"{format_size(d['downloaded'])} / {format_size(d['total'])}" if d["total"] else format_size(d["downloaded"])
+        print(f"download {d['id']:<4} {d['state']:<10} {size:<24} {d['name']}  {d.get('error', '')}".rstrip())
+    for i in status["installs"]:
+        code = f"exit {i['returncode']}" if i["returncode"] is not None else ""
+        print(f"install  {i['id']:<4} {i['state']:<10} {code:<24} {i['source']}  {i.get('error', '')}".rstrip())
+    for a in status["apps"]:
+        state = "running" if a["running"] else f"exit {a['returncode']}"
+        usage = a.get("usage")
+        cost = f"cpu {usage['cpu']:.0f}% rss {format_size(usage['rss'])}" if usage else f"pid {a['pid']}"
+        print(f"app      {a['id']:<4} {state:<10} {cost:<24} {a['name']}")
+
+
+def load_job_file(path):
+    """Jobs from a file holding a JSON list of jobs, or {"jobs": [...]}."""
+    import json
+    if path == "-":
+        data = json.load(sys.stdin)
+    else:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    jobs = data.get("jobs") if isinstance(data, dict) else data
+    if not isinstance(jobs, list):
+        raise ValueError(f"{path}: expected a list of jobs")
+    return jobs
+
+
+def cmd_submit(args, settings):
+    from tuxport import daemon
+    client = daemon.connect(settings)
+    if client is None:
+        log("no daemon is running; start one with 'tuxport daemon'")
+        return 1
+    try:
+        jobs = [job for path in args.files for job in load_job_file(path)]
+    except (OSError, ValueError) as e:
+        log(e)
+        return 2
+    results = client.request("batch", jobs=jobs)["results"]
+    downloads, installs, failed = set(), set(), 0
+    for job, result in zip(jobs, results):
+        if not result["ok"]:
+            failed += 1
+            log(f"{job.get('op') if isinstance(job, dict) else job}: {result['error']}")
+        downloads.update([result["download"]["id"]] if "download" in result else [])
+        installs.update(i["id"] for i in result.get("installs", ()))
+        if "app" in result:
+            log(f"launched {result['app']['name']} (pid {result['app']['pid']})")
+    if not args.wait:
+        log(f"submitted {len(jobs) - failed} job(s)")
+        return 1 if failed else 0
+    from tuxport import batch
+    from tuxport.downloads import FINISHED_STATES
+    while True:
+        status = client.request("status")
+        pending_downloads = [d for d in status["downloads"] if d["id"] in downloads and d["state"] not in FINISHED_STATES]
+        pending_installs = [i for i in status["installs"] if i["id"] in installs
+                            and i["state"] not in batch.FINISHED_STATES + ("failed",)]
+        if not pending_downloads and not pending_installs:
+            break
+        time.sleep(POLL_INTERVAL)
+    status["downloads"] = [d for d in status["downloads"] if d["id"] in downloads]
+    status["installs"] = [i for i in status["installs"] if i["id"] in installs]
+    status["apps"] = []
+    print_status(status)
+    failed += sum(d["state"] != "done" for d in status["downloads"])
+    failed += sum(i["state"] != batch.DONE for i in status["installs"])
+    return 1 if failed else 0
+
+
+COMMAND_HANDLERS = {
+    "run": cmd_run,
+    "download": cmd_download,
+    "install": cmd_install,
+    "inspect": cmd_inspect,
+    "prefixes": cmd_prefixes,
+    "library": cmd_library,
+    "daemon": cmd_daemon,
+    "submit": cmd_submit,
+}
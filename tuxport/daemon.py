@@ -0,0 +1,860 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Optional job daemon shared by every TuxPort window and script.
+
+``tuxport daemon`` owns one download engine, installer cache, Wine runtime,
+process supervisor and batch queue, and answers newline-delimited JSON
+requests on a Unix socket::
+
+    {"op": "download", "url": "https://example.com/setup.exe"}
+    {"ok": true, "download": {"id": 3, "state": "running", ...}}
+
+Ops are ping, status, download, install, launch, output, pause, resume,
+cancel, kill, batch (a list of the above, e.g. from a job file) and
+shutdown. A URL that is already downloading joins the running job
+instead of starting a second one, and each launch's prefix has its
+wineserver warmed by the daemon. ``Client`` speaks the protocol.
+``RemoteDownloads``, ``RemoteBatch`` and ``RemoteSupervisor`` give the
+window and the CLI the interfaces of DownloadManager, BatchQueue and
+ProcessSupervisor; in the window, a ``StatusFeed`` asks for status on a
+thread of its own, so the Tk thread never waits on the socket.
+"""
+
+import collections
+import itertools
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import threading
+import time
+import types
+
+from tuxport.cache import CACHE_DIR
+
+PUMP_INTERVAL = 0.04  # Same 25 Hz the window polls the download manager at
+KEEP_FINISHED = 600  # Seconds finished jobs stay visible in status
+CLIENT_TIMEOUT = 30
+LAUNCH_TIMEOUT = 600  # A first launch may clone a prefix
+STATUS_INTERVAL = 0.2
+MAX_REQUEST = 1024 * 1024
+
+
+class DaemonError(Exception):
+    pass
+
+
+def socket_path(settings=None):
+    path = (settings or {}).get("daemon_socket")
+    if path:
+        return os.path.expanduser(path)
+    return os.path.join(os.environ.get("XDG_RUNTIME_DIR") or CACHE_DIR, "tuxport.sock")
+
+
+def is_url(source):
+    return source.startswith(("http://", "https://"))
+
+
+# --- server ---
+
+class Install:
+    """One source of an install request: an optional download, then a batch job."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, source):
+        self.id = next(self._ids)
+        self.source = source
+        self.download = None
+        self.job = None
+        self.error = None
+        self.finished_at = None
+
+    @property
+    def state(self):
+        if self.error is not None:
+            return "failed"
+        if self.job is not None:
+            return self.job.state
+        return "downloading" if self.download is not None else "pending"
+
+    @property
+    def finished(self):
+        from tuxport import batch
+        return self.error is not None or (self.job is not None and self.job.state in batch.FINISHED_STATES)
+
+
+def _error_fields(error):
+    return {"error": str(error), "error_type": type(error).__name__} if error is not None else {}
+
+
+def describe_download(job):
+    return {
+        "id": job.id, "url": job.url, "name": job.name, "state": job.state,
+        "downloaded": job.downloaded, "total": job.total, "rate": job.rate, "eta": job.eta,
+        "path": job.path, "sha256": job.sha256, "cache_hit": job.cache_hit, "verified": job.verified,
+        "archive": job.archive, **_error_fields(job.error),
+    }
+
+
+def describe_install(install):
+    job = install.job
+    return {
+        "id": install.id, "source": install.source, "state": install.state,
+        "name": job.name if job else os.path.basename(install.source),
+        "duplicate_of": job.duplicate_of.name if job and job.duplicate_of else None,
+        "download": install.download.id if install.download else None,
+        "path": job.path if job else None, "prefix": job.prefix if job else None,
+        "returncode": job.returncode if job else None,
+        "app": job.app.id if job and job.app else None,
+        **_error_fields(install.error or (job.error if job else None)),
+    }
+
+
+def describe_app(app, usage=None):
+    info = {
+        "id": app.id, "name": app.name, "exe": app.exe, "prefix": app.prefix, "pid": app.pid,
+        "running": app.running, "returncode": app.returncode, "uptime": app.uptime, "killed": app.killed,
+        "timing": str(app.timing) if app.timing else None,
+    }
+    if usage is not None and usage.cpu is not None:
+        info["usage"] = {
+            "processes": usage.processes, "cpu": usage.cpu, "cpu_seconds": usage.cpu_seconds,
+            "rss": usage.rss, "peak_rss": usage.peak_rss, "read_rate": usage.read_rate,
+            "write_rate": usage.write_rate, "read_bytes": usage.read_bytes, "write_bytes": usage.write_bytes,
+        }
+    return info
+
+
+class Daemon:
+    def __init__(self, settings, path=None):
+        from tuxport.batch import BatchQueue
+        from tuxport.cache import InstallerCache
+        from tuxport.downloads import DownloadManager
+        from tuxport.prefixes import PrefixPool
+        from tuxport.sampler import ResourceSampler
+        from tuxport.supervisor import ProcessSupervisor
+        from tuxport.wine import WineRuntime
+        self.path = path or socket_path(settings)
+        self.runtime = WineRuntime.from_settings(settings)
+        self.pool = PrefixPool.from_settings(self.runtime, settings) if settings.get("prefix_isolation", True) else None
+        self.manager = DownloadManager(
+            connections=settings.get("download_connections", 4),
+            cache=InstallerCache.from_settings(settings),
+            sidecar=settings.get("checksum_sidecar", True),
+        )
+        self.supervisor = ProcessSupervisor(self.runtime)
+        self.queue = BatchQueue(self.supervisor, concurrency=settings.get("install_concurrency", 2),
+                                prefix_for=self.prefix_for)
+        interval = settings.get("sampler_interval", 1.0)
+        self.sampler = ResourceSampler(self.supervisor, interval) if interval else None
+        self.downloads = {}  # id -> DownloadJob, finished ones kept for status
+        self.by_url = {}  # (url, checksum) -> unfinished DownloadJob
+        self.installs = {}
+        self.waiting = {}  # download id -> [Install] to run once it is done
+        self.server = None
+        self._lock = threading.Lock()  # Plays the Tk thread: one request or poll at a time
+        self._stopped = threading.Event()
+
+    def prefix_for(self, exe):
+        return self.pool.prefix_for(exe) if self.pool else self.runtime.prefix
+
+    # --- lifecycle ---
+    def serve(self):
+        """Serve until a shutdown request or SIGTERM; removes the socket on the way out."""
+        _claim_socket(self.path)
+        # bind() creates the socket file: owner-only from the start, not chmodded after
+        umask = os.umask(0o177)
+        try:
+            self.server = _Server(self.path, _Handler)
+        finally:
+            os.umask(umask)
+        self.server.owner = self
+        signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        threading.Thread(target=self._pump, name="tuxport-daemon-pump", daemon=True).start()
+        if self.sampler:
+            self.sampler.start()
+        if self.pool:
+            self.pool.ensure_template()
+            self.pool.prewarm()  # prefix_for warms each app's own prefix
+        else:
+            self.runtime.prewarm()
+        try:
+            self.server.serve_forever()
+        finally:
+            self._stopped.set()
+            if self.sampler:
+                self.sampler.stop()
+            self.server.server_close()
+            self.manager.shutdown()
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def stop(self):
+        # serve_forever runs on the main thread; shutdown() must come from another one
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+    def _pump(self):
+        while not self._stopped.wait(PUMP_INTERVAL):
+            with self._lock:
+                self.manager.poll()
+                self.supervisor.poll()
+                self.queue.poll()
+                self._prune()
+
+    def _prune(self):
+        cutoff = time.time() - KEEP_FINISHED
+        for table in (self.downloads, self.installs):
+            for key, item in list(table.items()):
+                if item.finished_at is not None and item.finished_at < cutoff:
+                    del table[key]
+        for install in self.installs.values():
+            if install.finished_at is None and install.finished:
+                install.finished_at = time.time()
+        for app in list(self.supervisor.apps.values()):
+            if app.ended is not None and app.ended < cutoff:
+                self.supervisor.forget(app.id)
+
+    # --- requests ---
+    def handle(self, request):
+        if not isinstance(request, dict):
+            raise DaemonError("a request is a JSON object")
+        op = request.get("op")
+        handler = getattr(self, f"op_{op}", None) if isinstance(op, str) else None
+        if handler is None:
+            raise DaemonError(f"unknown op {op!r}")
+        return handler(request)
+
+    def op_ping(self, request):
+        from tuxport import __version__
+        return {"pid": os.getpid(), "version": __version__}
+
+    def op_shutdown(self, request):
+        self.stop()
+        return {}
+
+    def op_status(self, request):
+        with self._lock:
+            return {
+                "downloads": [describe_download(j) for j in self.downloads.values()],
+                "installs": [describe_install(i) for i in self.installs.values()],
+                "apps": [describe_app(a, self.sampler and self.sampler.get(a.id))
+                         for a in list(self.supervisor.apps.values())],
+                "wineserver_warm": self.runtime.is_warm(self.pool.template if self.pool else None),
+            }
+
+    def _download(self, url, checksum=None):
+        # Caller holds the lock. Same URL and checksum while running: one job.
+        from tuxport.integrity import parse_checksum
+        expected = parse_checksum(checksum) if checksum else None
+        key = (url, expected)
+        job = self.by_url.get(key)
+        if job is None or job.finished:
+            job = self.manager.submit(url, on_update=self._on_download, checksum=expected)
+            job.finished_at = None
+            self.by_url[key] = job
+            self.downloads[job.id] = job
+        return job
+
+    def _on_download(self, job):
+        # From manager.poll(), under the lock
+        if not job.finished:
+            return
+        job.finished_at = time.time()
+        for key, running in list(self.by_url.items()):
+            if running is job:
+                del self.by_url[key]
+        for install in self.waiting.pop(job.id, ()):
+            if job.error is not None or job.path is None:
+                install.error = job.error or DaemonError(f"download {job.state}")
+            else:
+                install.job = self.queue.submit([job.path])[0]
+
+    def op_download(self, request):
+        url = request.get("url")
+        if not isinstance(url, str) or not is_url(url):
+            raise DaemonError("download needs an http(s) url")
+        with self._lock:
+            return {"download": describe_download(self._download(url, request.get("checksum")))}
+
+    def op_install(self, request):
+        from tuxport import archives, pe
+        sources = request.get("sources") or ([request["source"]] if request.get("source") else [])
+        if not sources or not isinstance(sources, list) or not all(isinstance(s, str) and s for s in sources):
+            raise DaemonError("install needs sources, a list of paths and URLs")
+        installs = []
+        with self._lock:
+            for source in sources:
+                install = Install(source)
+                self.installs[install.id] = install
+                installs.append(install)
+                if is_url(source):
+                    install.download = self._download(source, request.get("checksum") if len(sources) == 1 else None)
+                    self.waiting.setdefault(install.download.id, []).append(install)
+                    continue
+                path = os.path.abspath(os.path.expanduser(source))
+                # Archives are unpacked by the batch queue
+                problem = None if archives.is_archive(path) else pe.problem(pe.inspect(path, scan=False))
+                if problem:
+                    install.error = DaemonError(f"{source}: {problem}")
+                else:
+                    install.job = self.queue.submit([path])[0]
+            return {"installs": [describe_install(i) for i in installs]}
+
+    def op_launch(self, request):
+        from tuxport import pe
+        exe = request.get("exe")
+        if not isinstance(exe, str):
+            raise DaemonError("launch needs an exe")
+        args = request.get("args") or []
+        if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+            raise DaemonError("launch args must be a list of strings")
+        exe = os.path.abspath(os.path.expanduser(exe))
+        problem = pe.problem(pe.inspect(exe, scan=False))
+        if problem:
+            raise DaemonError(f"{exe}: {problem}")
+        # Outside the lock: a first launch may clone a prefix
+        if request.get("prefix"):
+            prefix = os.path.expanduser(request["prefix"])
+            if self.pool:
+                self.pool.touch(prefix)  # prefix_for records the others
+        else:
+            prefix = self.prefix_for(exe)
+        cwd = request.get("cwd")
+        with self._lock:
+            app = self.supervisor.launch(exe, prefix, name=request.get("name"), args=args,
+                                         cwd=os.path.expanduser(cwd) if cwd else None)
+            return {"app": describe_app(app)}
+
+    # The lookups below run under the lock, like op_status: _pump changes the same tables
+    def _app(self, request):
+        app = self.supervisor.apps.get(request.get("app"))
+        if app is None:
+            raise DaemonError(f"no app {request.get('app')!r}")
+        return app
+
+    def op_output(self, request):
+        with self._lock:
+            stdout, stderr = self._app(request).output()
+        return {"stdout": stdout, "stderr": stderr}
+
+    def _job(self, request):
+        job = self.downloads.get(request.get("download"))
+        if job is None:
+            raise DaemonError(f"no download {request.get('download')!r}")
+        return job
+
+    def op_pause(self, request):
+        with self._lock:
+            self._job(request).pause()
+        return {}
+
+    def op_resume(self, request):
+        with self._lock:
+            self._job(request).resume()
+        return {}
+
+    def op_cancel(self, request):
+        with self._lock:
+            self._job(request).cancel()
+        return {}
+
+    def op_kill(self, request):
+        with self._lock:
+            self.supervisor.kill(self._app(request).id)
+        return {}
+
+    def op_batch(self, request):
+        jobs = request.get("jobs")
+        if not isinstance(jobs, list):
+            raise DaemonError("batch needs a list of jobs")
+        results = []
+        for job in jobs:
+            if isinstance(job, dict) and job.get("op") in ("batch", "shutdown"):
+                results.append({"ok": False, "error": f"{job['op']} is not allowed in a batch"})
+                continue
+            results.append(_respond(self, job))
+        return {"results": results}
+
+
+def _respond(daemon, request):
+    from tuxport.wine import WineNotFound
+    try:
+        return {"ok": True, **daemon.handle(request)}
+    except (DaemonError, ValueError, TypeError, KeyError, OSError, WineNotFound) as e:
+        # TypeError and KeyError come from a field of the wrong type, e.g. an id sent as a list
+        return {"ok": False, "error": f"bad request: {e}" if isinstance(e, (TypeError, KeyError)) else str(e)}
+
+
+def _claim_socket(path):
+    # A socket file nobody answers on is left over from a crash; a live one means a daemon is running
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.remove(path)
+        else:
+            raise DaemonError(f"a TuxPort daemon is already listening on {path}")
+        finally:
+            probe.close()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    block_on_close = False
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline(MAX_REQUEST)
+            if not line:
+                return
+            try:
+                response = _respond(self.server.owner, json.loads(line))
+            except ValueError as e:
+                response = {"ok": False, "error": f"bad request: {e}"}
+            try:
+                self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            except OSError:
+                return
+
+
+# --- clients ---
+
+class Client:
+    def __init__(self, path, timeout=CLIENT_TIMEOUT):
+        self.path = path
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(path)
+        except OSError:
+            self._sock.close()
+            raise
+        self._file = self._sock.makefile("rwb")
+        self._lock = threading.Lock()
+
+    def request(self, op, **fields):
+        """Send one request; returns the response, or raises DaemonError if the daemon refused it."""
+        data = json.dumps({"op": op, **fields}).encode() + b"\n"
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            reply = self._file.readline()
+        if not reply:
+            raise ConnectionError("the TuxPort daemon closed the connection")
+        response = json.loads(reply)
+        if not response.get("ok"):
+            raise DaemonError(response.get("error") or "request failed")
+        return response
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+
+def connect(settings=None, path=None):
+    """Return a Client for a running daemon, or None if there is none."""
+    path = path or socket_path(settings)
+    if not os.path.exists(path):
+        return None
+    try:
+        client = Client(path)
+        client.request("ping")
+        return client
+    except (OSError, ValueError, DaemonError):
+        return None
+
+
+def fetch_status(client):
+    """Ask for status and wait; returns ``(status, error, asked)`` as StatusFeed hands them out."""
+    asked = time.monotonic()
+    try:
+        return client.request("status"), None, asked
+    except (OSError, ValueError, DaemonError) as e:
+        return None, e, asked
+
+
+class StatusFeed:
+    """The daemon's status, fetched on a background thread.
+
+    While one of its ``watchers`` is watching something, the thread asks
+    for status every ``interval`` seconds on a connection of its own.
+    ``poll`` hands the newest answer to each watcher's ``apply``, on the
+    thread that calls it.
+    """
+
+    def __init__(self, path, interval=STATUS_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.watchers = []
+        self._results = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="tuxport-daemon-status", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        client = None
+        while not self._stop.wait(self.interval):
+            if not any(w.watching for w in list(self.watchers)):
+                continue
+            try:
+                if client is None:
+                    client = Client(self.path)
+            except OSError as e:
+                self._results.put((None, e, time.monotonic()))
+                continue
+            result = fetch_status(client)
+            self._results.put(result)
+            if result[1] is not None:
+                client.close()
+                client = None  # Reconnect next time
+        if client is not None:
+            client.close()
+
+    def poll(self):
+        result = None
+        while True:
+            try:
+                result = self._results.get_nowait()
+            except queue.Empty:
+                break
+        if result is not None:
+            for watcher in list(self.watchers):
+                watcher.apply(*result)
+
+    def attach(self, root, interval=100):
+        self.start()
+
+        def tick():
+            self.poll()
+            root.after(interval, tick)
+        root.after(interval, tick)
+
+
+def _remote_error(data):
+    from tuxport import downloads, integrity
+    if "error" not in data:
+        return None
+    kind = {"NoInstallerFound": downloads.NoInstallerFound,
+            "ChecksumMismatch": integrity.ChecksumMismatch}.get(data.get("error_type"), DaemonError)
+    return kind(data["error"])
+
+
+def send_later(client, op, **fields):
+    """Send a request whose answer nobody waits for, from a thread of its own."""
+    def send():
+        try:
+            client.request(op, **fields)
+        except (OSError, ValueError, DaemonError):
+            pass
+    threading.Thread(target=send, name="tuxport-daemon-request", daemon=True).start()
+
+
+def _known(status, error, key, what):
+    """The items of ``status[key]`` by id, and the fields for one it has lost."""
+    if error is not None:
+        return {}, {"state": "failed", "error": f"lost the TuxPort daemon: {error}"}
+    return {d["id"]: d for d in status[key]}, {"state": "failed", "error": f"the TuxPort daemon no longer knows this {what}"}
+
+
+class RemoteJob:
+    """A daemon download seen through DownloadJob's attributes."""
+
+    FIELDS = ("url", "name", "state", "downloaded", "total", "rate", "eta", "path", "sha256", "cache_hit", "verified",
+              "archive")
+
+    def __init__(self, client, data, on_update=None):
+        self.id = data["id"]
+        self.client = client
+        self.on_update = on_update
+        self.checksum = None
+        self.since = time.monotonic()
+        self._data = None
+        self.update(data)
+
+    def update(self, data):
+        if data == self._data:
+            return False
+        self._data = data
+        for name in self.FIELDS:
+            setattr(self, name, data.get(name))
+        self.error = _remote_error(data)
+        return True
+
+    @property
+    def finished(self):
+        from tuxport import downloads
+        return self.state in downloads.FINISHED_STATES
+
+    # Called from Tk buttons: the state change shows up in the next status
+    def pause(self):
+        send_later(self.client, "pause", download=self.id)
+
+    def resume(self):
+        send_later(self.client, "resume", download=self.id)
+
+    def cancel(self):
+        send_later(self.client, "cancel", download=self.id)
+
+
+class RemoteDownloads:
+    """DownloadManager's interface, backed by the daemon.
+
+    With a StatusFeed, status arrives through ``apply``; without one (the
+    CLI), ``poll`` asks for it and waits.
+    """
+
+    def __init__(self, client, feed=None):
+        self.client = client
+        self.jobs = {}
+        self._lock = threading.Lock()  # submit() may run on a worker
+        if feed is not None:
+            feed.watchers.append(self)
+
+    @property
+    def watching(self):
+        return bool(self.jobs)
+
+    def submit(self, url, on_update=None, checksum=None):
+        fields = {"url": url}
+        if checksum:
+            fields["checksum"] = ":".join(checksum)
+        data = self.client.request("download", **fields)["download"]
+        with self._lock:
+            job = self.jobs.get(data["id"])  # Already ours: the daemon merged the two requests
+            if job is None:
+                job = self.jobs[data["id"]] = RemoteJob(self.client, data, on_update)
+        return job
+
+    def active_jobs(self):
+        return [j for j in self.jobs.values() if not j.finished]
+
+    def poll(self):
+        if self.jobs:
+            self.apply(*fetch_status(self.client))
+
+    def apply(self, status, error, asked):
+        known, lost = _known(status, error, "downloads", "download")
+        for job in list(self.jobs.values()):
+            data = known.get(job.id)
+            if data is None:
+                if job.since > asked:
+                    continue  # Submitted after this status was asked for
+                data = dict(job._data, **lost)
+            if job.update(data) and job.on_update:
+                job.on_update(job)
+            if job.finished:
+                with self._lock:
+                    del self.jobs[job.id]
+
+    def shutdown(self):
+        pass  # The downloads belong to the daemon; other clients may be waiting on them
+
+
+class RemoteInstall:
+    """A daemon install seen through InstallJob's attributes."""
+
+    FIELDS = ("name", "state", "path", "prefix", "returncode", "error")
+
+    def __init__(self, data):
+        self.id = data["id"]
+        self.since = time.monotonic()
+        self._data = None
+        self.update(data)
+
+    def update(self, data):
+        if data == self._data:
+            return False
+        self._data = data
+        for name in self.FIELDS:
+            setattr(self, name, data.get(name))
+        # summarize() only reads the name of the install this one duplicates
+        self.duplicate_of = types.SimpleNamespace(name=data["duplicate_of"]) if data.get("duplicate_of") else None
+        return True
+
+    @property
+    def finished(self):
+        from tuxport import batch
+        return self.state in batch.FINISHED_STATES
+
+
+class RemoteBatch:
+    """BatchQueue's interface for installs the daemon runs, fed by a StatusFeed."""
+
+    def __init__(self, client, feed):
+        self.client = client
+        self.jobs = []
+        self.on_progress = None
+        self.on_finished = None
+        self._submitted = False
+        self._lock = threading.Lock()  # submit() may run on a worker
+        feed.watchers.append(self)
+
+    @property
+    def watching(self):
+        return bool(self.jobs)
+
+    def submit(self, paths):
+        try:
+            installs = self.client.request("install", sources=list(paths))["installs"]
+        except (OSError, ValueError, DaemonError) as e:
+            # Like a failed BatchQueue job: the summary says why
+            installs = [{"id": None, "source": p, "name": os.path.basename(p), "state": "failed",
+                         "error": f"not sent to the TuxPort daemon: {e}"} for p in paths]
+        jobs = [RemoteInstall(data) for data in installs]
+        with self._lock:
+            self.jobs.extend(jobs)
+            self._submitted = True
+        return jobs
+
+    def counts(self):
+        return collections.Counter(job.state for job in self.jobs)
+
+    @property
+    def idle(self):
+        return all(job.finished for job in self.jobs)
+
+    def apply(self, status, error, asked):
+        # Same callbacks as BatchQueue.poll: progress on a change, the summary once all are done
+        with self._lock:
+            jobs = list(self.jobs)
+            changed, self._submitted = self._submitted, False
+        if not jobs:
+            return
+        known, lost = _known(status, error, "installs", "install")
+        for job in jobs:
+            data = known.get(job.id)
+            if data is None:
+                if job.finished or job.since > asked:
+                    continue
+                data = dict(job._data, **lost)
+            changed = job.update(data) or changed
+        if not changed:
+            return
+        if self.on_progress:
+            self.on_progress(self)
+        with self._lock:
+            done = self.idle and len(self.jobs) == len(jobs)  # Nothing submitted meanwhile
+            if done:
+                self.jobs = []
+        if done and self.on_finished:
+            self.on_finished(jobs)
+
+
+class RemoteApp:
+    """A daemon-run app seen through App's attributes."""
+
+    FIELDS = ("name", "exe", "prefix", "pid", "running", "returncode", "uptime", "killed", "timing")
+
+    def __init__(self, client, data):
+        self.id = data["id"]
+        self.client = client
+        self.since = time.monotonic()
+        self._output = ("", "")
+        self._fetching = threading.Lock()
+        self.update(data)
+
+    def update(self, data):
+        # True when the app started or stopped; uptime and usage change every time
+        changed = data.get("running") != getattr(self, "running", None)
+        for name in self.FIELDS:
+            setattr(self, name, data.get(name))
+        self._data = data
+        return changed
+
+    def output(self):
+        """The output the daemon sent last time; each call asks for newer output in the background."""
+        if self._fetching.acquire(blocking=False):
+            threading.Thread(target=self._fetch_output, name="tuxport-daemon-output", daemon=True).start()
+        return self._output
+
+    def _fetch_output(self):
+        try:
+            data = self.client.request("output", app=self.id)
+            self._output = (data["stdout"], data["stderr"])
+        except (OSError, ValueError, DaemonError) as e:
+            self._output = (self._output[0], f"Could not get the output from the TuxPort daemon: {e}\n")
+        finally:
+            self._fetching.release()
+
+
+class RemoteSupervisor:
+    """ProcessSupervisor's interface for apps the daemon runs, fed by a StatusFeed."""
+
+    def __init__(self, client, feed):
+        self.client = client
+        self.apps = {}
+        self.listeners = []
+        self._events = queue.Queue()
+        feed.watchers.append(self)
+
+    @property
+    def watching(self):
+        return not self._events.empty() or any(app.running for app in list(self.apps.values()))
+
+    def launch(self, exe, prefix=None, name=None, args=(), cwd=None):
+        """Start ``exe`` in the daemon and return its RemoteApp.
+
+        It waits for the daemon, which may be cloning a prefix first, so call
+        it from a worker; it uses a connection of its own for that reason.
+        """
+        client = Client(self.client.path, timeout=LAUNCH_TIMEOUT)
+        try:
+            data = client.request("launch", exe=exe, prefix=prefix, name=name, args=list(args), cwd=cwd)["app"]
+        finally:
+            client.close()
+        app = RemoteApp(self.client, data)
+        self.apps[app.id] = app
+        self._events.put(app)
+        return app
+
+    def kill(self, app_id):
+        send_later(self.client, "kill", app=app_id)
+
+    def running(self):
+        return [a for a in list(self.apps.values()) if a.running]
+
+    def forget(self, app_id):
+        app = self.apps.get(app_id)
+        if app is not None and not app.running:
+            del self.apps[app_id]
+
+    def apply(self, status, error, asked):
+        changed = {}
+        while True:
+            try:
+                app = self._events.get_nowait()
+            except queue.Empty:
+                break
+            changed[app.id] = app
+        if error is None:
+            # An app the daemon no longer lists has ended; a lost daemon says nothing either way
+            known = {d["id"]: d for d in status["apps"]}
+            for app in list(self.apps.values()):
+                data = known.get(app.id)
+                if data is None:
+                    if not app.running or app.since > asked:
+                        continue
+                    data = dict(app._data, running=False)
+                if app.update(data):
+                    changed[app.id] = app
+        for app in changed.values():
+            for listener in self.listeners:
+                listener(app)
@@ -0,0 +1,230 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Secondary windows of the TuxPort UI.
+
+Nothing here is needed for the first frame, so tuxport.app imports this
+module the first time one of these dialogs is opened.
+"""
+
+import os
+import shutil
+import subprocess
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from tuxport import __version__, theme
+from tuxport.theme import FONT_LABEL, THEMES
+
+
+def show_app_output(root, app):
+    c = theme.current
+    win = tk.Toplevel(root)
+    win.title(f"Output – {app.name}")
+    win.geometry("720x420")
+    text = tk.Text(win, bg=c["ENTRY_BG"], fg=c["ENTRY_FG"], font=("monospace", 9), wrap='none')
+    text.pack(fill='both', expand=True)
+    shown = [None]
+
+    def refresh():
+        if not win.winfo_exists():
+            return
+        out, err = app.output()
+        text.delete('1.0', tk.END)
+        text.insert(tk.END, out + ("\n--- stderr ---\n" + err if err else ""))
+        text.see(tk.END)
+        # A daemon app's output arrives a refresh late, so keep going until it settles
+        if app.running or shown[0] != (out, err):
+            shown[0] = (out, err)
+            win.after(1000, refresh)
+    refresh()
+
+
+def prompt_install_wine(root):
+    def open_terminal():
+        terminal = shutil.which('gnome-terminal') or shutil.which('x-terminal-emulator')
+        if terminal:
+            subprocess.Popen([
+                terminal, '--', 'bash', '-c',
+                'echo "To install Wine, run:"; echo "sudo apt update && sudo apt install -y wine"; bash'
+            ])
+        else:
+            messagebox.showinfo(
+                "No Terminal Found",
+                "Could not find a terminal emulator. Please open a terminal and run:\n\nsudo apt update && sudo apt install -y wine"
+            )
+    popup = tk.Toplevel(root)
+    popup.title("Wine Required")
+    popup.geometry("400x200")
+    popup.resizable(False, False)
+    ttk.Label(popup, text="Wine is not installed.\nTuxPort requires Wine to run Windows applications.", wraplength=380, anchor='center', justify='center').pack(pady=20)
+    ttk.Label(popup, text="Would you like to open a terminal with the install command?", wraplength=380, anchor='center', justify='center').pack(pady=10)
+    btn_frame = ttk.Frame(popup)
+    btn_frame.pack(pady=10)
+    ttk.Button(btn_frame, text="Open Terminal", command=lambda: [open_terminal(), popup.destroy()]).pack(side='left', padx=10)
+    ttk.Button(btn_frame, text="Cancel", command=popup.destroy).pack(side='left', padx=10)
+    popup.transient(root)
+    popup.grab_set()
+    root.wait_window(popup)
+
+
+def show_about(root):
+    c = theme.current
+    about = tk.Toplevel(root)
+    about.title(f"About TuxPort v{__version__}")
+    about.geometry("480x320")  # Larger size
+    about.resizable(False, False)
+    about.configure(bg=c["BG"], bd=0, highlightthickness=0)
+    # Center the window, but keep it on screen
+    about.update_idletasks()
+    x = root.winfo_x() + (root.winfo_width() // 2) - (480 // 2)
+    y = root.winfo_y() + (root.winfo_height() // 2) - (320 // 2)
+    y = max(0, y)
+    x = max(0, x)
+    about.geometry(f"+{x}+{y}")
+    # Title label
+    tk.Label(about, text=f"TuxPort v{__version__}", font=("Segoe UI", 20, "bold"), bg=c["BG"], fg=c["ACCENT"], anchor='center', justify='center').pack(pady=(24, 8), fill='x')
+    # Body text
+    tk.Label(
+        about,
+        text="TuxPort is open source software.\nIt uses Wine (also open source) to run Windows applications on Linux.\n\nGitHub: github.com/IRISHDEVELOPERDEV/tuxport\n© 2025 IRISHDEVELOPERDEV\nLicensed under the MIT License.",
+        font=("Segoe UI", 13),
+        bg=c["BG"],
+        fg=c["FG"],
+        wraplength=420,
+        justify='center',
+        anchor='center'
+    ).pack(pady=(0, 16), fill='x')
+    # OK button
+    ttk.Button(about, text="OK", command=about.destroy, style='TButton').pack(pady=16, fill='x', padx=60)
+    about.transient(root)
+    about.grab_set()
+    root.wait_window(about)
+
+
+def show_settings(root, settings, on_save):
+    """Edit a copy of ``settings``; ``on_save(new_settings)`` applies and persists it."""
+    c = theme.current
+    BG, FG, ACCENT, ENTRY_BG, ENTRY_FG = c["BG"], c["FG"], c["ACCENT"], c["ENTRY_BG"], c["ENTRY_FG"]
+    s = settings.copy()
+    win = tk.Toplevel(root)
+    win.title("Settings")
+    win.geometry("")  # Let it autosize
+    win.resizable(False, False)
+    win.configure(bg=BG)
+    win.update_idletasks()
+    # Center the window on screen
+    x = root.winfo_x() + (root.winfo_width() // 2) - (win.winfo_reqwidth() // 2)
+    y = root.winfo_y() + (root.winfo_height() // 2) - (win.winfo_reqheight() // 2)
+    y = max(0, y)
+    x = max(0, x)
+    win.geometry(f"+{x}+{y}")
+    # Theme
+    tk.Label(win, text="Theme:", bg=BG, fg=FG, font=FONT_LABEL).pack(anchor='w', padx=20, pady=(20, 0))
+    theme_var = tk.StringVar(value=s.get("theme", "dark"))
+    theme_frame = tk.Frame(win, bg=BG)
+    theme_frame.pack(anchor='w', padx=20)
+    for t in THEMES:
+        tk.Radiobutton(theme_frame, text=t.title(), variable=theme_var, value=t, bg=BG, fg=FG, selectcolor=ACCENT, font=FONT_LABEL).pack(side='left', padx=8)
+    # Default folder
+    tk.Label(win, text="Default folder:", bg=BG, fg=FG, font=FONT_LABEL).pack(anchor='w', padx=20, pady=(16, 0))
+    folder_var = tk.StringVar(value=s.get("default_folder", os.path.expanduser("~")))
+    folder_entry = tk.Entry(win, textvariable=folder_var, bg=ENTRY_BG, fg=ENTRY_FG, font=FONT_LABEL, width=32)
+    folder_entry.pack(anchor='w', padx=20)
+    def browse_folder():
+        f = filedialog.askdirectory()
+        if f:
+            folder_var.set(f)
+    tk.Button(win, text="Browse", command=browse_folder, bg=ACCENT, fg=FG).pack(anchor='w', padx=20, pady=(2, 0))
+    # Wine path
+    tk.Label(win, text="Wine command/path:", bg=BG, fg=FG, font=FONT_LABEL).pack(anchor='w', padx=20, pady=(16, 0))
+    wine_var = tk.StringVar(value=s.get("wine_path", "wine"))
+    wine_entry = tk.Entry(win, textvariable=wine_var, bg=ENTRY_BG, fg=ENTRY_FG, font=FONT_LABEL, width=32)
+    wine_entry.pack(anchor='w', padx=20)
+    # Prefix isolation
+    isolate_var = tk.BooleanVar(value=s.get("prefix_isolation", True))
+    tk.Checkbutton(win, text="Give each app its own Wine prefix", variable=isolate_var, bg=BG, fg=FG,
+                   selectcolor=ENTRY_BG, activebackground=BG, font=FONT_LABEL).pack(anchor='w', padx=20, pady=(16, 0))
+    # Save button
+    def save_and_close():
+        s["theme"] = theme_var.get()
+        s["default_folder"] = folder_var.get()
+        s["wine_path"] = wine_var.get()
+        s["prefix_isolation"] = isolate_var.get()
+        on_save(s)
+        win.destroy()
+        messagebox.showinfo("Settings", "Settings saved and theme applied.")
+    tk.Button(win, text="Save", command=save_and_close, bg=ACCENT, fg=FG).pack(pady=24)
+    win.transient(root)
+    win.grab_set()
+    root.wait_window(win)
+
+
+def show_library(root, library, prefixes, on_launch):
+    """List the installed apps; ``on_launch(app)`` runs the chosen InstalledApp.
+
+    The list comes straight from the library database and is refreshed in the
+    background, so it is filled in as soon as the window opens.
+    """
+    import queue
+    c = theme.current
+    BG, FG, ACCENT, ENTRY_BG, ENTRY_FG = c["BG"], c["FG"], c["ACCENT"], c["ENTRY_BG"], c["ENTRY_FG"]
+    win = tk.Toplevel(root)
+    win.title("Installed Apps")
+    win.geometry("560x460")
+    win.configure(bg=BG)
+    search_var = tk.StringVar()
+    tk.Entry(win, textvariable=search_var, bg=ENTRY_BG, fg=ENTRY_FG, font=FONT_LABEL).pack(fill='x', padx=12, pady=(12, 6))
+    frame = tk.Frame(win, bg=BG)
+    frame.pack(fill='both', expand=True, padx=12)
+    listbox = tk.Listbox(frame, bg=ENTRY_BG, fg=ENTRY_FG, font=FONT_LABEL, selectbackground=ACCENT,
+                         activestyle='none', highlightthickness=0, borderwidth=0)
+    scroll = ttk.Scrollbar(frame, orient='vertical', command=listbox.yview)
+    listbox.configure(yscrollcommand=scroll.set)
+    scroll.pack(side='right', fill='y')
+    listbox.pack(side='left', fill='both', expand=True)
+    status = tk.Label(win, bg=BG, fg=FG, font=FONT_LABEL, anchor='w')
+    status.pack(fill='x', padx=12, pady=(6, 0))
+    shown = []
+    done = queue.Queue()
+
+    default = os.path.realpath(prefixes[0]) if prefixes else None
+
+    def prefix_label(prefix):
+        return "default" if prefix == default else os.path.basename(prefix)
+
+    def fill():
+        words = search_var.get().lower().split()
+        shown[:] = [a for a in library.apps() if all(w in a.name.lower() for w in words)]
+        listbox.delete(0, tk.END)
+        for a in shown:
+            listbox.insert(tk.END, f"{a.name}  —  {prefix_label(a.prefix)}")
+        status.config(text=f"{len(shown)} apps" + (" · refreshing…" if library.running else ""))
+
+    def launch(event=None):
+        selection = listbox.curselection()
+        if selection:
+            on_launch(shown[selection[0]])
+
+    def poll():
+        if not win.winfo_exists():
+            return
+        try:
+            done.get_nowait()
+        except queue.Empty:
+            win.after(100, poll)
+            return
+        fill()
+
+    btn_frame = tk.Frame(win, bg=BG)
+    btn_frame.pack(fill='x', padx=12, pady=12)
+    ttk.Button(btn_frame, text="▶  Launch", command=launch, style='TButton').pack(side='left', fill='x', expand=True)
+    ttk.Button(btn_frame, text="Close", command=win.destroy, style='TButton').pack(side='left', padx=(8, 0))
+    listbox.bind("<Double-Button-1>", launch)
+    listbox.bind("<Return>", launch)
+    search_var.trace_add("write", lambda *_: fill())
+    library.start_background(prefixes, on_done=done.put)
+    fill()
+    poll()
+    win.transient(root)
@@ -0,0 +1,118 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Incremental directory crawling on top of SQLite, shared by the indexes.
+
+Every directory visited is stored with its mtime in a ``dirs`` table. A
+directory whose mtime has not changed is not listed again, and its known
+sub-directories are taken from the table instead. Each index keeps its
+own table of entries, whose rows name their directory in a ``dir``
+column. DirIndex subclasses implement ``_list`` to fill that table for
+one directory.
+"""
+
+import os
+import sqlite3
+
+COMMIT_EVERY = 200
+
+DIRS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, parent TEXT, mtime REAL);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+"""
+
+
+def like_escape(text):
+    """Escape ``text`` for a ``LIKE ... ESCAPE '\\'`` pattern."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def under(column):
+    """SQL condition for ``column`` equal to a directory or lying below it.
+
+    It takes the parameters returned by ``under_args``. This is a range on
+    the binary collation, not ``LIKE``, because ``LIKE`` ignores ASCII case.
+    That would make ``/x/Foo`` match ``/x/foo/...`` too.
+    """
+    return f"({column} = ? OR ({column} >= ? AND {column} < ?))"
+
+
+def under_args(d):
+    d = d.rstrip(os.sep)
+    # Everything starting with "d/" sorts between "d/" and "d0" ("0" follows "/")
+    return d, d + os.sep, d + chr(ord(os.sep) + 1)
+
+
+class DirIndex:
+    SCHEMA = ""  # The subclass's entries table
+    ENTRIES = None  # Its name
+
+    def __init__(self, path):
+        self.path = path
+
+    def connect(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        db = sqlite3.connect(self.path, timeout=10)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(DIRS_SCHEMA + self.SCHEMA)
+        return db
+
+    def crawl(self, db, roots, stats, cancel=None, depth=None, **context):
+        """Visit ``roots`` and below, up to ``depth`` levels down (None: all).
+
+        ``stats["dirs"]`` counts the directories visited and
+        ``stats["rescanned"]`` those listed again. ``context`` is passed to
+        ``_list``. Returns False if ``cancel`` was set.
+        """
+        stack = [(root, 0) for root in roots]
+        while stack:
+            if cancel is not None and cancel.is_set():
+                return False
+            d, level = stack.pop()
+            stats["dirs"] += 1
+            try:
+                mtime = os.stat(d).st_mtime
+            except OSError:
+                self.forget(db, d)
+                continue
+            deeper = depth is None or level < depth
+            row = db.execute("SELECT mtime FROM dirs WHERE path = ?", (d,)).fetchone()
+            if row is not None and row[0] == mtime:
+                if deeper:
+                    stack.extend((p, level + 1) for (p,) in db.execute("SELECT path FROM dirs WHERE parent = ?", (d,)))
+                continue
+            subdirs = self._rescan(db, d, mtime, stats, context)
+            if deeper:
+                stack.extend((p, level + 1) for p in subdirs)
+            stats["rescanned"] += 1
+            if stats["rescanned"] % COMMIT_EVERY == 0:
+                db.commit()
+        return True
+
+    def _rescan(self, db, d, mtime, stats, context):
+        try:
+            subdirs = self._list(db, d, stats, **context)
+        except OSError:
+            self.forget(db, d)
+            return []
+        current = set(subdirs)
+        for (old,) in db.execute("SELECT path FROM dirs WHERE parent = ?", (d,)).fetchall():
+            if old not in current:
+                self.forget(db, old)
+        db.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)", (d, os.path.dirname(d), mtime))
+        return subdirs
+
+    def _list(self, db, d, stats, **context):
+        """Update the entries of directory ``d``; returns its sub-directories to visit.
+
+        An OSError means ``d`` could not be listed, and it is forgotten.
+        """
+        raise NotImplementedError
+
+    def forget(self, db, d):
+        """Drop ``d``, everything below it and their entries."""
+        args = under_args(d)
+        db.execute(f"DELETE FROM dirs WHERE {under('path')}", args)
+        db.execute(f"DELETE FROM {self.ENTRIES} WHERE {under('dir')}", args)
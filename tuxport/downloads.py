@@ -0,0 +1,399 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Background download engine.
+
+Jobs are queued on a small pool of worker threads. Workers never touch Tk;
+they only update the job and post events, which the UI drains with
+``DownloadManager.attach(root)`` (``root.after`` polling, at
+progress.SAMPLE_INTERVAL_MS). Each poll also samples the byte counters
+into the job's progress.Meter for throughput and ETA.
+
+Every download is hashed as it is written (tuxport.integrity). When a
+checksum is known, from ``url#sha256=<hex>``, the caller or a ``.sha256``
+sidecar, a mismatching file is deleted instead of being handed to Wine.
+
+Installers shipped in archives are unpacked by tuxport.archives; a tar is
+unpacked while it downloads. The job's ``path`` is then the extracted
+program and ``archive`` the bundle it came from.
+
+A cached download holds an flock on its partial file from the cache
+lookup to the hand-off, so a second job for the same URL, in this process
+or another, waits for the first and then takes its cache hit.
+"""
+
+import contextlib
+import fcntl
+import itertools
+import os
+import queue
+import tempfile
+import threading
+import time
+
+from tuxport import archives, integrity, links, net, pe, progress, ranged, trace
+
+QUEUED = "queued"
+RUNNING = "running"
+PAUSED = "paused"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+CLAIM_POLL = 0.2  # Seconds between tries for a partial another job is downloading
+
+
+class DownloadCancelled(Exception):
+    pass
+
+
+class NoInstallerFound(Exception):
+    pass
+
+
+class DownloadJob:
+    _ids = itertools.count(1)
+
+    def __init__(self, url, dest_dir, on_update=None, connections=4, cache=None, checksum=None, sidecar=True):
+        self.id = next(self._ids)
+        self.url, fragment_checksum = integrity.split_url(url)
+        self.checksum = checksum or fragment_checksum  # (algorithm, hex) or None
+        self.sidecar = sidecar
+        self.sha256 = None
+        self.verified = None  # "user" or "sidecar" once a known checksum matched
+        self.exe_url = None
+        self.dest_dir = dest_dir
+        self.path = None
+        self.archive = None
+        self.state = QUEUED
+        self.downloaded = 0
+        self.transferred = 0
+        self.total = None  # None until known; stays None for unsized streams
+        self.meter = progress.Meter()
+        self.error = None
+        self.on_update = on_update
+        self.connections = connections
+        self.cache = cache
+        self.cache_hit = False
+        self._cancel = threading.Event()
+        self._unpaused = threading.Event()
+        self._unpaused.set()
+        self._post = None
+
+    @property
+    def name(self):
+        if self.exe_url:
+            return links.installer_name(self.exe_url)
+        return self.url
+
+    @property
+    def finished(self):
+        return self.state in FINISHED_STATES
+
+    @property
+    def rate(self):
+        return self.meter.rate
+
+    @property
+    def eta(self):
+        return self.meter.eta(self.downloaded, self.total)
+
+    def pause(self):
+        self._unpaused.clear()
+
+    def resume(self):
+        self._unpaused.set()
+
+    def cancel(self):
+        self._cancel.set()
+        self._unpaused.set()
+
+    def checkpoint(self):
+        # Called by the worker between chunks: blocks while paused and
+        # aborts once cancelled.
+        if not self._unpaused.is_set():
+            self._set_state(PAUSED)
+            self._unpaused.wait()
+            if not self._cancel.is_set():
+                self._set_state(RUNNING)
+        if self._cancel.is_set():
+            raise DownloadCancelled()
+
+    def _set_state(self, state):
+        self.state = state
+        if self._post:
+            self._post(self)
+
+
+def resolve_installer(url, headers_for=None):
+    """Return ``(exe_url, probe)`` for the best downloadable installer.
+
+    Direct links are used as-is, anything else is treated as a download page:
+    every candidate on it is HEAD-probed concurrently over pooled
+    connections and the best-ranked one that is alive and not an HTML page
+    wins.
+    """
+    with trace.span("link_resolution", url=url) as attrs:
+        return _resolve_installer(url, headers_for, attrs)
+
+
+def _resolve_installer(url, headers_for, attrs):
+    if links.looks_like_installer(url):
+        attrs["direct"] = True
+        return url, ranged.probe(url, headers_for(url) if headers_for else None)
+    with trace.span("page_fetch", url=url) as page:
+        candidates = links.discover(url)
+        page["candidates"] = len(candidates)
+    if not candidates:
+        raise NoInstallerFound("No .exe download links found on the page.")
+    results = net.probe_all(candidates, ranged.probe, headers_for)
+    for candidate, info in zip(candidates, results):
+        if not isinstance(info, Exception) and net.is_installer_response(info):
+            return candidate, info
+    raise NoInstallerFound(f"None of the {len(candidates)} .exe links on the page could be downloaded.")
+
+
+def _check_program(path):
+    # A login page or error document served as "setup.exe" should fail here, not in Wine
+    problem = pe.problem(pe.inspect(path, scan=False))
+    if problem:
+        os.remove(path)
+        raise NoInstallerFound(f"The downloaded file cannot be run: {problem}.")
+
+
+def _check_archive(path):
+    if not archives.is_archive(path):
+        os.remove(path)
+        raise NoInstallerFound("The downloaded file is not a .zip, .7z or .tar archive.")
+
+
+def _unpack(job, archive, root, extractor=None):
+    # The archive's checksum keys the extraction, so the same bundle from any URL is unpacked once
+    job.archive = archive
+    with trace.span("archive_extract", archive=os.path.basename(archive), streamed=extractor is not None):
+        try:
+            if extractor is not None and extractor.tail.error is None:
+                return extractor.finish(archive, job.sha256, root)
+            if extractor is not None:
+                extractor.discard()  # The download started over, so the complete file is extracted instead
+            return archives.extract(archive, key=job.sha256, root=root)
+        except archives.NoProgramFound as e:
+            raise NoInstallerFound(str(e)) from e
+
+
+def _expected_checksum(job, name):
+    if job.checksum:
+        return job.checksum, "user"
+    if job.sidecar:
+        checksum = integrity.fetch_sidecar(job.exe_url, name)
+        if checksum:
+            return checksum, "sidecar"
+    return None, None
+
+
+def _cached_matches(cache, job, expected):
+    entry = cache.lookup(job.exe_url)
+    algorithm, digest = expected
+    if algorithm == "sha256":
+        return entry is not None and entry["sha256"] == digest
+    # Rare: a non-sha256 checksum for a cached blob costs one read
+    digests = integrity.Digests((algorithm,))
+    with open(cache.hit(job.exe_url), 'rb') as f:
+        for chunk in iter(lambda: f.read(integrity.CHUNK_MAX), b""):
+            digests.update(chunk)
+    return digests.hexdigest(algorithm) == digest
+
+
+def _download(job, dest, info, expected, tail=None):
+    digests = integrity.Digests()
+    if expected:
+        digests.add(expected[0])
+    with trace.span("download", url=job.exe_url, connections=job.connections, verify=bool(expected)) as attrs:
+        ranged.download(job.exe_url, dest, job, connections=job.connections, info=info,
+                        digests=digests, expected=expected, tail=tail)
+        attrs.update(bytes=job.downloaded, transferred=job.transferred)
+    job.sha256 = digests.hexdigest()
+
+
+@contextlib.contextmanager
+def _claim(partial, job):
+    # Polls rather than blocking, so the waiting job can still be paused or cancelled
+    with open(partial + ".lock", 'a') as f:
+        while True:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                job.checkpoint()
+                time.sleep(CLAIM_POLL)
+        yield partial  # Closing the file releases the lock
+
+
+def fetch(job):
+    cache = job.cache
+    job.exe_url, info = resolve_installer(job.url, cache.conditional_headers if cache else None)
+    job.checkpoint()
+    name = links.installer_name(job.exe_url)
+    archive = archives.is_archive_name(name)
+    expected, source = _expected_checksum(job, name)
+    if cache is None:
+        job.path = os.path.join(job.dest_dir, name)
+        _download(job, job.path, info, expected)
+        if archive:
+            _check_archive(job.path)
+            job.path = _unpack(job, job.path, os.path.join(job.dest_dir, "extracted"))
+        else:
+            _check_program(job.path)
+        job.verified = source
+        return job.path
+    with _claim(cache.partial_path(job.exe_url, name), job) as partial:
+        return _fetch_cached(job, cache, info, name, partial, expected, source)
+
+
+def _fetch_cached(job, cache, info, name, partial, expected, source):
+    archive = archives.is_archive_name(name)
+    with trace.span("cache_lookup", url=job.exe_url) as attrs:
+        fresh = cache.is_fresh(job.exe_url, info)
+        attrs["hit"] = fresh and (expected is None or _cached_matches(cache, job, expected))
+    if attrs["hit"]:
+        job.cache_hit = True
+        job.path = cache.hit(job.exe_url)
+        job.sha256 = cache.lookup(job.exe_url)["sha256"]
+        job.total = job.downloaded = os.path.getsize(job.path)
+        if archive:
+            job.path = _unpack(job, job.path, cache.extract_dir)
+        job.verified = source
+        return job.path
+    if fresh:
+        info = ranged.probe(job.exe_url)  # Cached copy fails the checksum; fetch it again
+    if info.status == 304:
+        # Cached blob vanished between the probe and now; ask again unconditionally
+        info = ranged.probe(job.exe_url)
+    extractor = None
+    if name.lower().endswith(archives.STREAMABLE_SUFFIXES):
+        # Unpack the tar as it arrives, so the program is ready soon after the last byte
+        extractor = archives.StreamExtractor(archives.Tail(), partial + ".unpack")
+    try:
+        _download(job, partial, info, expected, tail=extractor and extractor.tail)
+        job.checkpoint()
+        if archive:
+            _check_archive(partial)
+        else:
+            _check_program(partial)
+        job.path = cache.store(job.exe_url, partial, name, info.etag, info.last_modified, sha=job.sha256)
+        if archive:
+            job.path = _unpack(job, job.path, cache.extract_dir, extractor)
+    except BaseException:
+        if extractor is not None:
+            extractor.discard()
+        raise
+    job.verified = source
+    return job.path
+
+
+class DownloadManager:
+    """Runs DownloadJobs on ``workers`` threads and reports back to Tk."""
+
+    def __init__(self, workers=3, dest_dir=None, fetcher=fetch, connections=4, cache=None, sidecar=True):
+        self.workers = workers
+        self.connections = connections
+        self.cache = cache
+        self.sidecar = sidecar
+        self.dest_dir = dest_dir or tempfile.gettempdir()
+        self.fetcher = fetcher
+        self.jobs = {}
+        self._queue = queue.Queue()
+        self._events = queue.Queue()
+        self._threads = []
+        self._progress_seen = {}
+        self._lock = threading.Lock()
+
+    def submit(self, url, on_update=None, checksum=None):
+        job = DownloadJob(url, self.dest_dir, on_update, self.connections, self.cache, checksum, self.sidecar)
+        job._post = self._events.put
+        self.jobs[job.id] = job
+        self._ensure_workers()
+        self._queue.put(job)
+        self._events.put(job)
+        return job
+
+    def active_jobs(self):
+        return [j for j in self.jobs.values() if not j.finished]
+
+    def _ensure_workers(self):
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            while len(self._threads) < self.workers:
+                t = threading.Thread(target=self._worker, name="tuxport-download", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            self._run(job)
+
+    def _run(self, job):
+        try:
+            job.checkpoint()
+            job._set_state(RUNNING)
+            self.fetcher(job)
+            job._set_state(DONE)
+        except DownloadCancelled:
+            job._set_state(CANCELLED)
+        except Exception as e:
+            job.error = e
+            job._set_state(FAILED)
+
+    def poll(self):
+        # Runs on the Tk thread: deliver state changes, then progress for
+        # jobs whose byte count moved since the last poll (or, when stalled,
+        # once a second so the rate can fall).
+        changed = {}
+        while True:
+            try:
+                job = self._events.get_nowait()
+            except queue.Empty:
+                break
+            changed[job.id] = job
+        for job in changed.values():
+            self._notify(job)
+        now = time.monotonic()
+        for job in list(self.jobs.values()):
+            if job.state != RUNNING:
+                job.meter.hold()
+                continue
+            job.meter.sample(job.transferred, now)
+            if job.id in changed:
+                continue
+            seen = self._progress_seen.get(job.id)
+            if seen is None or seen[0] != job.downloaded or now - seen[1] >= 1:
+                self._notify(job)
+        for job_id in changed:
+            job = self.jobs.get(job_id)
+            if job is not None and job.finished:
+                del self.jobs[job_id]
+                self._progress_seen.pop(job_id, None)
+
+    def _notify(self, job):
+        self._progress_seen[job.id] = (job.downloaded, time.monotonic())
+        if job.on_update:
+            job.on_update(job)
+
+    def attach(self, root, interval=progress.SAMPLE_INTERVAL_MS):
+        def tick():
+            self.poll()
+            root.after(interval, tick)
+        root.after(interval, tick)
+
+    def shutdown(self):
+        for job in list(self.jobs.values()):
+            job.cancel()
+        for _ in self._threads:
+            self._queue.put(None)
+        if self.cache is not None:
+            self.cache.flush()  # LRU times of the hits not written yet
@@ -0,0 +1,591 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""The "Select a Windows Installer" file explorer dialog.
+
+Directories are listed with ``os.scandir`` on a background thread. Only
+folders and installers are kept, and only those are stat'ed, through the
+cached ``DirEntry.stat()``. Batches stream into a virtualized
+``ttk.Treeview`` that holds one item per *visible* row, so a folder with
+100k entries costs the same to draw as one with 20. The Type column is
+filled from tuxport.pe's cache and the program icons from tuxport.icons,
+with visible rows inspected in the background.
+
+Archives open like folders that list the programs inside them (read from
+the archive's index, nothing extracted); choosing one extracts just its
+folder through tuxport.archives.
+"""
+
+import base64
+import collections
+import os
+import queue
+import threading
+import time
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from tuxport import archives, pe
+from tuxport.indexer import INSTALLER_SUFFIXES, quick_folders
+
+BATCH_SIZE = 512
+POLL_MS = 30
+RESORT_INTERVAL = 0.25  # Re-sort at most this often while a scan is still streaming in
+PHOTO_ENTRIES = 1024
+BROWSE_SUFFIXES = INSTALLER_SUFFIXES + archives.ARCHIVE_SUFFIXES
+
+# Tk images outlive the dialog, so re-opening a folder shows its icons at once
+_photos = collections.OrderedDict()  # (path, size, mtime) -> PhotoImage, or None for no icon
+
+Entry = collections.namedtuple("Entry", "name is_dir size mtime path")
+
+
+def scan_directory(path, out, cancel, suffixes=BROWSE_SUFFIXES):
+    # Worker thread: posts lists of Entry, then None (or an exception) when done
+    try:
+        batch = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if cancel.is_set():
+                    return
+                try:
+                    is_dir = entry.is_dir()  # d_type from readdir, no stat needed
+                    if not is_dir and not entry.name.lower().endswith(suffixes):
+                        continue
+                    st = entry.stat()  # cached on the DirEntry
+                except OSError:
+                    continue
+                batch.append(Entry(entry.name, is_dir, 0 if is_dir else st.st_size, st.st_mtime, entry.path))
+                if len(batch) >= BATCH_SIZE:
+                    out.put(batch)
+                    batch = []
+        out.put(batch)
+        out.put(None)
+    except OSError as e:
+        out.put(e)
+
+
+def scan_archive(path, out, cancel):
+    # Worker thread, like scan_directory: the programs in the archive, named by their path inside it
+    try:
+        mtime = os.stat(path).st_mtime
+        items = archives.programs(archives.members(path))
+    except (archives.ArchiveError, OSError) as e:
+        out.put(e)
+        return
+    if not cancel.is_set():
+        out.put([Entry(m.name, False, m.size, mtime, os.path.join(path, m.name)) for m in items])
+        out.put(None)
+
+
+SORT_KEYS = {
+    "name": lambda e: e.name.lower(),
+    "size": lambda e: e.size,
+    "modified": lambda e: e.mtime,
+}
+
+
+def sort_entries(entries, column="name", reverse=False):
+    # Folders always stay above files, whichever way the column is sorted
+    key = SORT_KEYS[column]
+    dirs = sorted((e for e in entries if e.is_dir), key=key, reverse=reverse)
+    files = sorted((e for e in entries if not e.is_dir), key=key, reverse=reverse)
+    return dirs + files
+
+
+def format_entry(entry, kind="", emoji=True):
+    # emoji=False when the row shows the program's own icon instead
+    icon = '📁' if entry.is_dir else '📦' if archives.is_archive_name(entry.name) else '🟦'
+    name = f"{icon} {entry.name}" if emoji else entry.name
+    size = "-" if entry.is_dir else f"{entry.size // 1024} KB"
+    mtime = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.mtime))
+    return (name, size, mtime, kind)
+
+
+class VirtualTree(ttk.Frame):
+    """A Treeview that only ever holds the rows currently on screen.
+
+    The first column is the tree column (#0), the only one that can show an
+    image; ``imager(entry)`` supplies it.
+    """
+
+    COLUMNS = (("name", "Name", 300, 'w'), ("size", "Size", 80, 'e'), ("modified", "Modified", 130, 'w'),
+               ("kind", "Type", 200, 'w'))
+
+    def __init__(self, parent, on_activate, formatter=format_entry, imager=None):
+        super().__init__(parent)
+        self.on_activate = on_activate
+        self.formatter = formatter
+        self.imager = imager
+        self.rows = []
+        self.offset = 0
+        self.visible = 20
+        self.selected = None
+        self.sort_column = "name"
+        self.sort_reverse = False
+        self.on_sort = None
+        self._slots = []
+        self._measured = False
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in self.COLUMNS[1:]], show='tree headings',
+                                 selectmode='browse')
+        for i, (col, title, width, anchor) in enumerate(self.COLUMNS):
+            cid = "#0" if i == 0 else col
+            if col in SORT_KEYS:
+                self.tree.heading(cid, text=title, command=lambda c=col: self._sort_clicked(c))
+            else:
+                self.tree.heading(cid, text=title)
+            self.tree.column(cid, width=width, anchor=anchor, stretch=(col == "name"))
+        self.scroll = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+        self.scroll.pack(side='right', fill='y')
+        self.tree.pack(side='left', fill='both', expand=True)
+
+        self.tree.bind('<Configure>', lambda e: self.after_idle(self._measure))
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<Double-1>', lambda e: self._activate())
+        self.tree.bind('<Return>', lambda e: self._activate())
+        self.tree.bind('<MouseWheel>', lambda e: self.scroll_by(-1 if e.delta > 0 else 1, 3))
+        self.tree.bind('<Button-4>', lambda e: self.scroll_by(-1, 3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_by(1, 3))
+        self.tree.bind('<Up>', lambda e: self.move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self.move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self.move_selection(-self.visible))
+        self.tree.bind('<Next>', lambda e: self.move_selection(self.visible))
+        self.tree.bind('<Home>', lambda e: self.move_selection(-len(self.rows)))
+        self.tree.bind('<End>', lambda e: self.move_selection(len(self.rows)))
+
+    # --- data ---
+    def set_rows(self, rows, keep_position=False):
+        selected = self.selected_entry()
+        self.rows = rows
+        if not keep_position:
+            self.offset = 0
+        self.selected = None
+        if selected is not None and keep_position:
+            try:
+                self.selected = rows.index(selected)
+            except ValueError:
+                pass
+        self.refresh()
+
+    def selected_entry(self):
+        if self.selected is not None and self.selected < len(self.rows):
+            return self.rows[self.selected]
+        return None
+
+    # --- viewport ---
+    def _measure(self):
+        # Work out how many rows fit from the height of a real row
+        if not self._slots:
+            return
+        bbox = self.tree.bbox(self._slots[0])
+        if not bbox:
+            return
+        self._measured = True
+        visible = max(1, (self.tree.winfo_height() - bbox[1]) // max(1, bbox[3]))
+        if visible != self.visible:
+            self.visible = visible
+            self.refresh()
+
+    def refresh(self):
+        self.offset = max(0, min(self.offset, len(self.rows) - self.visible))
+        wanted = min(self.visible, len(self.rows) - self.offset)
+        while len(self._slots) < wanted:
+            self._slots.append(self.tree.insert('', 'end', values=("",) * (len(self.COLUMNS) - 1)))
+        while len(self._slots) > wanted:
+            self.tree.delete(self._slots.pop())
+        for i, slot in enumerate(self._slots):
+            entry = self.rows[self.offset + i]
+            image = self.imager(entry) if self.imager else None  # First: the formatter drops the emoji for it
+            values = self.formatter(entry)
+            self.tree.item(slot, text=values[0], values=values[1:], image=image or '')
+        slot_index = None if self.selected is None else self.selected - self.offset
+        if slot_index is not None and 0 <= slot_index < len(self._slots):
+            self.tree.selection_set(self._slots[slot_index])
+            self.tree.focus(self._slots[slot_index])
+        elif self.tree.selection():
+            self.tree.selection_set(())
+        if self._slots and not self._measured:
+            self.after_idle(self._measure)
+        total = len(self.rows)
+        if total <= self.visible:
+            self.scroll.set(0, 1)
+        else:
+            self.scroll.set(self.offset / total, (self.offset + self.visible) / total)
+
+    def scroll_to(self, offset):
+        self.offset = int(offset)
+        self.refresh()
+
+    def scroll_by(self, direction, amount=1):
+        self.scroll_to(self.offset + direction * amount)
+        return "break"
+
+    def _on_scrollbar(self, *args):
+        if args[0] == 'moveto':
+            self.scroll_to(float(args[1]) * len(self.rows))
+        elif args[0] == 'scroll':
+            step = self.visible if args[2] == 'pages' else 1
+            self.scroll_by(int(args[1]), step)
+
+    def move_selection(self, delta):
+        if not self.rows:
+            return "break"
+        current = self.offset if self.selected is None else self.selected
+        self.selected = max(0, min(len(self.rows) - 1, current + delta))
+        if self.selected < self.offset:
+            self.offset = self.selected
+        elif self.selected >= self.offset + self.visible:
+            self.offset = self.selected - self.visible + 1
+        self.refresh()
+        return "break"
+
+    def _on_select(self, event=None):
+        sel = self.tree.selection()
+        if sel and sel[0] in self._slots:
+            self.selected = self.offset + self._slots.index(sel[0])
+
+    def _activate(self):
+        entry = self.selected_entry()
+        if entry is not None:
+            self.on_activate(entry)
+        return "break"
+
+    def _sort_clicked(self, column):
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column, self.sort_reverse = column, False
+        if self.on_sort:
+            self.on_sort()
+
+
+class FileExplorer:
+    def __init__(self, root, initialdir=None, index=None, pe_cache=None, icon_cache=None):
+        self.root = root
+        self.index = index
+        self.pe_cache = pe_cache
+        self.icon_cache = icon_cache
+        self._pe_results = queue.Queue()
+        self._pe_wanted = []
+        self._pe_inflight = set()
+        self._pe_seen = {}  # Results by path, in case a file changed after it was listed
+        self._icon_results = queue.Queue()
+        self._icon_wanted = []
+        self._icon_inflight = set()
+        self._icon_seen = {}
+        self._details_polling = False
+        self.all_entries = []
+        self.filter_text = ""
+        self.selected_file = None
+        self._members = {}  # Entry path -> (archive, member) for rows listed from an archive
+        self._archive = None  # Set while an archive is listed instead of a folder
+        self._extracting = False
+        self._scan_queue = None
+        self._scan_cancel = threading.Event()
+        self._scanning = False
+        self._sorted_at = 0.0
+
+        self.window = explorer = tk.Toplevel(root)
+        explorer.title("Select a Windows Installer (.exe)")
+        explorer.geometry("760x480")
+        explorer.resizable(True, True)
+        explorer.protocol("WM_DELETE_WINDOW", self.on_cancel)
+
+        self.current_dir = tk.StringVar(value=initialdir or os.path.expanduser("~"))
+
+        # Sidebar quick access (only show folders that exist)
+        sidebar = tk.Frame(explorer, bg="#f0f0f0", width=120)
+        sidebar.pack(side='left', fill='y')
+        for label, path in quick_folders():
+            if os.path.exists(path):
+                btn = tk.Button(sidebar, text=label, anchor='w', command=lambda p=path: self.load(p), relief='flat', bg="#f0f0f0")
+                btn.pack(fill='x', padx=8, pady=2)
+
+        # Main area
+        main_frame = tk.Frame(explorer)
+        main_frame.pack(side='left', fill='both', expand=True)
+
+        # Path and navigation
+        nav_frame = tk.Frame(main_frame)
+        nav_frame.pack(fill='x', pady=(8, 0))
+        tk.Button(nav_frame, text="⬆️ Up", command=self.on_up).pack(side='left', padx=4)
+        tk.Label(nav_frame, textvariable=self.current_dir, anchor='w').pack(side='left', fill='x', expand=True, padx=8)
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add('write', lambda *a: self.apply_filter(self.filter_var.get()))
+        tk.Label(nav_frame, text="🔎").pack(side='left')
+        self.filter_entry = tk.Entry(nav_frame, textvariable=self.filter_var, width=18)
+        self.filter_entry.pack(side='left', padx=(0, 4))
+        self.search_all = tk.BooleanVar(value=False)
+        if index is not None:
+            # Searches the background .exe index instead of the current folder
+            tk.Checkbutton(nav_frame, text="All folders", variable=self.search_all,
+                           command=lambda: self.apply_filter(self.filter_var.get())).pack(side='left', padx=(0, 8))
+
+        # Title/instructions
+        tk.Label(main_frame, text="Select a Windows Installer (.exe) from the list below, or open an archive.", font=("Segoe UI", 12, "bold"), anchor='w').pack(fill='x', padx=8, pady=(8, 0))
+
+        # File list
+        self.list = VirtualTree(main_frame, on_activate=self.on_activate, formatter=self.format_row,
+                                imager=self.row_image if icon_cache is not None else None)
+        self.list.on_sort = self.resort
+        self.list.pack(fill='both', expand=True, padx=8, pady=4)
+
+        # Status/empty message
+        self.status_label = tk.Label(main_frame, text="", fg="#888", anchor='w')
+        self.status_label.pack(fill='x', padx=8)
+
+        # Bottom buttons
+        btn_frame = tk.Frame(main_frame)
+        btn_frame.pack(fill='x', pady=8)
+        tk.Button(btn_frame, text="Select", command=self.on_confirm).pack(side='right', padx=8)
+        tk.Button(btn_frame, text="Cancel", command=self.on_cancel).pack(side='right', padx=8)
+
+        self.load(self.current_dir.get())
+
+    # --- scanning ---
+    def load(self, path):
+        self._scan_cancel.set()
+        self._scan_cancel = threading.Event()
+        self._scan_queue = queue.Queue()
+        self.current_dir.set(path)
+        self.all_entries = []
+        self.list.set_rows([])
+        self._scanning = True
+        self._sorted_at = time.monotonic()
+        self.status_label.config(text="Scanning…")
+        self._archive = path if archives.is_archive_name(path) and os.path.isfile(path) else None
+        scan = scan_archive if self._archive else scan_directory
+        threading.Thread(target=scan, args=(path, self._scan_queue, self._scan_cancel), daemon=True).start()
+        self.window.after(POLL_MS, self._drain, self._scan_queue)
+
+    def _drain(self, q):
+        if q is not self._scan_queue or not self.window.winfo_exists():
+            return  # A newer scan replaced this one
+        deadline = time.monotonic() + 0.015  # Keep each UI tick short
+        error = None
+        while time.monotonic() < deadline:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._scanning = False
+                break
+            if isinstance(item, Exception):
+                error = item
+                self._scanning = False
+                break
+            self.all_entries.extend(item)
+            if self._archive:
+                self._members.update((e.path, (self._archive, e.name)) for e in item)
+        now = time.monotonic()
+        if not self._scanning or now - self._sorted_at >= RESORT_INTERVAL:
+            self._sorted_at = now
+            self.resort(keep_position=True)
+        if error is not None:
+            self.status_label.config(text=f"Error: {error}")
+        elif self._scanning:
+            self.status_label.config(text=f"Scanning… {len(self.all_entries)} items")
+            self.window.after(POLL_MS, self._drain, q)
+        elif not self.all_entries:
+            self.status_label.config(text="(This folder is empty)")
+        else:
+            self.status_label.config(text=f"{len(self.all_entries)} items")
+
+    # --- sorting/filtering ---
+    def resort(self, keep_position=False):
+        self.all_entries = sort_entries(self.all_entries, self.list.sort_column, self.list.sort_reverse)
+        self._filter_from(self.all_entries, keep_position)
+
+    def apply_filter(self, text):
+        text = text.lower()
+        if self.search_all.get() and text:
+            self.search_index(text)
+            return
+        # Narrowing the filter only needs to look at what is already shown
+        source = self.list.rows if self.filter_text and text.startswith(self.filter_text) else self.all_entries
+        self.filter_text = text
+        self._filter_from(source)
+
+    def _filter_from(self, source, keep_position=False):
+        text = self.filter_text
+        rows = [e for e in source if text in e.name.lower()] if text else list(source)
+        self.list.set_rows(rows, keep_position)
+        if not self._scanning and self.all_entries:
+            self.status_label.config(text=f"{len(rows)} of {len(self.all_entries)} items" if text else f"{len(rows)} items")
+
+    def search_index(self, text):
+        self.filter_text = ""  # The next folder filter starts from the full listing
+        home = os.path.expanduser("~")
+        start = time.perf_counter()
+        rows = []
+        for path, size, mtime, _ in self.index.search(text):
+            name = "~" + path[len(home):] if path.startswith(home + os.sep) else path
+            rows.append(Entry(name, False, size, mtime, path))
+        rows = sort_entries(rows, self.list.sort_column, self.list.sort_reverse)
+        self.list.set_rows(rows)
+        took = (time.perf_counter() - start) * 1000
+        note = " (index still updating)" if self.index.running else ""
+        self.status_label.config(text=f"{len(rows)} matches in all folders, {took:.0f} ms{note}")
+
+    # --- PE details and icons ---
+    def format_row(self, entry):
+        # Called for visible rows only; unknown files are inspected in the background
+        emoji = _photos.get((entry.path, entry.size, entry.mtime)) is None
+        if entry.path in self._members:
+            return format_entry(entry, "In archive", emoji)
+        if archives.is_archive_name(entry.name):
+            return format_entry(entry, "Archive", emoji)
+        if entry.is_dir or self.pe_cache is None:
+            return format_entry(entry, emoji=emoji)
+        info = self.pe_cache.peek(entry.path, entry.size, entry.mtime) or self._pe_seen.get(entry.path)
+        if info is None:
+            self._want(entry.path, self._pe_wanted, self._pe_inflight)
+            return format_entry(entry, "…", emoji)
+        return format_entry(entry, pe.describe(info), emoji)
+
+    def row_image(self, entry):
+        # Also visible rows only: memory hits are a dict lookup, the rest are extracted in the background
+        if entry.is_dir or entry.path in self._members or archives.is_archive_name(entry.name):
+            return None
+        key = (entry.path, entry.size, entry.mtime)
+        if key in _photos:
+            _photos.move_to_end(key)
+            return _photos[key]
+        png = self.icon_cache.peek(*key)
+        if png is None:
+            png = self._icon_seen.get(entry.path)
+        if png is None:
+            self._want(entry.path, self._icon_wanted, self._icon_inflight)
+            return None
+        try:
+            photo = tk.PhotoImage(master=self.root, data=base64.b64encode(png)) if png else None
+        except tk.TclError:
+            photo = None
+        _photos[key] = photo
+        while len(_photos) > PHOTO_ENTRIES:
+            _photos.popitem(last=False)
+        return photo
+
+    def _want(self, path, wanted, inflight):
+        if path in inflight:
+            return
+        if not self._pe_wanted and not self._icon_wanted:
+            self.window.after_idle(self._request_details)
+        wanted.append(path)
+        inflight.add(path)
+
+    def _request_details(self):
+        if not self.window.winfo_exists():
+            return
+        if self._pe_wanted:
+            wanted, self._pe_wanted = self._pe_wanted, []
+            self.pe_cache.request(wanted, self._pe_results)
+        if self._icon_wanted:
+            # Reversed: the icon worker takes the newest request first, so rows come in top-down
+            wanted, self._icon_wanted = self._icon_wanted, []
+            self.icon_cache.request(reversed(wanted), self._icon_results)
+        if not self._details_polling:
+            self._details_polling = True
+            self.window.after(POLL_MS, self._drain_details)
+
+    def _drain_details(self):
+        if not self.window.winfo_exists():
+            return
+        got = False
+        for results, inflight, seen in ((self._pe_results, self._pe_inflight, self._pe_seen),
+                                        (self._icon_results, self._icon_inflight, self._icon_seen)):
+            while True:
+                try:
+                    path, value = results.get_nowait()
+                except queue.Empty:
+                    break
+                inflight.discard(path)
+                seen[path] = value
+                got = True
+        if got:
+            self.list.refresh()
+        self._details_polling = bool(self._pe_inflight or self._icon_inflight)
+        if self._details_polling:
+            self.window.after(POLL_MS, self._drain_details)
+
+    # --- actions ---
+    def on_activate(self, entry):
+        if entry.is_dir or (archives.is_archive_name(entry.name) and entry.path not in self._members):
+            self.filter_var.set("")
+            self.load(entry.path)
+        else:
+            self.choose(entry)  # Double-click on .exe selects and closes
+
+    def choose(self, entry):
+        if entry.path not in self._members:
+            self.selected_file = entry.path
+            self.close()
+            return
+        if self._extracting:
+            return
+        # Extracted on a worker; the dialog stays responsive and closes when the program is on disk
+        self._extracting = True
+        archive, member = self._members[entry.path]
+        self.status_label.config(text=f"Extracting {member}…")
+        self.window.config(cursor="watch")
+        out = queue.Queue()
+
+        def work():
+            try:
+                out.put(archives.extract(archive, member))
+            except (archives.ArchiveError, OSError) as e:
+                out.put(e)
+        threading.Thread(target=work, daemon=True).start()
+        self.window.after(POLL_MS, self._drain_extract, out)
+
+    def _drain_extract(self, out):
+        if not self.window.winfo_exists():
+            return
+        try:
+            result = out.get_nowait()
+        except queue.Empty:
+            self.window.after(POLL_MS, self._drain_extract, out)
+            return
+        self._extracting = False
+        self.window.config(cursor="")
+        if isinstance(result, Exception):
+            self.status_label.config(text=f"Error: {result}")
+            return
+        self.selected_file = result
+        self.close()
+
+    def on_up(self):
+        parent = os.path.dirname(self.current_dir.get())
+        if parent and parent != self.current_dir.get():
+            self.load(parent)
+
+    def on_confirm(self):
+        entry = self.list.selected_entry()
+        if entry is not None and archives.is_archive_name(entry.name) and entry.path not in self._members:
+            self.on_activate(entry)  # Opens the archive to pick a program from it
+        elif entry is not None and not entry.is_dir:
+            self.choose(entry)
+        else:
+            messagebox.showerror("Invalid Selection", "Please select a .exe file.", parent=self.window)
+
+    def on_cancel(self):
+        self.selected_file = None
+        self.close()
+
+    def close(self):
+        self._scan_cancel.set()
+        self.window.destroy()
+
+    def show(self):
+        self.window.transient(self.root)
+        self.window.grab_set()
+        self.list.tree.focus_set()
+        self.root.wait_window(self.window)
+        return self.selected_file
+
+
+def custom_file_explorer(root, initialdir=None, index=None, pe_cache=None, icon_cache=None):
+    return FileExplorer(root, initialdir, index, pe_cache, icon_cache).show()
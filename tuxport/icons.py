@@ -0,0 +1,315 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Program icons for the explorer, pulled out of each PE's resources.
+
+``extract()`` takes the first RT_GROUP_ICON, picks the RT_ICON image
+nearest the list size (preferring the exact size and the most colours),
+decodes it (BMP/DIB or PNG), scales it and re-encodes it as a small PNG
+that Tk can show. No imaging library is needed.
+
+``IconCache`` keeps the PNGs per (path, size, mtime), in memory and in
+SQLite, like pe.PECache; a background thread extracts them, newest
+request first, so the rows on screen are served before ones scrolled past.
+"""
+
+import collections
+import mmap
+import os
+import queue
+import sqlite3
+import struct
+import threading
+import zlib
+
+from tuxport import pe
+from tuxport.cache import CACHE_DIR
+
+ICON_CACHE_PATH = os.path.join(CACHE_DIR, "icons.db")
+ICON_SIZE = 16
+MEMORY_ENTRIES = 4096
+MAX_ICON_BYTES = 1024 * 1024  # A 256x256 32-bit icon is 256 KiB; anything bigger is not an icon
+RT_ICON = 3
+RT_GROUP_ICON = 14
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def extract(path, size=ICON_SIZE):
+    """Return the program icon of ``path`` as PNG bytes of ``size`` pixels, or None."""
+    with open(path, 'rb') as f:
+        length = os.fstat(f.fileno()).st_size
+        if length < 64:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            group, images = None, {}
+            for rtype, name, offset, n in pe.resources(m, length):
+                if rtype == RT_GROUP_ICON and group is None:
+                    group = bytes(m[offset:offset + n])
+                elif rtype == RT_ICON and n <= MAX_ICON_BYTES:
+                    images.setdefault(name, (offset, n))
+            if group is None:
+                return None
+            best = _pick(group, images, size)
+            if best is None:
+                return None
+            offset, n = images[best]
+            data = bytes(m[offset:offset + n])
+    try:
+        if data.startswith(PNG_SIGNATURE):
+            width, height, rows = _decode_png(data)
+            if rows is None:
+                return data if (width, height) == (size, size) else None  # Tk can show it as is
+        else:
+            width, height, rows = _decode_dib(data)
+    except (struct.error, IndexError, ValueError, zlib.error):
+        return None
+    return encode_png(size, size, _scale(rows, width, height, size))
+
+
+def _pick(group, images, size):
+    # GRPICONDIR: reserved, type, count; then 14-byte entries
+    count = struct.unpack_from("<H", group, 4)[0]
+    candidates = []
+    for i in range(count):
+        off = 6 + i * 14
+        if off + 14 > len(group):
+            break
+        width, _, _, _, _, bits, _, icon_id = struct.unpack_from("<BBBBHHIH", group, off)
+        width = width or 256
+        if icon_id in images:
+            # Exact size first, then the smallest larger one, then the largest smaller one
+            fit = (0, 0) if width == size else (1, width) if width > size else (2, -width)
+            candidates.append((fit, -bits, icon_id))
+    return min(candidates)[2] if candidates else None
+
+
+def _decode_dib(data):
+    header, width, height, _, bits, compression = struct.unpack_from("<IiiHHI", data, 0)
+    height //= 2  # XOR image and AND mask are stacked
+    if compression != 0 or width <= 0 or height <= 0 or width > 256 or height > 256:
+        raise ValueError("unsupported icon bitmap")
+    colors = struct.unpack_from("<I", data, 32)[0] or (1 << bits if bits <= 8 else 0)
+    palette_at = header
+    pixels_at = palette_at + colors * 4
+    palette = [(data[p + 2], data[p + 1], data[p], 255) for p in range(palette_at, pixels_at, 4)]
+    stride = (width * bits + 31) // 32 * 4
+    mask_at = pixels_at + stride * height
+    mask_stride = (width + 31) // 32 * 4
+    has_mask = mask_at + mask_stride * height <= len(data)
+    rows = []
+    any_alpha = False
+    for y in range(height):
+        src = pixels_at + (height - 1 - y) * stride  # Bottom-up
+        row = bytearray(width * 4)
+        for x in range(width):
+            if bits == 32:
+                b, g, r, a = data[src + x * 4:src + x * 4 + 4]
+                any_alpha = any_alpha or a != 0
+            elif bits == 24:
+                b, g, r = data[src + x * 3:src + x * 3 + 3]
+                a = 255
+            elif bits in (1, 4, 8):
+                per_byte = 8 // bits
+                byte = data[src + x // per_byte]
+                index = (byte >> ((per_byte - 1 - x % per_byte) * bits)) & ((1 << bits) - 1)
+                r, g, b, a = palette[index] if index < len(palette) else (0, 0, 0, 255)
+            else:
+                raise ValueError(f"unsupported icon bit depth {bits}")
+            row[x * 4:x * 4 + 4] = bytes((r, g, b, a))
+        rows.append(row)
+    if has_mask and not any_alpha:
+        # No alpha channel (or an all-zero one): the AND mask says what is transparent
+        for y, row in enumerate(rows):
+            src = mask_at + (height - 1 - y) * mask_stride
+            for x in range(width):
+                row[x * 4 + 3] = 0 if data[src + x // 8] & (0x80 >> (x % 8)) else 255
+    return width, height, rows
+
+
+def _decode_png(data):
+    # 8-bit RGB/RGBA, not interlaced, which is what icon editors write; other kinds return rows=None
+    pos, idat = len(PNG_SIGNATURE), []
+    width = height = 0
+    kind = None
+    while pos + 8 <= len(data):
+        n, ctype = struct.unpack_from(">I4s", data, pos)
+        body = data[pos + 8:pos + 8 + n]
+        if ctype == b"IHDR":
+            width, height, depth, color, _, _, interlace = struct.unpack_from(">IIBBBBB", body)
+            kind = (depth, color, interlace)
+        elif ctype == b"IDAT":
+            idat.append(body)
+        elif ctype == b"IEND":
+            break
+        pos += 12 + n
+    if kind not in ((8, 6, 0), (8, 2, 0)) or not 0 < width <= 256 or not 0 < height <= 256:
+        return width, height, None
+    channels = 4 if kind[1] == 6 else 3
+    raw = zlib.decompress(b"".join(idat))
+    stride = width * channels
+    prev = bytearray(stride)
+    rows = []
+    for y in range(height):
+        start = y * (stride + 1)
+        ftype = raw[start]
+        line = bytearray(raw[start + 1:start + 1 + stride])
+        for i in range(stride):
+            left = line[i - channels] if i >= channels else 0
+            up = prev[i]
+            if ftype == 1:
+                line[i] = (line[i] + left) & 0xff
+            elif ftype == 2:
+                line[i] = (line[i] + up) & 0xff
+            elif ftype == 3:
+                line[i] = (line[i] + ((left + up) >> 1)) & 0xff
+            elif ftype == 4:
+                corner = prev[i - channels] if i >= channels else 0
+                p = left + up - corner
+                pa, pb, pc = abs(p - left), abs(p - up), abs(p - corner)
+                line[i] = (line[i] + (left if pa <= pb and pa <= pc else up if pb <= pc else corner)) & 0xff
+        prev = line
+        if channels == 3:
+            rgba = bytearray(width * 4)
+            for x in range(width):
+                rgba[x * 4:x * 4 + 4] = bytes((line[x * 3], line[x * 3 + 1], line[x * 3 + 2], 255))
+            line = rgba
+        rows.append(line)
+    return width, height, rows
+
+
+def _scale(rows, width, height, size):
+    """Box-filter (or, when growing, nearest-neighbour) RGBA ``rows`` to ``size`` x ``size``."""
+    if (width, height) == (size, size):
+        return rows
+    out = []
+    for ty in range(size):
+        y0, y1 = ty * height // size, max(ty * height // size + 1, (ty + 1) * height // size)
+        row = bytearray(size * 4)
+        for tx in range(size):
+            x0, x1 = tx * width // size, max(tx * width // size + 1, (tx + 1) * width // size)
+            r = g = b = a = 0
+            for y in range(y0, y1):
+                src = rows[y]
+                for x in range(x0, x1):
+                    pa = src[x * 4 + 3]
+                    r += src[x * 4] * pa
+                    g += src[x * 4 + 1] * pa
+                    b += src[x * 4 + 2] * pa
+                    a += pa
+            count = (y1 - y0) * (x1 - x0)
+            if a:
+                row[tx * 4:tx * 4 + 4] = bytes((r // a, g // a, b // a, a // count))
+        out.append(row)
+    return out
+
+
+def encode_png(width, height, rows):
+    def chunk(ctype, body):
+        return struct.pack(">I", len(body)) + ctype + body + struct.pack(">I", zlib.crc32(ctype + body))
+    raw = b"".join(b"\0" + bytes(row) for row in rows)
+    return (PNG_SIGNATURE + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 9)) + chunk(b"IEND", b""))
+
+
+class IconCache:
+    """Icon PNG per (path, size, mtime): memory first, then SQLite, then ``extract()``.
+
+    Files without an icon are remembered as ``b""`` so they are not opened again.
+    """
+
+    def __init__(self, path=ICON_CACHE_PATH, size=ICON_SIZE, max_entries=MEMORY_ENTRIES):
+        self.path = path
+        self.size = size
+        self.max_entries = max_entries
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._requests = queue.LifoQueue()  # Newest first: what is on screen now
+        self._pending = set()
+        self._worker = None
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("CREATE TABLE IF NOT EXISTS icons "
+                       "(path TEXT, size INTEGER, mtime REAL, px INTEGER, png BLOB, PRIMARY KEY (path, px))")
+            self._local.db = db
+        return db
+
+    def _remember(self, key, png):
+        with self._lock:
+            self._memory[key] = png
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def peek(self, path, size, mtime):
+        """Memory-only lookup: PNG bytes, ``b""`` for no icon, None if not known yet."""
+        with self._lock:
+            return self._memory.get((path, size, mtime))
+
+    def get(self, path, size, mtime):
+        png = self.peek(path, size, mtime)
+        if png is not None:
+            return png
+        try:
+            row = self._db().execute("SELECT png FROM icons WHERE path = ? AND px = ? AND size = ? AND mtime = ?",
+                                     (path, self.size, size, mtime)).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            return None
+        self._remember((path, size, mtime), row[0])
+        return row[0]
+
+    def icon(self, path):
+        st = os.stat(path)
+        png = self.get(path, st.st_size, st.st_mtime)
+        if png is None:
+            try:
+                png = extract(path, self.size) or b""
+            except (OSError, ValueError):
+                png = b""
+            self._remember((path, st.st_size, st.st_mtime), png)
+            try:
+                db = self._db()
+                db.execute("INSERT OR REPLACE INTO icons VALUES (?, ?, ?, ?, ?)",
+                           (path, st.st_size, st.st_mtime, self.size, png))
+                db.commit()
+            except sqlite3.Error:
+                pass
+        return png
+
+    def request(self, paths, out):
+        """Extract icons for ``paths`` on the background thread; results go to ``out`` as ``(path, png)``."""
+        with self._lock:
+            for path in paths:
+                if path not in self._pending:
+                    self._pending.add(path)
+                    self._requests.put((path, out))
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._work, name="tuxport-icons", daemon=True)
+                self._worker.start()
+
+    def _work(self):
+        while True:
+            try:
+                path, out = self._requests.get(timeout=5)
+            except queue.Empty:
+                with self._lock:
+                    if self._requests.empty():
+                        self._worker = None
+                        return
+                continue
+            try:
+                png = self.icon(path)
+            except OSError:
+                png = b""
+            with self._lock:
+                self._pending.discard(path)
+            out.put((path, png))
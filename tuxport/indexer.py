@@ -0,0 +1,135 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Background index of .exe files for instant search.
+
+The index lives in SQLite next to the installer cache and is crawled
+incrementally by tuxport.dirindex. A directory whose mtime is unchanged
+is not listed again. An update of an unchanged home directory costs one
+``stat`` per directory rather than a full walk.
+"""
+
+import hashlib
+import os
+import threading
+
+from tuxport.cache import CACHE_DIR
+from tuxport.dirindex import DirIndex, like_escape
+
+INDEX_PATH = os.path.join(CACHE_DIR, "index.db")
+FINGERPRINT_BYTES = 64 * 1024
+SEARCH_LIMIT = 200
+INSTALLER_SUFFIXES = (".exe",)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY, dir TEXT, name TEXT, size INTEGER, mtime REAL, fingerprint TEXT
+);
+CREATE INDEX IF NOT EXISTS files_dir ON files(dir);
+"""
+
+
+def quick_folders():
+    home = os.path.expanduser("~")
+    return [
+        ("🏠 Home", home),
+        ("📄 Documents", os.path.join(home, "Documents")),
+        ("⬇️ Downloads", os.path.join(home, "Downloads")),
+        ("🎵 Music", os.path.join(home, "Music")),
+        ("🖼️ Pictures", os.path.join(home, "Pictures")),
+        ("🎬 Videos", os.path.join(home, "Videos")),
+    ]
+
+
+def fingerprint(path, size):
+    # Size plus the first and last 64 KiB: cheap, and enough to spot copies
+    h = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(path, 'rb') as f:
+        h.update(f.read(FINGERPRINT_BYTES))
+        if size > 2 * FINGERPRINT_BYTES:
+            f.seek(-FINGERPRINT_BYTES, os.SEEK_END)
+            h.update(f.read(FINGERPRINT_BYTES))
+    return h.hexdigest()
+
+
+def default_roots(settings):
+    roots = [settings.get("default_folder") or os.path.expanduser("~")]
+    roots += [path for _, path in quick_folders()]
+    roots = sorted({os.path.realpath(r) for r in roots if os.path.isdir(r)})
+    # Drop roots that live inside another root; they get crawled anyway
+    return [r for r in roots if not any(r != o and r.startswith(o.rstrip(os.sep) + os.sep) for o in roots)]
+
+
+class ExeIndex(DirIndex):
+    SCHEMA = SCHEMA
+    ENTRIES = "files"
+
+    def __init__(self, path=INDEX_PATH):
+        super().__init__(path)
+        self._thread = None
+        self._search_db = None
+
+    # --- crawling ---
+    def update(self, roots, cancel=None):
+        """Bring the index up to date for ``roots``; returns crawl stats."""
+        stats = {"dirs": 0, "rescanned": 0, "files": 0}
+        db = self.connect()
+        try:
+            self.crawl(db, roots, stats, cancel)
+            db.commit()
+        finally:
+            db.close()
+        return stats
+
+    def _list(self, db, d, stats):
+        subdirs, exes = [], {}
+        with os.scandir(d) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue  # Hidden dirs (~/.cache, ~/.wine, ...) are not where installers live
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(INSTALLER_SUFFIXES) and entry.is_file():
+                        st = entry.stat()
+                        exes[entry.path] = (entry.name, st.st_size, st.st_mtime)
+                except OSError:
+                    continue
+        known = {p: (size, mt) for p, size, mt in db.execute("SELECT path, size, mtime FROM files WHERE dir = ?", (d,))}
+        for path in known.keys() - exes.keys():
+            db.execute("DELETE FROM files WHERE path = ?", (path,))
+        for path, (name, size, mt) in exes.items():
+            if known.get(path) == (size, mt):
+                continue
+            try:
+                fp = fingerprint(path, size)
+            except OSError:
+                continue
+            db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", (path, d, name, size, mt, fp))
+            stats["files"] += 1
+        return subdirs
+
+    def start_background(self, roots):
+        """Run ``update`` on a daemon thread unless one is already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        self._thread = threading.Thread(target=self.update, args=(roots,), name="tuxport-indexer", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    # --- queries ---
+    def search(self, text, limit=SEARCH_LIMIT):
+        """Return ``(path, size, mtime, fingerprint)`` rows whose name contains ``text``."""
+        # One long-lived connection for the (single) UI thread keeps each query at a few ms
+        if self._search_db is None:
+            self._search_db = self.connect()
+        return self._search_db.execute(
+            "SELECT path, size, mtime, fingerprint FROM files WHERE name LIKE ? ESCAPE '\\' "
+            "ORDER BY mtime DESC LIMIT ?",
+            ("%" + like_escape(text) + "%", limit),
+        ).fetchall()
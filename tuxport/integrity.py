@@ -0,0 +1,181 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Hash-while-downloading and checksum verification.
+
+Downloads feed every chunk they write into ``Digests`` in the same pass,
+so verifying or caching an installer never reads it a second time.
+Segmented downloads arrive out of order. For them ``PrefixHasher`` hashes
+the contiguous prefix of the ``.part`` file as it grows, while those
+pages are still in the page cache. ``ChunkSizer`` keeps reads around
+50 ms each, so memory stays bounded and pause/cancel stay responsive
+at any line speed.
+
+Expected checksums come from the user (``url#sha256=<hex>`` or the CLI)
+or from a ``<installer>.sha256`` sidecar next to the download.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+import urllib.error
+from urllib.parse import urldefrag, urlsplit
+
+from tuxport.net import open_url
+
+DEFAULT_ALGORITHMS = ("sha256",)
+HEX_LENGTHS = {32: "md5", 40: "sha1", 64: "sha256", 96: "sha384", 128: "sha512"}
+SIDECAR_SUFFIX = ".sha256"
+SIDECAR_MAX = 64 * 1024
+
+CHUNK_MIN = 16 * 1024
+CHUNK_MAX = 1024 * 1024
+CHUNK_TARGET_SECONDS = 0.05
+
+
+class ChecksumMismatch(Exception):
+    pass
+
+
+class Digests:
+    """Several hashlib digests fed from one stream of chunks."""
+
+    def __init__(self, algorithms=DEFAULT_ALGORITHMS):
+        self._hashes = {name: hashlib.new(name) for name in dict.fromkeys(algorithms)}
+        self.bytes = 0
+
+    def add(self, algorithm):
+        # Only valid before the first update()
+        self._hashes.setdefault(algorithm, hashlib.new(algorithm))
+
+    def reset(self):
+        # For a download that starts over from the first byte
+        self._hashes = {name: hashlib.new(name) for name in self._hashes}
+        self.bytes = 0
+
+    def update(self, data):
+        for h in self._hashes.values():
+            h.update(data)
+        self.bytes += len(data)
+
+    def hexdigest(self, algorithm="sha256"):
+        return self._hashes[algorithm].hexdigest()
+
+    def hexdigests(self):
+        return {name: h.hexdigest() for name, h in self._hashes.items()}
+
+
+class ChunkSizer:
+    """Read sizes that track throughput: about CHUNK_TARGET_SECONDS of data, within bounds."""
+
+    def __init__(self, initial=64 * 1024):
+        self.size = initial
+        self._started = None
+
+    def start(self):
+        self._started = time.monotonic()
+        return self.size
+
+    def done(self, n):
+        elapsed = time.monotonic() - self._started
+        if n < self.size or elapsed <= 0:
+            return  # Short read: end of body or a slow patch, not a rate sample
+        wanted = n * CHUNK_TARGET_SECONDS / elapsed
+        if wanted > self.size * 1.5:
+            self.size = min(CHUNK_MAX, self.size * 2)
+        elif wanted < self.size / 2:
+            self.size = max(CHUNK_MIN, self.size // 2)
+
+
+class PrefixHasher:
+    """Hashes the leading bytes of a file once every range before them is written."""
+
+    def __init__(self, fd, digests, chunk_size=CHUNK_MAX):
+        self.fd = fd
+        self.digests = digests
+        self.hashed = 0
+        self._buf = bytearray(chunk_size)
+        self._lock = threading.Lock()
+
+    def advance(self, end, wait=False):
+        # Called from download threads; whoever holds the lock does the catching up
+        if not self._lock.acquire(blocking=wait):
+            return
+        try:
+            view = memoryview(self._buf)
+            while self.hashed < end:
+                n = os.preadv(self.fd, [view[:min(len(view), end - self.hashed)]], self.hashed)
+                if n <= 0:
+                    raise OSError(f"short read while hashing at offset {self.hashed}")
+                self.digests.update(view[:n])
+                self.hashed += n
+        finally:
+            self._lock.release()
+
+
+def parse_checksum(text, name=None):
+    """Return ``(algorithm, hex)`` from a checksum string or checksum-file contents.
+
+    Accepts ``sha256:<hex>`` / ``sha256=<hex>``, a bare hex digest, ``sha256sum``
+    output (``<hex>  file``) and BSD style (``SHA256 (file) = <hex>``). For
+    files listing several names, the line for ``name`` wins.
+    """
+    candidates = []
+    for line in text.strip().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        m = re.fullmatch(r"(\w+)\s*\((.+)\)\s*=\s*([0-9a-fA-F]+)", line)
+        if m:
+            candidates.append((m.group(1).lower(), m.group(3).lower(), m.group(2)))
+            continue
+        m = re.fullmatch(r"(?:(\w+)[:=])?([0-9a-fA-F]+)(?:\s+\*?(.+))?", line)
+        if m:
+            digest = m.group(2).lower()
+            algorithm = (m.group(1) or HEX_LENGTHS.get(len(digest), "")).lower()
+            candidates.append((algorithm, digest, m.group(3)))
+    for algorithm, digest, filename in candidates:
+        if name is None or filename is None or os.path.basename(filename.strip()) == name or len(candidates) == 1:
+            try:
+                size = hashlib.new(algorithm).digest_size
+            except ValueError:
+                raise ValueError(f"unknown checksum algorithm {algorithm!r} for {digest}")
+            if len(digest) != size * 2:
+                raise ValueError(f"{digest} is not a {algorithm} digest")
+            return algorithm, digest
+    return None
+
+
+def split_url(url):
+    """Split ``url#sha256=<hex>`` into the URL and its expected checksum, if any."""
+    base, fragment = urldefrag(url)
+    if fragment and re.fullmatch(r"\w+=[0-9a-fA-F]+", fragment):
+        return base, parse_checksum(fragment)
+    return url, None
+
+
+def fetch_sidecar(url, name):
+    """Expected checksum from ``<url>.sha256``, or None when there is no usable sidecar."""
+    if urlsplit(url).query:
+        return None  # dl.php?id=42.sha256 is not a sidecar
+    try:
+        with open_url(url + SIDECAR_SUFFIX) as response:
+            data = response.read(SIDECAR_MAX + 1)
+    except (urllib.error.URLError, OSError):
+        return None
+    if len(data) > SIDECAR_MAX:
+        return None
+    try:
+        return parse_checksum(data.decode("utf-8", errors="replace"), name)
+    except ValueError:
+        return None
+
+
+def verify(digests, expected):
+    algorithm, digest = expected
+    actual = digests.hexdigest(algorithm)
+    if actual != digest:
+        raise ChecksumMismatch(f"{algorithm} mismatch: expected {digest}, got {actual}")
@@ -0,0 +1,347 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Library of the apps installed in TuxPort's Wine prefixes.
+
+Three sources are indexed per prefix:
+- the Start Menu ``.lnk`` shortcuts installers leave behind;
+- the ``.desktop`` entries Wine generates from them under
+  ``~/.local/share/applications/wine``;
+- the programs in ``Program Files``, a few levels deep, for apps that made no
+  shortcut.
+
+Like tuxport.indexer, the library is crawled incrementally by
+tuxport.dirindex. A directory whose mtime has not changed is not listed
+again, and a shortcut is only parsed again when its size or mtime changed. Opening the
+library therefore reads the database, and a refresh costs one ``stat``
+per directory.
+"""
+
+import collections
+import os
+import re
+import shlex
+import sqlite3
+import struct
+import threading
+
+from tuxport.cache import CACHE_DIR
+from tuxport.dirindex import DirIndex
+
+LIBRARY_PATH = os.path.join(CACHE_DIR, "library.db")
+DESKTOP_DIR = os.path.join(os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share"), "applications", "wine")
+START_MENUS = (
+    ("AppData", "Roaming", "Microsoft", "Windows", "Start Menu", "Programs"),  # Per user, Wine 5 and later
+    ("Start Menu", "Programs"),  # Per user, older Wine
+)
+COMMON_START_MENU = ("ProgramData", "Microsoft", "Windows", "Start Menu", "Programs")
+PROGRAM_DIRS = ("Program Files", "Program Files (x86)")
+PROGRAM_DEPTH = 3  # Program Files/Vendor/App/bin/app.exe
+# Folders Wine itself puts in Program Files
+WINE_FOLDERS = {"common files", "internet explorer", "windows media player", "windows nt", "windowspowershell"}
+# Programs that are not the app: uninstallers, installers, updaters and crash reporters
+NOT_APPS = re.compile(r"unins|setup|install|updat|crash|report|helper|redist|vcredist|dxsetup|dotnet|elevate", re.I)
+
+SHORTCUT, DESKTOP, PROGRAM = "shortcut", "desktop", "program"
+SOURCE_ORDER = {SHORTCUT: 0, DESKTOP: 1, PROGRAM: 2}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY, dir TEXT, source TEXT, size INTEGER, mtime REAL,
+    prefix TEXT, name TEXT, exe TEXT, args TEXT, workdir TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_dir ON entries(dir);
+CREATE TABLE IF NOT EXISTS prefixes (path TEXT PRIMARY KEY);
+"""
+
+InstalledApp = collections.namedtuple("InstalledApp", "name exe prefix args workdir source path")
+
+LNK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+
+
+def read_lnk(data):
+    """``(target, strings)`` from a .lnk file (MS-SHLLINK).
+
+    ``target`` is the Windows path from the LinkInfo block, or None;
+    ``strings`` holds whichever of name, relative, workdir, args and icon
+    the shortcut has.
+    """
+    if len(data) < 0x4C or data[:4] != b"L\0\0\0" or data[4:20] != LNK_CLSID:
+        raise ValueError("not a shell link")
+    flags = struct.unpack_from("<I", data, 0x14)[0]
+    pos = 0x4C
+    if flags & 0x1:  # HasLinkTargetIDList: shell item ids, skipped
+        pos += 2 + struct.unpack_from("<H", data, pos)[0]
+    target = None
+    if flags & 0x2:  # HasLinkInfo
+        size, header, info_flags, _, base, _, suffix = struct.unpack_from("<7I", data, pos)
+        if info_flags & 0x1:  # VolumeIDAndLocalBasePath
+            if header >= 0x24:
+                base_w, suffix_w = struct.unpack_from("<2I", data, pos + 28)
+                target = _utf16z(data, pos + base_w) + _utf16z(data, pos + suffix_w)
+            else:
+                target = _cstr(data, pos + base) + _cstr(data, pos + suffix)
+        pos += size
+    strings = {}
+    unicode = flags & 0x80
+    for flag, key in ((0x4, "name"), (0x8, "relative"), (0x10, "workdir"), (0x20, "args"), (0x40, "icon")):
+        if flags & flag:
+            count = struct.unpack_from("<H", data, pos)[0]
+            n = count * 2 if unicode else count
+            strings[key] = data[pos + 2:pos + 2 + n].decode("utf-16-le" if unicode else "cp1252", errors="replace")
+            pos += 2 + n
+    return target or None, strings
+
+
+def _cstr(data, pos):
+    return data[pos:data.index(b"\0", pos)].decode("cp1252", errors="replace")
+
+
+def _utf16z(data, pos):
+    end = pos
+    while data[end:end + 2] not in (b"\0\0", b""):
+        end += 2
+    return data[pos:end].decode("utf-16-le", errors="replace")
+
+
+def unix_path(prefix, win_path):
+    """Where ``C:\\Program Files\\App\\app.exe`` lives in ``prefix``, matched case-insensitively like Wine; or None."""
+    m = re.match(r"([A-Za-z]):(.*)", win_path or "")
+    if not m:
+        return None
+    drive = m.group(1).lower()
+    path = os.path.join(prefix, "drive_c") if drive == "c" else os.path.join(prefix, "dosdevices", drive + ":")
+    for part in re.split(r"[\\/]+", m.group(2)):
+        if not part:
+            continue
+        candidate = os.path.join(path, part)
+        if not os.path.lexists(candidate):
+            try:
+                match = next((n for n in os.listdir(path) if n.lower() == part.lower()), None)
+            except OSError:
+                return None
+            if match is None:
+                return None
+            candidate = os.path.join(path, match)
+        path = candidate
+    return path
+
+
+def split_args(text):
+    # Windows command lines: whitespace separates, double quotes group, backslashes are literal
+    return [quoted if quoted or not bare else bare for quoted, bare in re.findall(r'"([^"]*)"|(\S+)', text or "")]
+
+
+def _is_app(exe):
+    return exe is not None and exe.lower().endswith(".exe") and not NOT_APPS.search(os.path.basename(exe))
+
+
+def _shortcut(prefix, path):
+    with open(path, 'rb') as f:
+        target, strings = read_lnk(f.read())
+    exe = unix_path(prefix, target) if target else None
+    if exe is None and strings.get("relative"):
+        exe = os.path.normpath(os.path.join(os.path.dirname(path), strings["relative"].replace("\\", "/")))
+    if not _is_app(exe) or not os.path.isfile(exe):
+        return None  # Shortcuts to uninstallers, manuals, web pages, or a removed program
+    workdir = unix_path(prefix, strings.get("workdir"))
+    return os.path.splitext(os.path.basename(path))[0], exe, strings.get("args", ""), workdir
+
+
+def _desktop(path):
+    # Wine writes: Exec=env WINEPREFIX="/p" wine C:\\\\windows\\\\command\\\\start.exe /Unix /p/dosdevices/c:/.../App.lnk
+    fields, section = {}, None
+    with open(path, 'r', encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("["):
+                section = line
+            elif section == "[Desktop Entry]" and "=" in line:
+                key, _, value = line.partition("=")
+                fields.setdefault(key.strip(), value.strip())
+    # Desktop entry values are unescaped first (\\ and \s), then Exec is split like a shell would
+    exec_line = re.sub(r"\\(.)", lambda m: {"s": " ", "t": "\t", "n": "\n", "r": "\r"}.get(m.group(1), m.group(1)),
+                       fields.get("Exec", ""))
+    try:
+        argv = shlex.split(exec_line)
+    except ValueError:
+        return None
+    prefix = next((a.split("=", 1)[1] for a in argv if a.startswith("WINEPREFIX=")), None)
+    prefix = os.path.realpath(prefix or os.path.expanduser("~/.wine"))
+    found = None
+    if "/Unix" in argv and argv.index("/Unix") + 1 < len(argv):
+        lnk = argv[argv.index("/Unix") + 1]
+        try:
+            found = _shortcut(prefix, lnk) if lnk.lower().endswith(".lnk") else None
+        except (OSError, ValueError, struct.error):
+            found = None
+    else:
+        exe = next((unix_path(prefix, a) for a in argv if re.match(r"[A-Za-z]:.*\.exe$", a, re.I)), None)
+        if _is_app(exe):
+            found = (None, exe, "", None)
+    if found is None or fields.get("NoDisplay", "").lower() == "true":
+        return None
+    name, exe, args, workdir = found
+    return prefix, fields.get("Name") or name, exe, args, fields.get("Path") or workdir
+
+
+def _program_folder(exe):
+    # "…/drive_c/Program Files/Vendor/…" -> "…/drive_c/Program Files/Vendor": one app per vendor folder
+    parts = exe.split(os.sep)
+    for i, part in enumerate(parts[:-2]):
+        if part in PROGRAM_DIRS and parts[i - 1:i] == ["drive_c"]:
+            return os.sep.join(parts[:i + 2])
+    return None
+
+
+class Library(DirIndex):
+    SCHEMA = SCHEMA
+    ENTRIES = "entries"
+
+    def __init__(self, path=LIBRARY_PATH, desktop_dir=DESKTOP_DIR):
+        super().__init__(path)
+        self.desktop_dir = desktop_dir
+        self._thread = None
+        self._waiters = []
+        self._lock = threading.Lock()
+        self._read_db = None
+
+    def roots(self, prefix):
+        """``(directory, source, depth)`` to crawl for one prefix."""
+        drive_c = os.path.join(prefix, "drive_c")
+        menus = [os.path.join(drive_c, *COMMON_START_MENU)]
+        try:
+            with os.scandir(os.path.join(drive_c, "users")) as it:
+                users = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            users = []
+        menus += [os.path.join(user, *menu) for user in sorted(users) for menu in START_MENUS]
+        return ([(m, SHORTCUT, None) for m in menus if os.path.isdir(m)]
+                + [(os.path.join(drive_c, d), PROGRAM, PROGRAM_DEPTH) for d in PROGRAM_DIRS])
+
+    # --- crawling ---
+    def update(self, prefixes, cancel=None):
+        """Bring the library up to date for ``prefixes``; returns crawl stats."""
+        stats = {"dirs": 0, "rescanned": 0, "entries": 0}
+        prefixes = sorted({os.path.realpath(p) for p in prefixes})
+        db = self.connect()
+        try:
+            for (old,) in db.execute("SELECT path FROM prefixes").fetchall():
+                if old not in prefixes:
+                    self.forget(db, old)
+                    db.execute("DELETE FROM entries WHERE prefix = ?", (old,))
+                    db.execute("DELETE FROM prefixes WHERE path = ?", (old,))
+            for prefix in prefixes:
+                db.execute("INSERT OR IGNORE INTO prefixes VALUES (?)", (prefix,))
+                for root, source, depth in self.roots(prefix):
+                    self.crawl(db, [root], stats, cancel, depth, source=source, prefix=prefix)
+            self.crawl(db, [self.desktop_dir], stats, cancel, source=DESKTOP, prefix=None)
+            db.commit()
+        finally:
+            db.close()
+        return stats
+
+    def _list(self, db, d, stats, source, prefix):
+        suffix = {SHORTCUT: ".lnk", DESKTOP: ".desktop", PROGRAM: ".exe"}[source]
+        subdirs, files = [], {}
+        with os.scandir(d) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.lower() not in WINE_FOLDERS:
+                            subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(suffix) and entry.is_file():
+                        st = entry.stat()
+                        files[entry.path] = (st.st_size, st.st_mtime)
+                except OSError:
+                    continue
+        known = {p: (size, mt) for p, size, mt in db.execute("SELECT path, size, mtime FROM entries WHERE dir = ?", (d,))}
+        for path in known.keys() - files.keys():
+            db.execute("DELETE FROM entries WHERE path = ?", (path,))
+        for path, (size, mt) in files.items():
+            if known.get(path) == (size, mt):
+                continue
+            found = self._read(source, prefix, path)
+            # Rows are kept even for non-apps (found is None), so they are not parsed again
+            entry_prefix, name, exe, args, workdir = found or (prefix, None, None, None, None)
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                       (path, d, source, size, mt, entry_prefix, name, exe, args, workdir))
+            stats["entries"] += 1
+        return subdirs
+
+    def _read(self, source, prefix, path):
+        try:
+            if source == SHORTCUT:
+                found = _shortcut(prefix, path)
+                return found and (prefix,) + found
+            if source == DESKTOP:
+                return _desktop(path)
+        except (OSError, ValueError, struct.error):
+            return None
+        return (prefix, os.path.splitext(os.path.basename(path))[0], path, "", None) if _is_app(path) else None
+
+    def start_background(self, prefixes, on_done=None):
+        """Run ``update`` on a daemon thread unless one is already running.
+
+        ``on_done(stats)`` is called on that thread when it finishes, also
+        when it joins an update that was already under way.
+        """
+        with self._lock:
+            if on_done is not None:
+                self._waiters.append(on_done)
+            if self._thread is not None:
+                return self._thread
+
+            def run():
+                stats = None
+                try:
+                    stats = self.update(prefixes)
+                except (OSError, sqlite3.Error):
+                    pass  # The last good library stays; the next refresh tries again
+                with self._lock:
+                    waiters, self._waiters, self._thread = self._waiters, [], None
+                for waiter in waiters:
+                    waiter(stats)
+            self._thread = threading.Thread(target=run, name="tuxport-library", daemon=True)
+            self._thread.start()
+            return self._thread
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    # --- queries ---
+    def apps(self):
+        """Installed apps from the last update, one per program and prefix, by name.
+
+        A shortcut beats a desktop entry for the same program, and a program
+        only found in Program Files is left out when a shortcut already leads
+        into its folder.
+        """
+        if self._read_db is None:
+            self._read_db = self.connect()
+        rows = self._read_db.execute(
+            "SELECT e.name, e.exe, e.prefix, e.args, e.workdir, e.source, e.path FROM entries e "
+            "JOIN prefixes p ON p.path = e.prefix WHERE e.exe IS NOT NULL").fetchall()
+        best = {}
+        for row in sorted(rows, key=lambda r: SOURCE_ORDER[r[5]]):
+            app = InstalledApp(*row)
+            key = (app.prefix, app.exe.lower())
+            if key in best:
+                continue
+            if app.source == PROGRAM and (app.prefix, _program_folder(app.exe)) in best:
+                continue
+            best[key] = app
+            if app.source != PROGRAM:
+                best.setdefault((app.prefix, _program_folder(app.exe)), app)
+        unique = {id(a): a for a in best.values()}
+        return sorted(unique.values(), key=lambda a: (a.name.lower(), a.prefix))
+
+
+def known_prefixes(runtime, pool=None):
+    """The prefixes to show: the default one and every per-app prefix in ``pool``."""
+    prefixes = [runtime.prefix]
+    if pool is not None:
+        prefixes += [pool.path_for(name) for name in pool.names()]
+    return [p for p in prefixes if os.path.isdir(os.path.join(p, "drive_c"))]
@@ -0,0 +1,167 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Streaming discovery of installer links on download pages.
+
+The page is fed to an ``HTMLParser`` as it arrives and reading stops as soon
+as enough candidates have been seen, so a huge vendor page costs a few
+chunks instead of a full read. Candidates are then ranked so the most
+likely installer for this machine comes first.
+"""
+
+import codecs
+import platform
+import posixpath
+from html.parser import HTMLParser
+from urllib.parse import parse_qsl, urljoin, urlparse
+
+from tuxport.archives import is_archive_name
+from tuxport.net import open_url
+
+LINK_ATTRS = ("href", "src")
+DATA_LINK_SUFFIXES = ("-url", "-href")  # data-url, data-download-url, data-mirror-href, ...
+CHUNK_SIZE = 16 * 1024
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+CANDIDATE_LIMIT = 8
+
+ARCH_64 = ("x64", "x86_64", "amd64", "win64", "64bit", "64-bit")
+ARCH_32 = ("x86", "win32", "32bit", "32-bit", "i386", "i686")
+ARCH_ARM = ("arm64", "aarch64", "arm")
+INSTALLER_WORDS = ("setup", "install", "installer")
+UNWANTED_WORDS = ("uninstall", "debug", "symbols", "source", "src")
+
+
+def _installer_file(name):
+    # A bare program, or a bundle that tuxport.archives can unpack one from
+    return name.lower().endswith(".exe") or is_archive_name(name)
+
+
+def looks_like_installer(url):
+    parsed = urlparse(url)
+    if _installer_file(parsed.path):
+        return True
+    # download.php?file=setup.exe style links
+    return any(_installer_file(v) for _, v in parse_qsl(parsed.query))
+
+
+def installer_name(url):
+    parsed = urlparse(url)
+    name = posixpath.basename(parsed.path)
+    if not _installer_file(name):
+        for _, value in parse_qsl(parsed.query):
+            if _installer_file(value):
+                return posixpath.basename(value)
+    return name or "installer.exe"
+
+
+def _refresh_target(content):
+    # <meta http-equiv="refresh" content="5; url=https://...">
+    for part in content.split(";")[1:]:
+        key, _, value = part.strip().partition("=")
+        if key.strip().lower() == "url":
+            return value.strip().strip("'\"")
+    return None
+
+
+class LinkExtractor(HTMLParser):
+    def __init__(self, base_url, limit=CANDIDATE_LIMIT):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.limit = limit
+        self.candidates = []
+        self.refresh = None
+        self._seen = set()
+
+    @property
+    def done(self):
+        return len(self.candidates) >= self.limit
+
+    def _add(self, link):
+        link = urljoin(self.base_url, link.strip())
+        if link not in self._seen and looks_like_installer(link):
+            self._seen.add(link)
+            self.candidates.append(link)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "base" and attrs.get("href"):
+            self.base_url = urljoin(self.base_url, attrs["href"])
+            return
+        if tag == "meta" and (attrs.get("http-equiv") or "").lower() == "refresh":
+            target = _refresh_target(attrs.get("content") or "")
+            if target:
+                if looks_like_installer(urljoin(self.base_url, target)):
+                    self._add(target)
+                elif self.refresh is None:
+                    self.refresh = urljoin(self.base_url, target)
+            return
+        for key, value in attrs.items():
+            if value and (key in LINK_ATTRS or key.startswith("data-") and key.endswith(DATA_LINK_SUFFIXES)):
+                self._add(value)
+
+    handle_startendtag = handle_starttag
+
+
+def _tokens(url):
+    name = posixpath.basename(urlparse(url).path).lower()
+    for sep in "-_. ()[]":
+        name = name.replace(sep, " ")
+    return set(name.split())
+
+
+def score(url, page_url, machine=None):
+    machine = (machine or platform.machine()).lower()
+    tokens = _tokens(url)
+    name = posixpath.basename(urlparse(url).path).lower()
+    s = 0.0
+    if tokens & set(ARCH_ARM) and not machine.startswith(("arm", "aarch")):
+        s -= 4
+    wants_64 = machine in ("x86_64", "amd64", "aarch64", "arm64")
+    if tokens & set(ARCH_64) or "64" in tokens:
+        s += 3 if wants_64 else -3
+    elif tokens & set(ARCH_32):
+        s += -1 if wants_64 else 3
+    if any(w in name for w in INSTALLER_WORDS) and "uninstall" not in name:
+        s += 2
+    if tokens & set(UNWANTED_WORDS):
+        s -= 3
+    if is_archive_name(name):
+        s -= 0.5  # Same download as a bare .exe, but it has to be unpacked first
+    page, link = urlparse(page_url), urlparse(url)
+    if link.netloc == page.netloc:
+        s += 1
+        # Links that live next to the page beat links elsewhere on the site
+        shared = posixpath.commonpath([posixpath.dirname(page.path) or "/", posixpath.dirname(link.path) or "/"])
+        s += min(shared.count("/"), 4) * 0.25 if shared != "/" else 0
+    return s
+
+
+def rank(candidates, page_url, machine=None):
+    order = {c: i for i, c in enumerate(candidates)}
+    return sorted(candidates, key=lambda c: (-score(c, page_url, machine), order[c]))
+
+
+def discover(url, limit=CANDIDATE_LIMIT, max_bytes=MAX_PAGE_BYTES, follow_refresh=1):
+    """Return installer links found on the page at ``url``, best first."""
+    with open_url(url) as response:
+        page_url = response.geturl()
+        charset = response.headers.get_content_charset() or "utf-8"
+        try:
+            decoder = codecs.getincrementaldecoder(charset)(errors="ignore")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        parser = LinkExtractor(page_url, limit)
+        read = 0
+        while not parser.done and read < max_bytes:
+            chunk = response.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            read += len(chunk)
+            parser.feed(decoder.decode(chunk))
+        # After the last chunk read: flush the decoder, and whatever the parser still buffers
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+    if not parser.candidates and parser.refresh and follow_refresh > 0:
+        return discover(parser.refresh, limit, max_bytes, follow_refresh - 1)
+    return rank(parser.candidates, page_url)
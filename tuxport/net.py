@@ -0,0 +1,199 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""HTTP client with per-host keep-alive connection pooling.
+
+Page fetches, candidate probes and (ranged) downloads all go through
+``open_url`` so consecutive requests to the same host reuse one HTTP/1.1
+connection instead of paying a new TCP/TLS handshake each time. Responses
+behave like ``urllib`` responses and errors are raised as
+``urllib.error.HTTPError`` so callers handle both the same way.
+"""
+
+import http.client
+import ssl
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
+
+REDIRECTS = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+PROBE_WORKERS = 8
+HTML_TYPES = ("text/html", "application/xhtml+xml")
+
+
+class PooledResponse:
+    def __init__(self, pool, key, conn, response, url):
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._response = response
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.msg
+
+    def geturl(self):
+        return self.url
+
+    def getheader(self, name, default=None):
+        return self._response.getheader(name, default)
+
+    def read(self, amt=None):
+        return self._response.read(amt)
+
+    def readinto(self, buffer):
+        return self._response.readinto(buffer)
+
+    def close(self):
+        if self._conn is None:
+            return
+        if self._response.length == 0 and not self._response.isclosed():
+            self._response.read()  # HEAD/304: nothing to drain, just mark it done
+        # Only a fully consumed response leaves the connection reusable
+        reusable = self._response.isclosed() and not self._response.will_close
+        if not reusable:
+            self._response.close()
+        self._pool._release(self._key, self._conn, reusable)
+        self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConnectionPool:
+    def __init__(self, max_idle_per_host=6, timeout=30):
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._ssl_context = None
+
+    def _connect(self, key):
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _acquire(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(key), False
+
+    def _release(self, key, conn, reusable):
+        if reusable:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle_per_host:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+    def _send(self, method, url, headers, timeout):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise urllib.error.URLError(f"unsupported URL scheme: {parts.scheme}")
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        host = parts.netloc.rsplit("@", 1)[-1]
+        while True:
+            conn, reused = self._acquire(key)
+            # Per request: an idle connection keeps whatever timeout its last user set
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, target, headers=dict(headers, Host=host))
+                return key, conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry on a fresh one
+            except Exception:
+                conn.close()
+                raise
+
+    def request(self, method, url, headers=None, max_redirects=MAX_REDIRECTS, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        h = {'User-Agent': USER_AGENT}
+        h.update(headers or {})
+        for _ in range(max_redirects + 1):
+            try:
+                key, conn, response = self._send(method, url, h, timeout)
+            except OSError as e:
+                if isinstance(e, urllib.error.URLError):
+                    raise
+                raise urllib.error.URLError(e)
+            pooled = PooledResponse(self, key, conn, response, url)
+            location = response.getheader("Location")
+            if response.status in REDIRECTS and location:
+                pooled.read()
+                pooled.close()
+                url = urljoin(url, location)
+                if response.status == 303 and method != "HEAD":
+                    method = "GET"
+                continue
+            if response.status >= 300:
+                # Drain small error bodies so the connection can be reused
+                if (response.length or 0) <= 64 * 1024:
+                    pooled.read()
+                pooled.close()
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.msg, None)
+            return pooled
+        raise urllib.error.HTTPError(url, 310, "Too many redirects", None, None)
+
+
+default_pool = ConnectionPool()
+
+
+def open_url(url, headers=None, method=None, timeout=30):
+    """Open ``url`` through the shared pool (or urllib when a proxy is set); ``timeout`` applies to both."""
+    scheme = urlsplit(url).scheme
+    if scheme in urllib.request.getproxies():
+        h = {'User-Agent': USER_AGENT}
+        h.update(headers or {})
+        return urllib.request.urlopen(urllib.request.Request(url, headers=h, method=method), timeout=timeout)
+    return default_pool.request(method or "GET", url, headers, timeout=timeout)
+
+
+def is_installer_response(info):
+    # Dead links were already filtered by the exception; this catches
+    # "download" links that actually serve an HTML page.
+    content_type = (info.content_type or "").split(";")[0].strip().lower()
+    return content_type not in HTML_TYPES
+
+
+def probe_all(urls, probe, headers_for=None, workers=PROBE_WORKERS):
+    """Probe ``urls`` concurrently; returns results (or exceptions) in order."""
+    def one(url):
+        try:
+            return probe(url, headers_for(url) if headers_for else None)
+        except Exception as e:
+            return e
+
+    if len(urls) <= 1:
+        return [one(u) for u in urls]
+    with ThreadPoolExecutor(max_workers=min(workers, len(urls)), thread_name_prefix="tuxport-probe") as ex:
+        return list(ex.map(one, urls))
@@ -0,0 +1,362 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""PE header inspection, so broken or non-Windows files never reach Wine.
+
+``inspect()`` maps the file with ``mmap`` and reads only the DOS, COFF and
+optional headers and the section table. The installer family is found by
+bounded ``mmap.find`` scans of the overlay head and the resource section.
+Only the pages actually touched are read, so a multi-GB installer costs
+about as much as a small one.
+
+``PECache`` keeps results per (path, size, mtime), in memory and in
+SQLite, and inspects files on a background thread for the explorer.
+``resources()`` walks the resource directory for tuxport.icons.
+"""
+
+import collections
+import json
+import mmap
+import os
+import queue
+import sqlite3
+import struct
+import threading
+
+from tuxport.cache import CACHE_DIR
+
+PE_CACHE_PATH = os.path.join(CACHE_DIR, "pe.db")
+MEMORY_ENTRIES = 4096
+OVERLAY_SCAN = 1024 * 1024
+RESOURCE_SCAN = 8 * 1024 * 1024
+RESOURCE_ENTRIES = 4096  # Per directory; real files have a handful, broken ones billions
+
+MACHINES = {0x14c: "x86", 0x8664: "x64", 0xaa64: "arm64", 0x1c4: "arm"}
+X86_MACHINES = ("x86", "x64")
+X86_HOSTS = ("x86_64", "i386", "i686")
+SUBSYSTEMS = {1: "native", 2: "GUI", 3: "console", 9: "CE", 10: "EFI", 11: "EFI", 12: "EFI", 13: "EFI"}
+
+NSIS = "NSIS"
+INNO = "Inno Setup"
+INSTALLSHIELD = "InstallShield"
+MSI = "MSI wrapper"
+WIX_BURN = "WiX Burn"
+SEVENZIP_SFX = "7-Zip SFX"
+ZIP_SFX = "ZIP SFX"
+
+# Sections only one installer toolkit emits
+SECTION_MARKERS = {b".ndata": NSIS, b".wixburn": WIX_BURN}
+# Signatures at or near the start of the data appended after the image
+OVERLAY_MARKERS = (
+    (b"NullsoftInst", NSIS),
+    (b"Inno Setup Setup Data", INNO),
+    (b"rDlPtS", INNO),
+    (b"InstallShield", INSTALLSHIELD),
+    (b"ISSetupStream", INSTALLSHIELD),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", MSI),  # OLE compound file, i.e. an embedded .msi
+    (b"7z\xbc\xaf\x27\x1c", SEVENZIP_SFX),
+    (b"PK\x03\x04", ZIP_SFX),
+)
+# Version-info strings (UTF-16) in .rsrc, for installers that keep data elsewhere
+RESOURCE_MARKERS = (
+    ("Nullsoft", NSIS),
+    ("Inno Setup", INNO),
+    ("InstallShield", INSTALLSHIELD),
+    ("MsiWrapper", MSI),
+    ("exemsi", MSI),
+)
+
+PEInfo = collections.namedtuple("PEInfo", "valid machine bits subsystem dll dotnet signed installer error")
+
+
+class NotPE(Exception):
+    pass
+
+
+def _invalid(error):
+    return PEInfo(False, None, None, None, False, False, False, None, error)
+
+
+def inspect(path, scan=True):
+    """Return PEInfo for ``path``; ``scan=False`` skips installer detection (headers only)."""
+    try:
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < 64:
+                return _invalid("file is too small to be a Windows program")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return _parse(m, size, scan)
+    except NotPE as e:
+        return _invalid(str(e))
+    except (OSError, ValueError) as e:
+        return _invalid(f"cannot read file: {e}")
+
+
+def _u16(m, off):
+    return struct.unpack_from("<H", m, off)[0]
+
+
+def _u32(m, off):
+    return struct.unpack_from("<I", m, off)[0]
+
+
+def _parse(m, size, scan):
+    if m[:2] != b"MZ":
+        if m[:8] == b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1":
+            raise NotPE("Windows Installer package (.msi), not a program")
+        raise NotPE("not a Windows program (no MZ header)")
+    pe = _u32(m, 0x3c)
+    if pe + 24 > size or m[pe:pe + 4] != b"PE\0\0":
+        raise NotPE("DOS program or damaged file (no PE header)")
+    coff = pe + 4
+    machine = _u16(m, coff)
+    sections = _u16(m, coff + 2)
+    opt_size = _u16(m, coff + 16)
+    characteristics = _u16(m, coff + 18)
+    opt = coff + 20
+    if opt + opt_size > size or opt_size < 72:
+        raise NotPE("damaged file (truncated optional header)")
+    magic = _u16(m, opt)
+    if magic == 0x10b:
+        bits, dirs_count_off, dirs_off = 32, opt + 92, opt + 96
+    elif magic == 0x20b:
+        bits, dirs_count_off, dirs_off = 64, opt + 108, opt + 112
+    else:
+        raise NotPE(f"damaged file (unknown optional header magic {magic:#x})")
+    subsystem = _u16(m, opt + 68)
+    dirs = min(_u32(m, dirs_count_off), (opt + opt_size - dirs_off) // 8) if dirs_off < opt + opt_size else 0
+
+    def directory(index):
+        if index >= dirs:
+            return 0, 0
+        return _u32(m, dirs_off + index * 8), _u32(m, dirs_off + index * 8 + 4)
+
+    sec_off, sec_size = directory(4)  # Security: a file offset, not an RVA
+    clr_rva, _ = directory(14)
+    signed = sec_size > 0 and 0 < sec_off and sec_off + sec_size <= size
+
+    table = opt + opt_size
+    if table + sections * 40 > size:
+        raise NotPE("damaged file (truncated section table)")
+    image_end = 0
+    names = {}
+    for i in range(sections):
+        s = table + i * 40
+        name = bytes(m[s:s + 8]).rstrip(b"\0")
+        raw_size, raw_ptr = _u32(m, s + 16), _u32(m, s + 20)
+        if raw_size:
+            image_end = max(image_end, raw_ptr + raw_size)
+            names[name] = (raw_ptr, raw_size)
+    if image_end > size:
+        raise NotPE("damaged or incomplete file (sections extend past the end)")
+
+    installer = None
+    if scan:
+        overlay_end = sec_off if signed and sec_off >= image_end else size
+        installer = _installer_family(m, names, image_end, overlay_end)
+    return PEInfo(True, MACHINES.get(machine, f"{machine:#x}"), bits, SUBSYSTEMS.get(subsystem, str(subsystem)),
+                  bool(characteristics & 0x2000), clr_rva != 0, signed, installer, None)
+
+
+def _installer_family(m, sections, overlay_start, overlay_end):
+    for name, family in SECTION_MARKERS.items():
+        if name in sections:
+            return family
+    if overlay_end > overlay_start:
+        end = min(overlay_end, overlay_start + OVERLAY_SCAN)
+        hits = [(pos, family) for marker, family in OVERLAY_MARKERS
+                for pos in (m.find(marker, overlay_start, end),) if pos >= 0]
+        if hits:
+            return min(hits)[1]  # The first signature in the overlay names the outer format
+    rsrc = sections.get(b".rsrc")
+    if rsrc:
+        start = rsrc[0]
+        end = min(start + rsrc[1], start + RESOURCE_SCAN)
+        for text, family in RESOURCE_MARKERS:
+            if m.find(text.encode("utf-16-le"), start, end) >= 0:
+                return family
+    return None
+
+
+def _rva_to_offset(sections, rva):
+    for va, vsize, raw_ptr, raw_size in sections:
+        if va <= rva < va + max(vsize, raw_size):
+            return raw_ptr + rva - va
+    return None
+
+
+def resources(m, size):
+    """Yield ``(type, name, offset, length)`` for each resource in the mapped file ``m``.
+
+    Types and names are ints, or strings for named entries; ``offset`` is a
+    file offset. Every language of a resource is yielded. Damaged tables end
+    the walk early rather than raising.
+    """
+    try:
+        pe = _u32(m, 0x3c)
+        if m[:2] != b"MZ" or pe + 24 > size or m[pe:pe + 4] != b"PE\0\0":
+            return
+        sections_count = _u16(m, pe + 6)
+        opt_size = _u16(m, pe + 20)
+        opt = pe + 24
+        magic = _u16(m, opt)
+        dirs_count_off, dirs_off = (opt + 92, opt + 96) if magic == 0x10b else (opt + 108, opt + 112)
+        if _u32(m, dirs_count_off) <= 2 or dirs_off + 24 > opt + opt_size:
+            return
+        rsrc_rva = _u32(m, dirs_off + 16)
+        table = opt + opt_size
+        sections = [(_u32(m, s + 12), _u32(m, s + 8), _u32(m, s + 20), _u32(m, s + 16))
+                    for s in range(table, table + sections_count * 40, 40)]
+        base = _rva_to_offset(sections, rsrc_rva) if rsrc_rva else None
+        if base is None:
+            return
+
+        def entries(offset):
+            named, ids = _u16(m, base + offset + 12), _u16(m, base + offset + 14)
+            for i in range(min(named + ids, RESOURCE_ENTRIES)):
+                e = base + offset + 16 + i * 8
+                name, target = _u32(m, e), _u32(m, e + 4)
+                if name & 0x80000000:
+                    n = base + (name & 0x7fffffff)
+                    name = bytes(m[n + 2:n + 2 + _u16(m, n) * 2]).decode("utf-16-le", errors="replace")
+                yield name, target
+
+        for rtype, types in entries(0):
+            if not types & 0x80000000:
+                continue
+            for name, names in entries(types & 0x7fffffff):
+                if not names & 0x80000000:
+                    continue
+                for _, leaf in entries(names & 0x7fffffff):
+                    if leaf & 0x80000000:
+                        continue
+                    offset = _rva_to_offset(sections, _u32(m, base + leaf))
+                    length = _u32(m, base + leaf + 4)
+                    if offset is not None and offset + length <= size:
+                        yield rtype, name, offset, length
+    except (struct.error, IndexError, ValueError):
+        return
+
+
+def problem(info):
+    """Why ``info`` cannot be launched, or None if Wine should be able to run it."""
+    if not info.valid:
+        return info.error
+    if info.dll:
+        return "this is a DLL, not a program"
+    if info.subsystem in ("native", "EFI"):
+        return f"{info.subsystem} executable, not a Windows application"
+    if info.machine not in X86_MACHINES and os.uname().machine in X86_HOSTS:
+        return f"built for {info.machine}, which Wine cannot run on this {os.uname().machine} machine"
+    return None
+
+
+def describe(info):
+    if not info.valid:
+        return f"⚠ {info.error}"
+    arch = f"{info.bits}-bit" if info.machine in X86_MACHINES else f"{info.machine} {info.bits}-bit"
+    parts = [arch, "DLL" if info.dll else info.subsystem]
+    if info.dotnet:
+        parts.append(".NET")
+    if info.installer:
+        parts.append(info.installer)
+    if info.signed:
+        parts.append("signed")
+    return " · ".join(parts)
+
+
+class PECache:
+    """PEInfo per (path, size, mtime): memory first, then SQLite, then ``inspect()``."""
+
+    def __init__(self, path=PE_CACHE_PATH, max_entries=MEMORY_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._requests = queue.Queue()
+        self._pending = set()
+        self._worker = None
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("CREATE TABLE IF NOT EXISTS pe (path TEXT PRIMARY KEY, size INTEGER, mtime REAL, info TEXT)")
+            self._local.db = db
+        return db
+
+    def _remember(self, key, info):
+        with self._lock:
+            self._memory[key] = info
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def peek(self, path, size, mtime):
+        """Memory-only lookup; cheap enough for every row the UI draws."""
+        with self._lock:
+            return self._memory.get((path, size, mtime))
+
+    def get(self, path, size, mtime):
+        info = self.peek(path, size, mtime)
+        if info is not None:
+            return info
+        try:
+            row = self._db().execute("SELECT info FROM pe WHERE path = ? AND size = ? AND mtime = ?",
+                                     (path, size, mtime)).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            return None
+        info = PEInfo(*json.loads(row[0]))
+        self._remember((path, size, mtime), info)
+        return info
+
+    def inspect(self, path):
+        st = os.stat(path)
+        info = self.get(path, st.st_size, st.st_mtime)
+        if info is None:
+            info = inspect(path)
+            self._remember((path, st.st_size, st.st_mtime), info)
+            try:
+                db = self._db()
+                db.execute("INSERT OR REPLACE INTO pe VALUES (?, ?, ?, ?)",
+                           (path, st.st_size, st.st_mtime, json.dumps(list(info))))
+                db.commit()
+            except sqlite3.Error:
+                pass
+        return info
+
+    def request(self, paths, out):
+        """Inspect ``paths`` on the background thread; each result is put on ``out`` as ``(path, info)``."""
+        with self._lock:
+            for path in paths:
+                if path not in self._pending:
+                    self._pending.add(path)
+                    self._requests.put((path, out))
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._work, name="tuxport-pe", daemon=True)
+                self._worker.start()
+
+    def _work(self):
+        while True:
+            try:
+                path, out = self._requests.get(timeout=5)
+            except queue.Empty:
+                with self._lock:
+                    if self._requests.empty():
+                        self._worker = None
+                        return
+                continue
+            try:
+                info = self.inspect(path)
+            except OSError as e:
+                info = _invalid(f"cannot read file: {e}")
+            with self._lock:
+                self._pending.discard(path)
+            out.put((path, info))
@@ -0,0 +1,419 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Pool of per-app Wine prefixes cloned from a prewarmed template.
+
+``wineboot`` runs once, into a template prefix. Each app then gets its own
+prefix cloned from the template. The clone uses reflinks (copy-on-write, on
+btrfs/XFS) where the file system supports them. Otherwise it hard-links the
+fonts and copies everything else. As a last resort it copies the whole
+tree. Hard-linked fonts are read-only in the template, so a program cannot
+change the template through its own prefix. PE images (DLLs, EXEs) are
+never hard-linked: installers such as the vcredist and DirectX
+redistributables, and ``wineboot --update``, overwrite system32 DLLs in
+place, which Wine refuses on a read-only file. ``prefix_for`` starts the
+prefix's wineserver before it returns, so the launch that follows finds
+it warm.
+
+Usage and last-used times are kept in ``pool.db``, an SQLite database the
+window, the daemon and the CLI share. A prefix was last used at the
+newest of its recorded use (``prefix_for`` and ``touch``, which every
+TuxPort launch calls) and its registry files' mtimes, which Wine updates
+however the app was started. ``gc()`` removes prefixes that have not
+been used for a number of days; it is off unless ``prefix_gc_after_days`` is
+set, because a prefix holds an installed program and its user data.
+"""
+
+import collections
+import errno
+import fcntl
+import json
+import os
+import re
+import shutil
+import sqlite3
+import subprocess
+import threading
+import time
+
+from tuxport.wine import SERVER_LINGER, WineNotFound
+
+PREFIX_ROOT = os.path.join(os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share"), "tuxport", "prefixes")
+TEMPLATE_NAME = ".template"
+CLONE_TMP = ".clone-"
+TEMPLATE_TIMEOUT = 600
+DEFAULT_GC_DAYS = 0  # Opt-in: removing a prefix removes the app installed in it
+REGISTRY_FILES = ("system.reg", "user.reg", "userdef.reg")
+
+FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+CLONE_METHODS = ("reflink", "hardlink", "copy")
+# Files worth sharing between prefixes that programs read but never rewrite in place
+HARDLINK_SUFFIXES = (".ttf", ".ttc", ".otf", ".fon")
+# Hard-linked by earlier versions; prefixes cloned then get private copies (see unshare_images)
+PE_SUFFIXES = (".dll", ".exe", ".drv", ".sys", ".ocx", ".cpl", ".acm", ".ax", ".nls", ".tlb")
+# Tokens that differ between releases of the same app and should not split prefixes
+KEY_NOISE = {"setup", "installer", "install", "x64", "x86", "amd64", "win32", "win64", "win", "windows", "64bit", "32bit", "full", "latest"}
+UNSUPPORTED = (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EPERM)
+
+
+def app_key(path):
+    """Prefix name for an installer, e.g. 'Firefox Setup 120.0.exe' -> 'firefox'."""
+    stem = os.path.splitext(os.path.basename(path))[0].lower()
+    tokens = [t for t in re.split(r"[^a-z0-9]+", stem) if t]
+    kept = [t for t in tokens if t not in KEY_NOISE and not re.fullmatch(r"v?\d+[a-z]?", t)]
+    return "-".join(kept or tokens) or "app"
+
+
+def _reflink(src, dst):
+    with open(src, 'rb') as fsrc, open(dst, 'xb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.unlink(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+def clone_tree(src, dst, method="auto"):
+    """Clone the prefix at ``src`` into the new directory ``dst``.
+
+    Returns a Counter of how many files each method handled.
+    """
+    methods = list(CLONE_METHODS) if method == "auto" else list(CLONE_METHODS[CLONE_METHODS.index(method):])
+    stats = collections.Counter()
+    for dirpath, dirnames, filenames in os.walk(src):
+        target_dir = os.path.join(dst, os.path.relpath(dirpath, src))
+        os.makedirs(target_dir, exist_ok=True)
+        shutil.copymode(dirpath, target_dir)
+        for name in dirnames[:]:
+            if os.path.islink(os.path.join(dirpath, name)):
+                dirnames.remove(name)
+                filenames.append(name)
+        for name in filenames:
+            s, d = os.path.join(dirpath, name), os.path.join(target_dir, name)
+            if os.path.islink(s):
+                os.symlink(os.readlink(s), d)  # dosdevices: c: -> ../drive_c, z: -> /
+                stats["symlink"] += 1
+                continue
+            stats[_clone_file(s, d, methods)] += 1
+    return stats
+
+
+def _clone_file(src, dst, methods):
+    # Drops methods from the shared list once they prove unsupported here
+    while methods[0] != "copy":
+        method = methods[0]
+        if method == "hardlink" and not src.lower().endswith(HARDLINK_SUFFIXES):
+            break
+        try:
+            if method == "reflink":
+                _reflink(src, dst)
+                _writable(dst)
+            else:
+                os.link(src, dst)
+            return method
+        except OSError as e:
+            if e.errno not in UNSUPPORTED:
+                raise
+            methods.pop(0)
+    shutil.copy2(src, dst)
+    _writable(dst)
+    return "copy"
+
+
+def _writable(path):
+    # Private copies need not inherit the template's read-only protection
+    os.chmod(path, os.stat(path).st_mode | 0o200)
+
+
+def unshare_images(path):
+    """Replace PE images hard-linked into the prefix at ``path`` by private, writable copies.
+
+    Returns how many files were copied.
+    """
+    copied = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            p = os.path.join(dirpath, name)
+            if not name.lower().endswith(PE_SUFFIXES):
+                continue
+            st = os.lstat(p)
+            if not os.path.isfile(p) or os.path.islink(p) or st.st_nlink < 2:
+                continue
+            tmp = p + ".unshare"
+            shutil.copy2(p, tmp)
+            _writable(tmp)
+            os.replace(tmp, p)
+            copied += 1
+    return copied
+
+
+def disk_usage(path):
+    """(allocated bytes, bytes in files shared by hard links) under ``path``, each inode once."""
+    seen = set()
+    total = shared = 0
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if entry.is_symlink():
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                key = (st.st_dev, st.st_ino)
+                if key in seen:
+                    continue
+                seen.add(key)
+                size = st.st_blocks * 512
+                total += size
+                if st.st_nlink > 1:
+                    shared += size
+    return total, shared
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(int(pid), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        pass  # Alive, owned by someone else
+    return True
+
+
+class PrefixPool:
+    def __init__(self, runtime, root=PREFIX_ROOT, clone_method="auto"):
+        self.runtime = runtime
+        self.root = root
+        self.clone_method = clone_method
+        self.template = os.path.join(root, TEMPLATE_NAME)
+        self.index_path = os.path.join(root, "pool.db")
+        self.template_error = None
+        self._template_thread = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._name_locks = collections.defaultdict(threading.Lock)
+
+    @classmethod
+    def from_settings(cls, runtime, settings):
+        return cls(runtime, os.path.expanduser(settings.get("prefix_root") or PREFIX_ROOT),
+                   settings.get("prefix_clone", "auto"))
+
+    # --- index ---
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            os.makedirs(self.root, exist_ok=True)
+            db = sqlite3.connect(self.index_path, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("CREATE TABLE IF NOT EXISTS prefixes (name TEXT PRIMARY KEY, info TEXT)")
+            self._import_json(db)
+            self._local.db = db
+        return db
+
+    def _import_json(self, db):
+        # The metadata used to be one JSON file, rewritten whole by whichever process wrote last
+        old = os.path.join(self.root, "pool.json")
+        try:
+            with open(old, 'r') as f:
+                prefixes = json.load(f).get("prefixes", {})
+        except (OSError, ValueError, AttributeError):
+            return
+        with db:
+            db.executemany("INSERT OR IGNORE INTO prefixes VALUES (?, ?)",
+                           [(name, json.dumps(info)) for name, info in prefixes.items()])
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+
+    def _update(self, name, **fields):
+        # Read and write in one transaction, so two processes' fields merge
+        try:
+            db = self._db()
+            with db:
+                db.execute("BEGIN IMMEDIATE")
+                row = db.execute("SELECT info FROM prefixes WHERE name = ?", (name,)).fetchone()
+                info = json.loads(row[0]) if row else {}
+                info.update(fields)
+                db.execute("INSERT OR REPLACE INTO prefixes VALUES (?, ?)", (name, json.dumps(info)))
+        except (OSError, sqlite3.Error):
+            pass
+
+    def info(self, name):
+        try:
+            row = self._db().execute("SELECT info FROM prefixes WHERE name = ?", (name,)).fetchone()
+        except (OSError, sqlite3.Error):
+            return {}
+        return json.loads(row[0]) if row else {}
+
+    # --- template ---
+    def template_ready(self):
+        return os.path.exists(os.path.join(self.template, "system.reg"))
+
+    def ensure_template(self):
+        """Build the template on a background thread unless it exists or is being built."""
+        if self.template_ready():
+            return None
+        with self._lock:
+            if self._template_thread is None or not self._template_thread.is_alive():
+                self._template_thread = threading.Thread(target=self.build_template, name="tuxport-template", daemon=True)
+                self._template_thread.start()
+            return self._template_thread
+
+    def prewarm(self):
+        """Start the template's wineserver in the background, if the template exists."""
+        return self.runtime.prewarm(self.template, linger=SERVER_LINGER) if self.template_ready() else None
+
+    def build_template(self):
+        tmp = f"{self.template}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(self.root, exist_ok=True)
+        env = self.runtime.env(tmp)
+        env["WINEDEBUG"] = "-all"
+        try:
+            info = self.runtime.resolve()
+            subprocess.run([info.path, "wineboot", "--init"], env=env, stdin=subprocess.DEVNULL,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=TEMPLATE_TIMEOUT, check=True)
+            if info.wineserver:
+                # Registry hives are flushed when the prefix's wineserver exits
+                subprocess.run([info.wineserver, "-w"], env=env, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL, timeout=TEMPLATE_TIMEOUT)
+            if not os.path.exists(os.path.join(tmp, "system.reg")):
+                raise WineNotFound(f"wineboot did not create a prefix in {tmp}")
+            self._protect(tmp)
+            os.rename(tmp, self.template)
+        except (WineNotFound, OSError, subprocess.SubprocessError) as e:
+            shutil.rmtree(tmp, ignore_errors=True)
+            self.template_error = e
+            return False
+        self.template_error = None
+        self._update(TEMPLATE_NAME, created=time.time())
+        return True
+
+    def _protect(self, path):
+        for dirpath, _, filenames in os.walk(path):
+            for name in filenames:
+                p = os.path.join(dirpath, name)
+                if name.lower().endswith(HARDLINK_SUFFIXES) and not os.path.islink(p):
+                    os.chmod(p, os.stat(p).st_mode & ~0o222)
+
+    # --- prefixes ---
+    def path_for(self, name):
+        return os.path.join(self.root, name)
+
+    def prefix_for(self, exe):
+        """Return the prefix for ``exe``'s app, cloning it from the template on first use.
+
+        Without a template yet the directory is left for Wine to create (the slow
+        wineboot path) and the template build is started for next time.
+        """
+        name = app_key(exe)
+        path = self.path_for(name)
+        with self._lock:
+            name_lock = self._name_locks[name]
+        with name_lock:
+            if not os.path.isdir(path):
+                if self.template_ready():
+                    self._clone(name, path)
+                else:
+                    self.ensure_template()
+            elif not self.info(name).get("private_images"):
+                unshare_images(path)  # Cloned by a version that hard-linked DLLs
+            self._update(name, last_used=time.time(), private_images=True)
+        self.runtime.warm(path, linger=SERVER_LINGER)  # Callers are on workers already
+        return path
+
+    def _clone(self, name, path):
+        tmp = os.path.join(self.root, f"{CLONE_TMP}{name}-{os.getpid()}")
+        shutil.rmtree(tmp, ignore_errors=True)
+        t0 = time.perf_counter()
+        try:
+            stats = clone_tree(self.template, tmp, self.clone_method)
+            os.rename(tmp, path)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        method = max((m for m in CLONE_METHODS if stats[m]), key=lambda m: stats[m], default="copy")
+        self._update(name, created=time.time(), clone=method, clone_ms=round((time.perf_counter() - t0) * 1000, 1))
+
+    def names(self):
+        try:
+            with os.scandir(self.root) as it:
+                return sorted(e.name for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith("."))
+        except OSError:
+            return []
+
+    def refresh_usage(self):
+        """Measure every prefix and the template; returns {name: info}."""
+        result = {}
+        for name in self.names() + ([TEMPLATE_NAME] if self.template_ready() else []):
+            size, shared = disk_usage(self.path_for(name))
+            self._update(name, size=size, shared=shared)
+            result[name] = self.info(name)
+        return result
+
+    def touch(self, prefix):
+        """Record a launch in ``prefix``; prefixes outside the pool are ignored."""
+        path = os.path.realpath(prefix)
+        if os.path.dirname(path) == os.path.realpath(self.root) and os.path.isdir(path):
+            self._update(os.path.basename(path), last_used=time.time())
+
+    def last_used(self, name):
+        """The newest of the recorded use and the registry files Wine writes while the app runs."""
+        path = self.path_for(name)
+        times = [self.info(name).get("last_used") or 0]
+        for f in REGISTRY_FILES + ("",):  # "": the prefix directory itself
+            try:
+                times.append(os.stat(os.path.join(path, f)).st_mtime)
+            except OSError:
+                pass
+        return max(times)
+
+    def remove(self, name):
+        shutil.rmtree(self.path_for(name), ignore_errors=True)
+        try:
+            db = self._db()
+            with db:
+                db.execute("DELETE FROM prefixes WHERE name = ?", (name,))
+        except (OSError, sqlite3.Error):
+            pass
+
+    def gc(self, max_age_days=DEFAULT_GC_DAYS, keep=()):
+        """Remove prefixes unused for ``max_age_days`` (0 disables) and leftovers of interrupted clones."""
+        removed = []
+        try:
+            with os.scandir(self.root) as it:
+                leftovers = [e.name for e in it if e.name.startswith((CLONE_TMP, TEMPLATE_NAME + ".tmp-"))]
+        except OSError:
+            leftovers = []
+        for name in leftovers:
+            if not _pid_alive(name.rsplit("-", 1)[-1]):
+                shutil.rmtree(self.path_for(name), ignore_errors=True)
+        if not max_age_days:
+            return removed
+        cutoff = time.time() - max_age_days * 86400
+        keep = {os.path.realpath(p) for p in keep if p}
+        for name in self.names():
+            if os.path.realpath(self.path_for(name)) in keep or self.last_used(name) >= cutoff:
+                continue
+            self.remove(name)
+            removed.append(name)
+        return removed
+
+    def start_gc(self, max_age_days=DEFAULT_GC_DAYS, keep=()):
+        thread = threading.Thread(target=self.gc, args=(max_age_days, keep), name="tuxport-prefix-gc", daemon=True)
+        thread.start()
+        return thread
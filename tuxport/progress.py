@@ -0,0 +1,82 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Throughput and ETA for progress displays.
+
+Workers only bump plain integer counters on the job. The UI samples those
+counters at a fixed rate (SAMPLE_INTERVAL_MS) and a ``Meter`` turns the
+samples into a smoothed rate, so redraws no longer scale with how fast
+the bytes arrive.
+"""
+
+import time
+
+SAMPLE_INTERVAL_MS = 40  # 25 Hz
+HALF_LIFE = 2.0  # Seconds for an old rate sample to lose half its weight
+WARMUP = 0.5  # Seconds of data before a rate is shown
+
+
+class Meter:
+    """Exponentially weighted bytes/second from a growing byte count."""
+
+    def __init__(self, half_life=HALF_LIFE):
+        self.half_life = half_life
+        self.rate = None
+        self._last = None
+        self._started = None
+
+    def sample(self, count, now=None):
+        now = time.monotonic() if now is None else now
+        if self._last is None or count < self._last[1]:
+            self._last = (now, count)
+            self._started = now
+            return self.rate
+        then, before = self._last
+        elapsed = now - then
+        if elapsed <= 0:
+            return self.rate
+        current = (count - before) / elapsed
+        if self.rate is None:
+            if now - self._started < WARMUP:
+                return None  # Too few bytes yet; keep accumulating from the start
+            self.rate = current
+        else:
+            # Time-based weight, so an irregular sampling rate does not change the smoothing
+            weight = 1 - 0.5 ** (elapsed / self.half_life)
+            self.rate += weight * (current - self.rate)
+        self._last = (now, count)
+        return self.rate
+
+    def hold(self):
+        # While paused: the next sample starts a fresh interval but keeps the rate
+        self._last = None
+
+    def eta(self, done, total):
+        """Seconds left, or None while the rate or the total is unknown."""
+        if not total or not self.rate or self.rate <= 0:
+            return None
+        return max(0, total - done) / self.rate
+
+
+def format_size(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.2f} GB"
+
+
+def format_rate(rate):
+    return f"{format_size(rate)}/s" if rate is not None else "–"
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return "–"
+    seconds = int(seconds + 0.5)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {seconds // 60 % 60:02d}m"
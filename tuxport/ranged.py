@@ -0,0 +1,365 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Segmented, resumable HTTP downloads.
+
+Servers that honour ``Range`` get the file split into byte ranges fetched
+in parallel into a preallocated ``.part`` file. Progress is checkpointed in
+a JSON sidecar so an interrupted download picks up where it stopped.
+Servers without range support fall back to a single stream, and so does a
+segmented download whose Range requests start getting whole-file replies.
+
+Each connection reads into one reused buffer, in chunks sized by
+integrity.ChunkSizer, so memory does not grow with the installer. The
+file is hashed in the same pass and checked against an expected checksum
+before the ``.part`` file is fsynced and renamed into place.
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.error
+
+from tuxport.integrity import CHUNK_MAX, ChunkSizer, PrefixHasher, verify
+from tuxport.net import open_url
+
+SEGMENT_MIN = 8 * 1024 * 1024  # Don't split below this many bytes per connection
+STATE_SAVE_INTERVAL = 1.0
+RETRIES = 3
+
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".tuxport-state"
+
+
+class RangeNotHonoured(Exception):
+    pass
+
+
+class SegmentAborted(Exception):
+    pass
+
+
+class Probe:
+    def __init__(self, url, status, size=None, accept_ranges=False, etag=None, last_modified=None, content_type=None):
+        self.url = url
+        self.status = status
+        self.size = size
+        self.accept_ranges = accept_ranges
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_type = content_type
+
+
+def _probe_from_response(response, status):
+    # Works for both HTTPResponse and HTTPError (used for 304 Not Modified)
+    headers = response.headers
+    size = None
+    accept_ranges = headers.get('Accept-Ranges', '').lower() == 'bytes'
+    content_range = headers.get('Content-Range')
+    if status == 206 and content_range and '/' in content_range:
+        total = content_range.rsplit('/', 1)[1]
+        if total.isdigit():
+            size = int(total)
+        accept_ranges = True
+    elif headers.get('Content-Length') and status != 304:
+        size = int(headers.get('Content-Length'))
+    return Probe(
+        response.geturl(), status, size, accept_ranges,
+        headers.get('ETag'), headers.get('Last-Modified'),
+        headers.get('Content-Type'),
+    )
+
+
+def probe(url, headers=None):
+    # HEAD first; some servers reject it, so retry with a one-byte Range GET.
+    # Conditional ``headers`` may turn either into a 304 Not Modified.
+    try:
+        with open_url(url, headers, method='HEAD') as response:
+            result = _probe_from_response(response, response.status)
+        if result.size is not None:
+            return result
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return _probe_from_response(e, 304)
+        if e.code not in (403, 405, 501):
+            raise
+    h = dict(headers or {})
+    h['Range'] = 'bytes=0-0'
+    try:
+        with open_url(url, h) as response:
+            return _probe_from_response(response, response.status)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return _probe_from_response(e, 304)
+        raise
+
+
+def plan_segments(size, connections):
+    count = max(1, min(connections, size // SEGMENT_MIN))
+    step = -(-size // count)
+    return [[start, min(start + step, size) - 1, 0] for start in range(0, size, step)]
+
+
+class _State:
+    # Segments are [first_byte, last_byte, bytes_done]
+    def __init__(self, path, url, info, segments):
+        self.path = path
+        self.url = url
+        self.size = info.size
+        self.etag = info.etag
+        self.last_modified = info.last_modified
+        self.segments = segments
+        self.lock = threading.Lock()
+        self._saved_at = 0.0
+
+    @property
+    def done(self):
+        return sum(s[2] for s in self.segments)
+
+    def contiguous(self):
+        # End of the written prefix: everything before it is on disk
+        end = 0
+        for first, last, done in sorted(self.segments):
+            if first != end:
+                break
+            end = first + done
+            if end <= last:
+                break
+        return end
+
+    @classmethod
+    def load(cls, path, url, info):
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("url") != url or data.get("size") != info.size:
+            return None
+        # A changed validator means the remote file changed under us
+        if data.get("etag") != info.etag or data.get("last_modified") != info.last_modified:
+            return None
+        return cls(path, url, info, data["segments"])
+
+    def save(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._saved_at < STATE_SAVE_INTERVAL:
+            return
+        self._saved_at = now
+        data = {
+            "url": self.url, "size": self.size, "etag": self.etag,
+            "last_modified": self.last_modified, "segments": self.segments,
+        }
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
+
+
+def _preallocate(fd, size):
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        os.ftruncate(fd, size)
+
+
+def _remove(*paths):
+    for p in paths:
+        try:
+            os.remove(p)
+        except OSError:
+            pass
+
+
+def _fetch_segment(url, fd, segment, state, checkpoint, progress, written):
+    validator = state.etag or state.last_modified
+    attempts = 0
+    buf = memoryview(bytearray(CHUNK_MAX))
+    sizer = ChunkSizer()
+    while segment[2] <= segment[1] - segment[0]:
+        start = segment[0] + segment[2]
+        headers = {'Range': f'bytes={start}-{segment[1]}'}
+        if validator:
+            headers['If-Range'] = validator
+        try:
+            with open_url(url, headers) as response:
+                if response.status != 206:
+                    raise RangeNotHonoured(f"Server ignored Range request for {url}")
+                while True:
+                    checkpoint()
+                    want = min(sizer.start(), segment[1] - segment[0] + 1 - segment[2])
+                    n = response.readinto(buf[:want]) if want > 0 else 0
+                    if not n:
+                        break
+                    sizer.done(n)
+                    os.pwrite(fd, buf[:n], segment[0] + segment[2])
+                    with state.lock:
+                        segment[2] += n
+                        state.save()
+                    progress(n)
+                    written()
+                    attempts = 0
+                if segment[2] <= segment[1] - segment[0]:
+                    raise ConnectionResetError(f"Connection closed mid-range for {url}")
+        except OSError:  # Includes URLError; the next attempt resumes at segment[2]
+            attempts += 1
+            if attempts > RETRIES:
+                raise
+            time.sleep(min(2 ** attempts, 10))
+
+
+def _download_segmented(url, dest, info, job, connections, progress, digests, expected, tail):
+    part = dest + PART_SUFFIX
+    state_path = dest + STATE_SUFFIX
+    state = _State.load(state_path, url, info) if os.path.exists(part) else None
+    if state is None:
+        state = _State(state_path, url, info, plan_segments(info.size, connections))
+    job.downloaded = state.done
+    fd = os.open(part, os.O_RDWR | os.O_CREAT, 0o644)
+    errors = []
+    abort = threading.Event()
+    hasher = PrefixHasher(fd, digests) if digests is not None else None
+
+    def written():
+        if hasher is None and tail is None:
+            return
+        end = state.contiguous()
+        if hasher is not None:
+            hasher.advance(end)
+        if tail is not None:
+            tail.advance(end)
+
+    def checkpoint():
+        job.checkpoint()
+        if abort.is_set():
+            raise SegmentAborted()
+
+    try:
+        if os.fstat(fd).st_size != info.size:
+            _preallocate(fd, info.size)
+        state.save(force=True)
+        if tail is not None:
+            tail.start(part)
+            tail.advance(state.contiguous())  # A resumed download already has a prefix
+
+        def worker(segment):
+            try:
+                _fetch_segment(url, fd, segment, state, checkpoint, progress, written)
+            except SegmentAborted:
+                pass
+            except BaseException as e:
+                # One failed range stops the others; the sidecar keeps their progress
+                errors.append(e)
+                abort.set()
+
+        threads = [threading.Thread(target=worker, args=(seg,), daemon=True)
+                   for seg in state.segments if seg[2] <= seg[1] - seg[0]]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if not errors:
+            if hasher is not None:
+                hasher.advance(info.size, wait=True)  # Resumed ranges, and any the writers left
+                if expected:
+                    verify(digests, expected)
+            if tail is not None:
+                tail.advance(info.size)
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+        with state.lock:
+            state.save(force=True)
+    if errors:
+        raise errors[0]
+    os.replace(part, dest)
+    _remove(state_path)
+
+
+def _download_stream(url, dest, job, progress, digests, expected, tail):
+    part = dest + PART_SUFFIX
+    buf = memoryview(bytearray(CHUNK_MAX))
+    sizer = ChunkSizer()
+    with open_url(url) as response, open(part, 'wb') as out_file:
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit():
+            job.total = int(length)
+        if tail is not None:
+            tail.start(part)
+        while True:
+            job.checkpoint()
+            n = response.readinto(buf[:sizer.start()])
+            if not n:
+                break
+            sizer.done(n)
+            out_file.write(buf[:n])
+            if digests is not None:
+                digests.update(buf[:n])
+            if tail is not None:
+                out_file.flush()  # The reader sees the file, not our buffer
+                tail.advance(out_file.tell())
+            progress(n)
+        if expected:
+            verify(digests, expected)
+        out_file.flush()
+        os.fsync(out_file.fileno())
+    os.replace(part, dest)
+
+
+def download(url, dest, job, connections=4, info=None, digests=None, expected=None, tail=None):
+    """Download ``url`` to ``dest``, resuming a previous attempt if possible.
+
+    ``job`` supplies ``checkpoint()`` (pause/cancel) and receives
+    ``total``/``downloaded`` updates, plus ``transferred`` (bytes actually
+    received, for rates; resumed bytes only count toward ``downloaded``).
+    ``digests`` (integrity.Digests) is fed the file's bytes; with
+    ``expected`` = ``(algorithm, hex)`` a mismatch raises ChecksumMismatch
+    and ``dest`` is never created. ``tail`` (archives.Tail) is told how much
+    of the file is written, in order, so it can be read while the download
+    runs.
+    """
+    if expected and digests is None:
+        raise ValueError("verifying a checksum needs digests")
+    if info is None:
+        info = probe(url)
+    url = info.url
+    job.total = info.size
+    job.downloaded = 0
+    lock = threading.Lock()
+
+    def progress(n):
+        with lock:
+            job.downloaded += n
+            job.transferred += n
+
+    try:
+        if info.accept_ranges and info.size:
+            try:
+                _download_segmented(url, dest, info, job, connections, progress, digests, expected, tail)
+            except RangeNotHonoured as e:
+                # The file changed on the server (If-Range no longer matches) or a proxy strips
+                # Range: the ranges on disk may belong to another file, so start over in one stream
+                _remove(dest + PART_SUFFIX, dest + STATE_SUFFIX)
+                job.downloaded = 0
+                if digests is not None:
+                    digests.reset()
+                if tail is not None:
+                    tail.finish(e)  # Its reader already has the old bytes; the archive is extracted once complete
+                    tail = None
+                _download_stream(url, dest, job, progress, digests, expected, None)
+        else:
+            _download_stream(url, dest, job, progress, digests, expected, tail)
+    except Exception as e:
+        if tail is not None:
+            tail.finish(e)
+        # Keep the .part/.state pair after network errors so the next
+        # attempt resumes; a cancelled or rejected download starts over.
+        resumable = isinstance(e, OSError) and not isinstance(e, urllib.error.HTTPError)
+        if not resumable:
+            _remove(dest + PART_SUFFIX, dest + STATE_SUFFIX)
+        raise
+    if tail is not None:
+        tail.finish()
+    return dest
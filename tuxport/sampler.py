@@ -0,0 +1,249 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Per-app CPU, memory and disk I/O, sampled from /proc.
+
+A Wine app is a tree of processes: the app, its helpers (winedevice.exe,
+services.exe, ...) and a ``wineserver`` per prefix. Apps are launched in
+their own session, so every process whose session is the app's PID (or
+whose parent belongs to the app) is counted for it. The prefix's
+wineserver, which detaches into its own session, is shared out between
+the apps running in that prefix.
+
+Each tick reads ``stat``, ``statm`` and ``io`` of the app processes and
+of PIDs not seen before. PIDs that belong to nobody are only re-read
+every RECHECK_EVERY ticks, so a busy host costs one directory listing
+per tick. History is kept in fixed-size ``array`` rings.
+"""
+
+import array
+import os
+import threading
+import time
+
+from tuxport.wine import default_prefix
+
+DEFAULT_INTERVAL = 1.0
+HISTORY = 120  # Samples kept per app: two minutes at the default interval
+RECHECK_EVERY = 10
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+SERVER = "wineserver"
+
+
+class History:
+    """Ring buffers of float32 samples, one per metric, oldest overwritten first."""
+
+    METRICS = ("cpu", "rss", "read", "write")
+
+    def __init__(self, size=HISTORY):
+        self.size = size
+        self.count = 0
+        self._next = 0
+        self._rings = {name: array.array('f', bytes(4 * size)) for name in self.METRICS}
+
+    def append(self, **values):
+        for name, ring in self._rings.items():
+            ring[self._next] = values.get(name) or 0.0
+        self._next = (self._next + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def series(self, metric):
+        """The stored samples of ``metric``, oldest first."""
+        ring = self._rings[metric]
+        if self.count < self.size:
+            return ring[:self.count].tolist()
+        return (ring[self._next:] + ring[:self._next]).tolist()
+
+
+class AppUsage:
+    def __init__(self, history=HISTORY):
+        self.history = History(history)
+        self.processes = 0
+        self.cpu = None  # Percent of one core, like top; None until two samples exist
+        self.rss = 0
+        self.peak_rss = 0
+        self.read_rate = None
+        self.write_rate = None
+        self.cpu_seconds = 0.0
+        self.read_bytes = 0
+        self.write_bytes = 0
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def parse_stat(data):
+    """``(comm, ppid, session, cpu ticks, start ticks)`` from /proc/<pid>/stat."""
+    # comm may contain spaces and parentheses; it ends at the last ")"
+    close = data.rindex(b")")
+    comm = data[data.index(b"(") + 1:close].decode(errors="replace")
+    fields = data[close + 2:].split()
+    return comm, int(fields[1]), int(fields[3]), int(fields[11]) + int(fields[12]), int(fields[19])
+
+
+def parse_io(data):
+    values = dict(line.split(b": ") for line in data.splitlines() if b": " in line)
+    return int(values.get(b"read_bytes", 0)), int(values.get(b"write_bytes", 0))
+
+
+class ResourceSampler:
+    """Samples the running apps of a ProcessSupervisor every ``interval`` seconds."""
+
+    def __init__(self, supervisor, interval=DEFAULT_INTERVAL, history=HISTORY, proc="/proc"):
+        self.supervisor = supervisor
+        self.interval = interval
+        self.history = history
+        self.proc = proc
+        self.usage = {}  # app id -> AppUsage
+        self._owners = {}  # pid -> (start ticks, app id or (SERVER, prefix))
+        self._foreign = {}  # pid -> tick it was last found to belong to nobody
+        self._prev = {}  # (pid, start ticks) -> (cpu ticks, read bytes, write bytes)
+        self._tick = 0
+        self._last = None  # (monotonic, uptime ticks) of the previous sample
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="tuxport-sampler", daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except OSError:
+                pass  # /proc unavailable (not Linux, or hidepid); try again next tick
+
+    def get(self, app_id):
+        return self.usage.get(app_id)
+
+    def _owner(self, pid, comm, ppid, session, start, sessions):
+        if session in sessions:
+            return sessions[session]
+        parent = self._owners.get(ppid)
+        if parent is not None and not isinstance(parent[1], tuple):
+            return parent[1]  # A descendant that started its own session
+        if comm == SERVER:
+            return SERVER, self._prefix_of(pid)
+        return None
+
+    def _prefix_of(self, pid):
+        try:
+            for item in _read(f"{self.proc}/{pid}/environ").split(b"\0"):
+                if item.startswith(b"WINEPREFIX="):
+                    return os.path.realpath(item[11:].decode(errors="replace"))
+        except OSError:
+            pass
+        return os.path.realpath(os.path.expanduser("~/.wine"))
+
+    def sample(self):
+        """Take one sample now; returns {app id: AppUsage} for the running apps."""
+        apps = [a for a in list(self.supervisor.apps.values()) if a.running]
+        self._tick += 1
+        if not apps:
+            self.usage = {}
+            self._owners.clear()
+            self._prev.clear()
+            self._last = None
+            return self.usage
+        sessions = {app.pid: app.id for app in apps}
+        with open(f"{self.proc}/uptime") as f:
+            uptime_ticks = float(f.read().split()[0]) * CLK_TCK
+        now = time.monotonic()
+        totals = {app.id: [0, 0, 0, 0, 0] for app in apps}  # processes, ticks, rss, read, write
+        servers = {}
+        prev, seen = {}, set()
+        with os.scandir(self.proc) as it:
+            for entry in it:
+                if not entry.name.isdigit():
+                    continue
+                pid = int(entry.name)
+                seen.add(pid)
+                known = self._owners.get(pid)
+                if known is None and self._tick - self._foreign.get(pid, -RECHECK_EVERY) < RECHECK_EVERY:
+                    continue
+                try:
+                    comm, ppid, session, ticks, start = parse_stat(_read(f"{entry.path}/stat"))
+                    if known is None or known[0] != start:
+                        owner = self._owner(pid, comm, ppid, session, start, sessions)
+                        if owner is None:
+                            self._owners.pop(pid, None)
+                            self._foreign[pid] = self._tick
+                            continue
+                        known = self._owners[pid] = (start, owner)
+                        self._foreign.pop(pid, None)
+                    rss = int(_read(f"{entry.path}/statm").split()[1]) * PAGE_SIZE
+                    try:
+                        read, write = parse_io(_read(f"{entry.path}/io"))
+                    except (OSError, ValueError):
+                        read = write = 0  # Not ours to read (setuid helpers)
+                except (OSError, ValueError, IndexError):
+                    continue  # Exited while we were reading it
+                key = (pid, start)
+                prev[key] = (ticks, read, write)
+                if key in self._prev:
+                    base = self._prev[key]
+                elif self._last is not None and start >= self._last[1]:
+                    base = (0, 0, 0)  # Started since the last sample: all of it is new
+                else:
+                    base = (ticks, read, write)  # Already running when first seen
+                delta = (1, ticks - base[0], rss, read - base[1], write - base[2])
+                owner = known[1]
+                target = servers.setdefault(owner[1], [0] * 5) if isinstance(owner, tuple) else totals.get(owner)
+                if target is not None:
+                    for i, value in enumerate(delta):
+                        target[i] += value
+        for pid in list(self._owners):
+            if pid not in seen:
+                del self._owners[pid]
+        self._foreign = {pid: t for pid, t in self._foreign.items() if pid in seen}
+
+        # Each prefix's wineserver is split between the apps running in it
+        by_prefix = {}
+        for app in apps:
+            by_prefix.setdefault(os.path.realpath(app.prefix or default_prefix()), []).append(app.id)
+        for prefix, server in servers.items():
+            owners = by_prefix.get(prefix, ())
+            for app_id in owners:
+                for i, value in enumerate(server):
+                    totals[app_id][i] += value / len(owners)
+
+        elapsed = now - self._last[0] if self._last else None
+        usage = {}
+        for app in apps:
+            u = self.usage.get(app.id) or AppUsage(self.history)
+            processes, ticks, rss, read, write = totals[app.id]
+            u.processes = round(processes)
+            u.rss = int(rss)
+            u.peak_rss = max(u.peak_rss, u.rss)
+            if elapsed:
+                u.cpu = ticks / CLK_TCK / elapsed * 100
+                u.read_rate = read / elapsed
+                u.write_rate = write / elapsed
+                u.cpu_seconds += ticks / CLK_TCK
+                u.read_bytes += int(read)
+                u.write_bytes += int(write)
+                u.history.append(cpu=u.cpu, rss=u.rss, read=u.read_rate, write=u.write_rate)
+            usage[app.id] = u
+        self._prev = prev
+        self._last = (now, uptime_ticks)
+        self.usage = usage
+        return usage
+
+
+def format_usage(usage):
+    from tuxport.progress import format_rate, format_size
+    if usage is None or usage.cpu is None:
+        return ""
+    io = (usage.read_rate or 0) + (usage.write_rate or 0)
+    return f"CPU {usage.cpu:.0f}% · {format_size(usage.rss)} · I/O {format_rate(io)}"
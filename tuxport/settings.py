@@ -0,0 +1,47 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+
+import json
+import os
+
+SETTINGS_FILE = os.path.expanduser("~/.tuxport_settings.json")
+
+DEFAULTS = {
+    "theme": "dark",
+    "default_folder": os.path.expanduser("~"),
+    "wine_path": "wine",
+    "download_connections": 4,
+    "cache_max_mb": 4096,
+    "install_concurrency": 2,
+    "prefix_isolation": True,
+    "prefix_clone": "auto",
+    # Off: removing a prefix removes its app. Not "prefix_gc_days", whose old
+    # default of 90 is in many saved settings files.
+    "prefix_gc_after_days": 0,
+    "checksum_sidecar": True,
+    "trace_log": True,
+    "metrics_textfile": "",
+    "use_daemon": True,
+    "daemon_socket": "",
+    "sampler_interval": 1.0,
+}
+
+
+def load_settings():
+    if os.path.exists(SETTINGS_FILE):
+        try:
+            with open(SETTINGS_FILE, 'r') as f:
+                return json.load(f)
+        except Exception:
+            pass
+    return dict(DEFAULTS)
+
+
+def save_settings(settings):
+    try:
+        with open(SETTINGS_FILE, 'w') as f:
+            json.dump(settings, f)
+    except Exception:
+        pass
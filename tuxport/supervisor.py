@@ -0,0 +1,150 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Non-blocking supervisor for Windows apps launched through Wine.
+
+Each app is started with ``Popen`` in its own session. Reader threads keep
+its stdout/stderr in fixed-size ring buffers, so chatty Wine debug output
+never grows memory, and a waiter thread records the exit code. The UI
+drains state changes with ``ProcessSupervisor.attach(root)``. The first
+line of output and the exit are logged as trace spans measured from launch.
+"""
+
+import collections
+import itertools
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+
+from tuxport import trace
+
+OUTPUT_LINES = 500
+MAX_LINE = 4096
+KILL_GRACE = 3.0
+
+
+class App:
+    _ids = itertools.count(1)
+
+    def __init__(self, name, exe, prefix, proc, max_lines=OUTPUT_LINES, on_exit=None):
+        self.id = next(self._ids)
+        self.name = name
+        self.exe = exe
+        self.prefix = prefix
+        self.proc = proc
+        self.pid = proc.pid
+        self.started = time.time()
+        self.ended = None
+        self.returncode = None
+        self.first_output = None
+        self.killed = False
+        self.on_exit = on_exit
+        self.exited = threading.Event()
+        self.stdout = collections.deque(maxlen=max_lines)
+        self.stderr = collections.deque(maxlen=max_lines)
+        self.timing = getattr(proc, "timing", None)
+
+    @property
+    def running(self):
+        return self.returncode is None
+
+    @property
+    def uptime(self):
+        return (self.ended or time.time()) - self.started
+
+    def output(self):
+        return "".join(self.stdout), "".join(self.stderr)
+
+
+class ProcessSupervisor:
+    def __init__(self, runtime, max_lines=OUTPUT_LINES):
+        self.runtime = runtime
+        self.max_lines = max_lines
+        self.apps = {}
+        self.listeners = []
+        self._events = queue.Queue()
+
+    def launch(self, exe, prefix=None, name=None, on_exit=None, args=(), cwd=None):
+        """Start ``exe`` under Wine and return its App right away."""
+        proc = self.runtime.launch(
+            exe, prefix, args, cwd=cwd,
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            start_new_session=True,  # Own process group, so kill() reaches the whole tree
+        )
+        app = App(name or os.path.basename(exe), exe, prefix or self.runtime.prefix, proc, self.max_lines, on_exit)
+        self.apps[app.id] = app
+        for stream, buf in ((proc.stdout, app.stdout), (proc.stderr, app.stderr)):
+            threading.Thread(target=self._read, args=(app, stream, buf), daemon=True).start()
+        threading.Thread(target=self._wait, args=(app,), daemon=True).start()
+        self._events.put(app)
+        return app
+
+    def _read(self, app, stream, buf):
+        with stream:
+            for line in iter(lambda: stream.readline(MAX_LINE), b""):
+                if app.first_output is None:
+                    app.first_output = time.time()
+                    trace.record("first_output", (app.first_output - app.started) * 1000, start=app.started, exe=app.exe)
+                buf.append(line.decode("utf-8", errors="replace"))
+
+    def _wait(self, app):
+        app.returncode = app.proc.wait()
+        app.ended = time.time()
+        trace.record("process_exit", app.uptime * 1000, start=app.started, exe=app.exe,
+                     returncode=app.returncode, killed=app.killed)
+        app.exited.set()
+        self._events.put(app)
+
+    def kill(self, app_id):
+        app = self.apps.get(app_id)
+        if app is None or not app.running:
+            return
+        app.killed = True
+        self._signal(app, signal.SIGTERM)
+
+        def escalate():
+            if app.running:
+                self._signal(app, signal.SIGKILL)
+        timer = threading.Timer(KILL_GRACE, escalate)
+        timer.daemon = True
+        timer.start()
+
+    def _signal(self, app, sig):
+        try:
+            os.killpg(app.pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def running(self):
+        return [a for a in self.apps.values() if a.running]
+
+    def forget(self, app_id):
+        app = self.apps.get(app_id)
+        if app is not None and not app.running:
+            del self.apps[app_id]
+
+    def poll(self):
+        # Runs on the Tk thread
+        changed = {}
+        while True:
+            try:
+                app = self._events.get_nowait()
+            except queue.Empty:
+                break
+            changed[app.id] = app
+        for app in changed.values():
+            if not app.running and app.on_exit:
+                app.on_exit(app)
+                app.on_exit = None
+            for listener in self.listeners:
+                listener(app)
+
+    def attach(self, root, interval=200):
+        def tick():
+            self.poll()
+            root.after(interval, tick)
+        root.after(interval, tick)
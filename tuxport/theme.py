@@ -0,0 +1,30 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+
+# Theme colors
+THEMES = {
+    "dark": {
+        "BG": "#23272e", "FG": "#e0e0e0", "ACCENT": "#4F8EF7", "LABEL": "#b0b0b0",
+        "ENTRY_BG": "#2d313a", "ENTRY_FG": "#e0e0e0"
+    },
+    "light": {
+        "BG": "#f5f5f5", "FG": "#23272e", "ACCENT": "#4F8EF7", "LABEL": "#444",
+        "ENTRY_BG": "#fff", "ENTRY_FG": "#23272e"
+    }
+}
+
+FONT_TITLE = ("Segoe UI", 20, "bold")
+FONT_SUBTITLE = ("Segoe UI", 12)
+FONT_DESC = ("Segoe UI", 10, "italic")
+FONT_LABEL = ("Segoe UI", 11)
+FONT_BUTTON = ("Segoe UI", 12)
+
+# Colors of the active theme; dialogs read these when they are built
+current = dict(THEMES["dark"])
+
+
+def set_theme(name):
+    current.update(THEMES.get(name, THEMES["dark"]))
+    return current
@@ -0,0 +1,153 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Timing spans: JSON lines to a rotating log, totals to a Prometheus textfile.
+
+``with trace.span("download", url=url) as attrs:`` times a block, and
+``trace.record(name, ms)`` logs a duration measured elsewhere (process
+spawn, first output, exit). Each span becomes one line in
+``~/.cache/tuxport/trace.jsonl``, rotated at TRACE_MAX_BYTES. When
+``settings["metrics_textfile"]`` is set, per-span count/sum/last are also
+written there in the Prometheus text format, for node_exporter's
+textfile collector; the values cover the current process.
+
+Nothing is imported or opened until the first span ends, so tracing costs
+nothing at start-up.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+
+from tuxport.cache import CACHE_DIR
+
+TRACE_PATH = os.path.join(CACHE_DIR, "trace.jsonl")
+TRACE_MAX_BYTES = 1024 * 1024
+TRACE_BACKUPS = 3
+METRICS_INTERVAL = 15.0
+
+_config = {"enabled": True, "path": TRACE_PATH, "textfile": None}
+_totals = {}  # name -> [count, seconds, errors, last seconds]
+_lock = threading.Lock()
+_local = threading.local()
+_logger = None
+_metrics_written = 0.0
+
+
+def configure(settings):
+    _config["enabled"] = settings.get("trace_log", True)
+    textfile = settings.get("metrics_textfile") or None
+    if textfile and not _config["textfile"]:
+        atexit.register(write_metrics)
+    _config["textfile"] = os.path.expanduser(textfile) if textfile else None
+
+
+def _log():
+    global _logger
+    if _logger is None:
+        import logging
+        import logging.handlers
+        logger = logging.getLogger("tuxport.trace")
+        logger.propagate = False
+        try:
+            os.makedirs(os.path.dirname(_config["path"]), exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                _config["path"], maxBytes=TRACE_MAX_BYTES, backupCount=TRACE_BACKUPS, delay=True)
+        except OSError:
+            handler = logging.NullHandler()
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        _logger = logger
+    return _logger
+
+
+def record(name, ms, error=None, start=None, **attrs):
+    """Log a finished span of ``ms`` milliseconds."""
+    with _lock:
+        totals = _totals.setdefault(name, [0, 0.0, 0, 0.0])
+        totals[0] += 1
+        totals[1] += ms / 1000
+        totals[2] += error is not None
+        totals[3] = ms / 1000
+    stack = getattr(_local, "stack", None)
+    entry = {
+        "ts": round(start if start is not None else time.time() - ms / 1000, 3),
+        "span": name,
+        "ms": round(ms, 2),
+        "pid": os.getpid(),
+        "thread": threading.current_thread().name,
+    }
+    if stack:
+        entry["parent"] = stack[-1]
+    if error is not None:
+        entry["error"] = error
+    entry.update(attrs)
+    if _config["enabled"]:
+        _log().info(json.dumps(entry, default=str))
+    if _config["textfile"] and time.monotonic() - _metrics_written >= METRICS_INTERVAL:
+        write_metrics()
+
+
+@contextlib.contextmanager
+def span(name, **attrs):
+    """Time the ``with`` block; the yielded dict collects extra fields for the log line."""
+    stack = _local.__dict__.setdefault("stack", [])
+    stack.append(name)
+    start = time.time()
+    t0 = time.perf_counter()
+    error = None
+    try:
+        yield attrs
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        ms = (time.perf_counter() - t0) * 1000
+        stack.pop()
+        record(name, ms, error, start, **attrs)
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def write_metrics(path=None):
+    """Write span totals in the Prometheus text format, atomically."""
+    global _metrics_written
+    path = path or _config["textfile"]
+    if not path:
+        return
+    with _lock:
+        totals = {name: list(v) for name, v in _totals.items()}
+        _metrics_written = time.monotonic()
+    lines = [
+        "# HELP tuxport_span_seconds Time spent in TuxPort operations by this process.",
+        "# TYPE tuxport_span_seconds summary",
+    ]
+    for name, (count, seconds, _, _) in sorted(totals.items()):
+        label = f'span="{_escape(name)}"'
+        lines.append(f"tuxport_span_seconds_sum{{{label}}} {seconds:.6f}")
+        lines.append(f"tuxport_span_seconds_count{{{label}}} {count}")
+    lines += ["# HELP tuxport_span_last_seconds Duration of the most recent span.",
+              "# TYPE tuxport_span_last_seconds gauge"]
+    lines += [f'tuxport_span_last_seconds{{span="{_escape(n)}"}} {v[3]:.6f}' for n, v in sorted(totals.items())]
+    lines += ["# HELP tuxport_span_errors_total Spans that ended with an exception.",
+              "# TYPE tuxport_span_errors_total counter"]
+    lines += [f'tuxport_span_errors_total{{span="{_escape(n)}"}} {v[2]}' for n, v in sorted(totals.items())]
+    lines += ["# HELP tuxport_metrics_timestamp_seconds When this file was written.",
+              "# TYPE tuxport_metrics_timestamp_seconds gauge",
+              f"tuxport_metrics_timestamp_seconds {time.time():.3f}"]
+    # node_exporter may read at any moment: write beside the target and rename
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(tmp, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
@@ -0,0 +1,208 @@
+# TuxPort - A Windows App Installer for Linux
+# Licensed under the MIT License.
+# © 2025 IRISHDEVELOPERDEV
+# https://github.com/IRISHDEVELOPERDEV/tuxport
+"""Wine runtime manager.
+
+Resolves the Wine binary from ``settings["wine_path"]`` and caches its
+version, keyed on the binary's path and mtime, both in memory and in
+``~/.cache/tuxport/wine.json``, so ``wine --version`` runs once per Wine
+install instead of once per check. ``prewarm()`` starts a persistent
+``wineserver -p`` for a prefix in the background so the first launch into
+it does not pay the server start-up; ``is_warm()`` asks the server's socket
+whether it is still up. Every launch records how long resolving and
+spawning took, and reports both as trace spans.
+"""
+
+import collections
+import json
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+
+from tuxport import trace
+from tuxport.cache import CACHE_DIR
+
+WINE_CACHE = os.path.join(CACHE_DIR, "wine.json")
+VERSION_TIMEOUT = 15
+SERVER_LINGER = 600  # Seconds an app prefix's wineserver stays up after its last program exits
+
+
+class WineNotFound(Exception):
+    pass
+
+
+class WineInfo:
+    def __init__(self, path, version, wineserver):
+        self.path = path
+        self.version = version
+        self.wineserver = wineserver
+
+
+class LaunchTiming:
+    def __init__(self, exe, prefix, resolve_ms, spawn_ms, server_warm):
+        self.exe = exe
+        self.prefix = prefix
+        self.resolve_ms = resolve_ms
+        self.spawn_ms = spawn_ms
+        self.server_warm = server_warm
+        self.started = time.time()
+
+    def __str__(self):
+        warm = "warm" if self.server_warm else "cold"
+        return f"{os.path.basename(self.exe)}: resolve {self.resolve_ms:.1f} ms, spawn {self.spawn_ms:.1f} ms, wineserver {warm}"
+
+
+def default_prefix():
+    return os.environ.get("WINEPREFIX") or os.path.expanduser("~/.wine")
+
+
+def server_socket(prefix):
+    # Wine names the server's directory after the prefix's device and inode
+    st = os.stat(prefix)
+    return os.path.join(f"/tmp/.wine-{os.getuid()}", f"server-{st.st_dev:x}-{st.st_ino:x}", "socket")
+
+
+class WineRuntime:
+    def __init__(self, wine_path="wine", prefix=None, cache_path=WINE_CACHE):
+        self.wine_path = wine_path
+        self.prefix = prefix or default_prefix()
+        self.cache_path = cache_path
+        self.timings = collections.deque(maxlen=100)
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(settings.get("wine_path", "wine"), settings.get("wine_prefix"))
+
+    # --- resolution ---
+    def _binary(self):
+        path = shutil.which(os.path.expanduser(self.wine_path))
+        if not path:
+            raise WineNotFound(f"Wine ('{self.wine_path}') is not installed or not in PATH.")
+        return os.path.realpath(path)
+
+    def _load_disk_cache(self):
+        try:
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_disk_cache(self, data):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp = self.cache_path + ".tmp"
+            with open(tmp, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+    def resolve(self):
+        """Return WineInfo for the configured binary, running ``--version`` only on a cache miss."""
+        path = self._binary()
+        mtime_ns = os.stat(path).st_mtime_ns
+        key = (path, mtime_ns)
+        with self._lock:
+            info = self._resolved.get(key)
+            if info is not None:
+                return info
+            disk = self._load_disk_cache()
+            entry = disk.get(path)
+            if entry and entry.get("mtime_ns") == mtime_ns:
+                version = entry["version"]
+            else:
+                try:
+                    out = subprocess.run([path, "--version"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                         check=True, timeout=VERSION_TIMEOUT, text=True)
+                except (OSError, subprocess.SubprocessError) as e:
+                    raise WineNotFound(f"'{path} --version' failed: {e}")
+                version = out.stdout.strip()
+                disk[path] = {"mtime_ns": mtime_ns, "version": version}
+                self._save_disk_cache(disk)
+            server = os.path.join(os.path.dirname(path), "wineserver")
+            if not os.access(server, os.X_OK):
+                server = shutil.which("wineserver")
+            info = WineInfo(path, version, server)
+            self._resolved = {key: info}
+            return info
+
+    def is_installed(self):
+        try:
+            self.resolve()
+            return True
+        except WineNotFound:
+            return False
+
+    # --- wineserver ---
+    def env(self, prefix=None):
+        env = os.environ.copy()
+        env["WINEPREFIX"] = prefix or self.prefix
+        return env
+
+    def prewarm(self, prefix=None, linger=None):
+        """Start a persistent wineserver for ``prefix`` on a background thread."""
+        thread = threading.Thread(target=self.warm, args=(prefix, linger), name="tuxport-wineserver", daemon=True)
+        thread.start()
+        return thread
+
+    def warm(self, prefix=None, linger=None):
+        """Start a wineserver for ``prefix`` unless one is up; it outlives its last client by
+        ``linger`` seconds, or for good without one. Returns True if a server is running."""
+        prefix = prefix or self.prefix
+        if self.is_warm(prefix):
+            return True
+        try:
+            info = self.resolve()
+        except WineNotFound:
+            return False
+        if not info.wineserver or not os.path.isdir(prefix):
+            return False  # wineboot creates the prefix on the first real launch
+        try:
+            # wineserver daemonizes itself once it is listening
+            subprocess.run([info.wineserver, "-p" if linger is None else f"-p{linger}"], env=self.env(prefix),
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            return False
+        return self.is_warm(prefix)
+
+    def is_warm(self, prefix=None):
+        """True while a wineserver for ``prefix`` answers on its socket."""
+        try:
+            path = server_socket(prefix or self.prefix)
+        except OSError:
+            return False
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.settimeout(1)
+        try:
+            probe.connect(path)
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+
+    # --- launching ---
+    def command(self, exe, args=()):
+        return [self.resolve().path, exe, *args]
+
+    def launch(self, exe, prefix=None, args=(), **popen_kwargs):
+        """Start ``exe`` under Wine without waiting; returns the Popen."""
+        prefix = prefix or self.prefix
+        warm = self.is_warm(prefix)  # Before the program can start a server of its own
+        t0 = time.perf_counter()
+        argv = self.command(exe, args)
+        t1 = time.perf_counter()
+        proc = subprocess.Popen(argv, env=popen_kwargs.pop("env", None) or self.env(prefix), **popen_kwargs)
+        t2 = time.perf_counter()
+        timing = LaunchTiming(exe, prefix, (t1 - t0) * 1000, (t2 - t1) * 1000, warm)
+        trace.record("wine_resolution", timing.resolve_ms, exe=exe)
+        trace.record("process_spawn", timing.spawn_ms, exe=exe, child_pid=proc.pid, server_warm=timing.server_warm)
+        self.timings.append(timing)
+        proc.timing = timing
+        return proc